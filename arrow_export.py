@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+import argparse
+import os
+import sys
+from collections import OrderedDict
+
+import pyarrow
+import pyarrow.parquet
+
+import data_defs
+import extract
+
+HEADER_PREFIX = 'header_'
+
+ARROW_TYPES = {
+    'B':pyarrow.uint8(),
+    'H':pyarrow.uint16(),
+    'I':pyarrow.uint32(),
+    'L':pyarrow.uint32(),
+    }
+
+
+def full_layout(page_class):
+    return data_defs.Layout(page_class(b'\xff' * ((len(page_class.subpages) + 7) // 8)))
+
+def arrow_type(fields):
+    slug_name,name,units,scale,is_string,value_index,count,byte_index,size,param_format = fields[0]
+    if is_string:
+        value_type = pyarrow.string()
+    elif isinstance(scale,float):
+        value_type = pyarrow.float64()
+    elif scale != 1:
+        value_type = pyarrow.int64()
+    else:
+        value_type = ARROW_TYPES[param_format[1]]
+    if count > 1:
+        value_type = pyarrow.list_(value_type,count)
+    if len(fields) > 1:
+        value_type = pyarrow.list_(value_type)
+    return value_type
+
+# One typed column per slug of the page's full layout, with name and units
+# kept as field metadata
+def layout_fields(layout,prefix=''):
+    fields = []
+    for slug_name,slug_fields in layout.fields_by_slug.items():
+        name,units = slug_fields[0][1],slug_fields[0][2]
+        metadata = {'name':name,'units':units}
+        fields.append(pyarrow.field(prefix + slug_name,arrow_type(slug_fields),metadata=metadata))
+    return fields
+
+
+# Turns the Trip or TripTable pages of many messages into Arrow record
+# batches. The schema comes from the page's full bitmask so it is the same
+# for every message; fields a message's bitmask leaves out are null. Each row
+# also carries the Header identifiers of the message it came from.
+class ColumnarWriter(object):
+    def __init__(self,page_class,batch_size=65536):
+        self.page_class = page_class
+        self.batch_size = batch_size
+        self.layout = full_layout(page_class)
+        self.header_layout = full_layout(data_defs.Header)
+        self.schema = pyarrow.schema(
+            [pyarrow.field('source',pyarrow.string()),
+             pyarrow.field('request_code',pyarrow.uint8()),
+             pyarrow.field('page_index',pyarrow.uint16())] +
+            layout_fields(self.header_layout,HEADER_PREFIX) +
+            layout_fields(self.layout))
+        self.clear()
+
+    def clear(self):
+        self.columns = OrderedDict((name,[]) for name in self.schema.names)
+        self.num_rows = 0
+
+    def add_row(self,source,page_type,page_index,page,header):
+        self.columns['source'].append(source)
+        self.columns['request_code'].append(page_type)
+        self.columns['page_index'].append(page_index)
+        for slug_name in self.header_layout.fields_by_slug:
+            value = header.get(slug_name) if header is not None else None
+            self.columns[HEADER_PREFIX + slug_name].append(value)
+        for slug_name in self.layout.fields_by_slug:
+            self.columns[slug_name].append(page.get(slug_name))
+        self.num_rows += 1
+
+    # Adds the matching pages of one message; returns how many were added
+    def add_message(self,message,offset=0,source=None):
+        added = 0
+        for header,page_type,page_index,page in extract.iter_engine_pages(message,offset):
+            if data_defs.request_codes[page_type] is self.page_class:
+                self.add_row(source,page_type,page_index,page,header.page)
+                added += 1
+        return added
+
+    def full(self):
+        return self.num_rows >= self.batch_size
+
+    def record_batch(self):
+        arrays = [pyarrow.array(self.columns[field.name],type=field.type) for field in self.schema]
+        batch = pyarrow.RecordBatch.from_arrays(arrays,schema=self.schema)
+        self.clear()
+        return batch
+
+
+# Written to a temporary file that only replaces destination once every
+# dump has been read, so a dump that fails to decode leaves no partial file
+def write_parquet(paths,destination,page_class,batch_size=65536):
+    writer = ColumnarWriter(page_class,batch_size)
+    temp_path = destination + '.tmp'
+    parquet = pyarrow.parquet.ParquetWriter(temp_path,writer.schema)
+    num_rows = 0
+    try:
+        try:
+            for source,message,offset in extract.iter_messages(paths):
+                num_rows += writer.add_message(message,offset,source)
+                if writer.full():
+                    parquet.write_batch(writer.record_batch())
+            if writer.num_rows:
+                parquet.write_batch(writer.record_batch())
+        finally:
+            parquet.close()
+    except:
+        os.remove(temp_path)
+        raise
+    os.rename(temp_path,destination)
+    return num_rows
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write decoded Trip and TripTable pages to Parquet.")
+    parser.add_argument('paths',nargs='+',help="dump files, directories or glob patterns")
+    parser.add_argument('-o','--output-dir',default='parquet',help="where trips.parquet and trip_tables.parquet go")
+    parser.add_argument('--batch-size',type=int,default=65536,help="rows per record batch")
+    args = parser.parse_args(argv)
+
+    paths = extract.find_dumps(args.paths)
+    if not paths:
+        parser.error("no dump files found")
+    if not os.path.isdir(args.output_dir):
+        os.makedirs(args.output_dir)
+    for page_class,name in ((data_defs.Trip,'trips.parquet'),(data_defs.TripTable,'trip_tables.parquet')):
+        destination = os.path.join(args.output_dir,name)
+        num_rows = write_parquet(paths,destination,page_class,args.batch_size)
+        print("%s: %d rows" % (destination,num_rows))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python
+import argparse
+import hashlib
+import sys
+from collections import OrderedDict,namedtuple
+
+import numpy
+
+import data_defs
+import extract
+
+# TripTable subpages that are really 2-D histograms: each parameter is one
+# row band, its 10 values the column bands. Rows and columns are labelled
+# from the band limits in these ConfigurationData subpages.
+MATRICES = OrderedDict([
+    ('speed_by_rpm',('TimeInRoadSpeedEngineRPMBandsSubPage','RPMBandLimitsSubPage','SpeedBandLimitsSubPage')),
+    ('load_by_rpm',('TimeInEngineLoadEngineRPMBandsSubPage','RPMBandLimitsSubPage','LoadBandLimitsSubPage')),
+    ])
+
+# A decoded band matrix with a label per row and column band
+BandMatrix = namedtuple('BandMatrix',('name','values','row_labels','column_labels'))
+
+
+def subpage_slugs(schema,page_name,subpage_name):
+    for name,repeat,params in schema.tables[page_name]:
+        if name == subpage_name:
+            return [data_defs.slug_for(param[0]) for param in params]
+    raise KeyError("no %s in %s" % (subpage_name,page_name))
+
+# name -> (row slugs, row band limit slugs, column band limit slugs)
+def matrix_slugs(schema=None):
+    schema = data_defs.get_schema(schema)
+    return OrderedDict((name,(subpage_slugs(schema,'TripTable',table),
+                              subpage_slugs(schema,'ConfigurationData',row_limits),
+                              subpage_slugs(schema,'ConfigurationData',column_limits)))
+                       for name,(table,row_limits,column_limits) in MATRICES.items())
+
+# n limits bound n+1 bands: below the first, between each pair, and from
+# the last up. Without (all of) the limits the bands are just numbered.
+def band_labels(limits,num_bands):
+    if limits is None or len(limits) != num_bands - 1 or numpy.isnan(numpy.asarray(limits,dtype=float)).any():
+        return ['band %d' % (i + 1) for i in range(num_bands)]
+    limits = ['%.3g' % limit for limit in limits]
+    return ['<%s' % limits[0]] + ['%s-%s' % pair for pair in zip(limits,limits[1:])] + ['%s+' % limits[-1]]
+
+# {name: array of (instances, row bands, column bands)} from the arrays
+# Layout.get_arrays gives for a TripTable page. Matrices whose subpage the
+# page's bitmask leaves out are missing.
+def page_matrices(arrays,schema=None):
+    matrices = OrderedDict()
+    for name,(row_slugs,row_limits,column_limits) in matrix_slugs(schema).items():
+        if all(slug_name in arrays for slug_name in row_slugs):
+            matrices[name] = numpy.stack([arrays[slug_name] for slug_name in row_slugs],axis=1)
+    return matrices
+
+# Labelled band matrices of every TripTable page instance in the message,
+# as a list of {name: BandMatrix} per instance. limits are the band limits
+# of the engine's ConfigurationData page, as returned by config_limits.
+def band_matrices(message,offset=0,limits=None,schema=None,units=None):
+    schema = data_defs.get_schema(schema)
+    slugs = matrix_slugs(schema)
+    trip_codes = [code for code,page_name in schema.codes.items() if page_name == 'TripTable']
+    instances = []
+    for page_type,page_name,arrays in data_defs.iter_page_arrays(message,offset,schema,units,trip_codes):
+        matrices = page_matrices(arrays,schema)
+        for i in range(len(arrays[next(iter(arrays))]) if arrays else 0):
+            instance = OrderedDict()
+            for name,values in matrices.items():
+                row_slugs,row_limits,column_limits = slugs[name]
+                instance[name] = BandMatrix(name,values[i],
+                                            band_labels(limits and limits.get(name,(None,None))[0],values.shape[1]),
+                                            band_labels(limits and limits.get(name,(None,None))[1],values.shape[2]))
+            instances.append(instance)
+    return instances
+
+# {matrix name: (row band limits, column band limits)} from a
+# ConfigurationData page (a LazyPage); limits it doesn't hold are NaN
+def config_limits(page,schema=None):
+    limits = OrderedDict()
+    for name,(row_slugs,row_limits,column_limits) in matrix_slugs(schema).items():
+        limits[name] = tuple([page[slug_name] if slug_name in page else numpy.nan for slug_name in slugs]
+                             for slugs in (row_limits,column_limits))
+    return limits
+
+
+# Band matrices of the TripTable pages of many extractions, stacked into one
+# 3-D array per matrix with a trip along the first axis, for fleet wide sums
+# and comparisons. Each trip is matched with the band limits from the latest
+# ConfigurationData page seen for its engine, and those are stacked as well,
+# since engines can be configured differently. ECMs hand back the same trip
+# tables on every pull until they change, so a table is only kept the first
+# time it is seen for its engine and request code.
+class TripTables(object):
+    def __init__(self,units=None,schema=None):
+        self.units = units
+        self.schema = data_defs.get_schema(schema)
+        self.slugs = matrix_slugs(self.schema)
+        self.trip_codes = tuple(sorted(code for code,page_name in self.schema.codes.items() if page_name == 'TripTable'))
+        self.keys = set()
+        self.parts = OrderedDict((name,[]) for name in ('serial','request_code','extraction_time'))
+        for name in self.slugs:
+            self.parts[name] = []
+        self.limits = {}
+
+    def add_message(self,message,offset=0):
+        header = extract.NO_HEADER
+        for header,page_type,page_index,page in extract.iter_engine_pages(message,offset,self.schema,self.units):
+            if self.schema.request_codes[page_type] is self.schema.pages['ConfigurationData']:
+                extract.keep_latest(self.limits,header.serial,header.extraction_time,config_limits(page,self.schema))
+        serial,extraction_time = header.serial,header.extraction_time
+        added = 0
+        for page_type,page_name,arrays in data_defs.iter_page_arrays(message,offset,self.schema,self.units,
+                                                                     self.trip_codes):
+            matrices = page_matrices(arrays,self.schema)
+            if len(matrices) != len(self.slugs):
+                continue
+            for i in range(len(matrices[next(iter(matrices))])):
+                digest = hashlib.sha1(b''.join(values[i].tobytes() for values in matrices.values())).hexdigest()
+                key = (serial,page_type,digest)
+                if key in self.keys:
+                    continue
+                self.keys.add(key)
+                self.parts['serial'].append(serial)
+                self.parts['request_code'].append(page_type)
+                self.parts['extraction_time'].append(extraction_time)
+                for name,values in matrices.items():
+                    self.parts[name].append(values[i])
+                added += 1
+        return added
+
+    def add_paths(self,paths):
+        added = 0
+        for source,message,offset in extract.iter_messages(paths):
+            added += self.add_message(message,offset)
+        return added
+
+    # {name: array}: serial, request_code and extraction_time per trip, each
+    # matrix as (trips, row bands, column bands), and each matrix's band
+    # limits as name_row_limits and name_column_limits, (trips, limits)
+    def arrays(self):
+        arrays = OrderedDict()
+        arrays['serial'] = numpy.array(self.parts['serial'],dtype=object)
+        arrays['request_code'] = numpy.array(self.parts['request_code'],dtype=int)
+        arrays['extraction_time'] = numpy.array([numpy.nan if t is None else t for t in self.parts['extraction_time']])
+        for name,(row_slugs,row_limits,column_limits) in self.slugs.items():
+            parts = self.parts[name]
+            arrays[name] = numpy.array(parts) if parts else numpy.zeros((0,len(row_slugs),len(column_limits) + 1),dtype=numpy.uint32)
+            for side,slugs,index in (('row',row_limits,0),('column',column_limits,1)):
+                missing = [numpy.nan] * len(slugs)
+                arrays['%s_%s_limits' % (name,side)] = numpy.array(
+                    [self.limits[serial][1][name][index] if serial in self.limits else missing
+                     for serial in self.parts['serial']],dtype=float).reshape(-1,len(slugs))
+        return arrays
+
+    # Each matrix summed over the trips selected by mask (all by default),
+    # labelled from the first selected trip's limits if every selected trip
+    # shares them, numbered otherwise
+    def totals(self,arrays=None,mask=None):
+        if arrays is None:
+            arrays = self.arrays()
+        if mask is None:
+            mask = numpy.ones(len(arrays['serial']),dtype=bool)
+        totals = OrderedDict()
+        for name in self.slugs:
+            values = arrays[name][mask].sum(axis=0,dtype=numpy.uint64)
+            labels = []
+            for side in ('row','column'):
+                limits = arrays['%s_%s_limits' % (name,side)][mask]
+                shared = len(limits) and (limits == limits[0]).all()
+                labels.append(band_labels(limits[0] if shared else None,values.shape[len(labels)]))
+            totals[name] = BandMatrix(name,values,labels[0],labels[1])
+        return totals
+
+
+def format_matrix(matrix):
+    width = max([len(label) for label in matrix.column_labels] + [len('%d' % value) for value in matrix.values.flat])
+    label_width = max(len(label) for label in matrix.row_labels)
+    lines = [' ' * label_width + ' ' + ' '.join(label.rjust(width) for label in matrix.column_labels)]
+    for label,row in zip(matrix.row_labels,matrix.values):
+        lines.append(label.rjust(label_width) + ' ' + ' '.join(('%d' % value).rjust(width) for value in row))
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fleet totals of the TripTable band matrices in DDEC extraction dumps.")
+    parser.add_argument('paths',nargs='+',help="dump files, directories or glob patterns")
+    parser.add_argument('--serial',help="only trips of this engine")
+    parser.add_argument('--units',choices=sorted(data_defs.UNIT_SYSTEMS),help="convert band limits")
+    args = parser.parse_args(argv)
+
+    paths = extract.find_dumps(args.paths)
+    if not paths:
+        parser.error("no dump files found")
+    trip_tables = TripTables(args.units)
+    trip_tables.add_paths(paths)
+    arrays = trip_tables.arrays()
+    mask = None
+    if args.serial:
+        mask = arrays['serial'] == args.serial
+    totals = trip_tables.totals(arrays,mask)
+    print("%d trip tables from %d engines" % (len(arrays['serial']) if mask is None else mask.sum(),
+                                             len(set(arrays['serial'] if mask is None else arrays['serial'][mask]))))
+    for name,matrix in totals.items():
+        print("\n%s (rows: RPM bands)" % name)
+        print(format_matrix(matrix))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
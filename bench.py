@@ -0,0 +1,212 @@
+#!/usr/bin/env python
+import argparse
+import base64
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from collections import OrderedDict
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+import data_defs
+import synthetic
+
+timer = getattr(time,'perf_counter',time.time)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DUMP_FIXTURE = os.path.join(HERE,'ddec1587-ft-lauderdale.json')
+RAW_FIXTURE = os.path.join(HERE,'hard-brake.bin')
+
+# One representative request code per DataPage in request_codes
+PAGE_TYPES = OrderedDict([
+    ('Trip',1),
+    ('Incident',2),
+    ('ConfigurationData',6),
+    ('Header',10),
+    ('TripTable',12),
+    ('DetailedAlert',15),
+    ('EngineUsage',16),
+    ('Permanent',20),
+    ])
+
+
+# A single-page message of synthetic instances
+def build_message(page_type,bitmask,instances=1,seed=0):
+    generator = synthetic.Generator(seed,1)
+    layout = data_defs.get_layout(page_type,bitmask)
+    extraction_time = generator.times[generator.serials[0]]
+    page = data_defs.encode_page(page_type,bitmask,[generator.instance(layout,extraction_time) for i in range(instances)])
+    return data_defs.encode_message([page])
+
+def load_fixtures():
+    fixtures = []
+    with open(DUMP_FIXTURE) as f:
+        dump = json.load(f,object_pairs_hook=OrderedDict)
+    for key,value in dump.items():
+        fixtures.append(('dump: %s' % key,base64.b64decode(value)))
+    with open(RAW_FIXTURE,'rb') as f:
+        fixtures.append(('raw: hard-brake.bin',f.read()))
+    for name,page_type in PAGE_TYPES.items():
+        page_class = data_defs.request_codes[page_type]
+        for sparse in (False,True):
+            bitmask = synthetic.bitmask_for(page_class,sparse)
+            label = 'synthetic: %s %s' % (name,'sparse' if sparse else 'full')
+            fixtures.append((label,build_message(page_type,bitmask)))
+    return fixtures
+
+def describe(message):
+    codes = []
+    for page_type,page_index,page in data_defs.iter_pages(message,lazy=True):
+        if page_type not in codes:
+            codes.append(page_type)
+    return codes
+
+def decode(message,mode):
+    if mode == 'lazy':
+        return data_defs.parse_message(message,lazy=True)
+    if mode == 'columnar':
+        return data_defs.parse_message(message,columnar=True)
+    if mode == 'compact':
+        return data_defs.parse_message(message,compact=True)
+    if mode == 'arrays':
+        return list(data_defs.iter_page_arrays(message))
+    return data_defs.parse_message(message)
+
+# Best of `repeat` timing runs, each long enough to last min_time seconds
+def time_decode(message,mode,min_time,repeat):
+    loops = 1
+    while True:
+        start = timer()
+        for i in range(loops):
+            decode(message,mode)
+        elapsed = timer() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2
+    best = elapsed / loops
+    for run in range(repeat - 1):
+        start = timer()
+        for i in range(loops):
+            decode(message,mode)
+        best = min(best,(timer() - start) / loops)
+    return best
+
+# Blocks and bytes still held by one decoded message, plus the peak while decoding
+def measure_allocations(message,mode):
+    if tracemalloc is None:
+        return None
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        if hasattr(tracemalloc,'reset_peak'):
+            tracemalloc.reset_peak()
+        result = decode(message,mode)
+        after = tracemalloc.take_snapshot()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    ignore = [tracemalloc.Filter(False,tracemalloc.__file__)]
+    diff = after.filter_traces(ignore).compare_to(before.filter_traces(ignore),'filename')
+    del result
+    return {
+        'alloc_blocks':sum(stat.count_diff for stat in diff),
+        'alloc_bytes':sum(stat.size_diff for stat in diff),
+        'peak_bytes':peak,
+        }
+
+def run(modes,min_time,repeat):
+    results = []
+    for label,message in load_fixtures():
+        num_pages = len(data_defs.parse_message(message,lazy=True))
+        for mode in modes:
+            if mode in ('columnar','arrays') and data_defs.get_numpy() is None:
+                continue
+            seconds = time_decode(message,mode,min_time,repeat)
+            result = OrderedDict([
+                ('fixture',label),
+                ('request_codes',describe(message)),
+                ('mode',mode),
+                ('message_bytes',len(message)),
+                ('pages',num_pages),
+                ('messages_per_sec',1.0 / seconds),
+                ('bytes_per_sec',len(message) / seconds),
+                ('pages_per_sec',num_pages / seconds),
+                ])
+            allocations = measure_allocations(message,mode)
+            if allocations is not None:
+                result.update(allocations)
+            results.append(result)
+            print("%-40s %-8s %10.0f msg/s %12.0f B/s %8s blocks" % (
+                label,mode,result['messages_per_sec'],result['bytes_per_sec'],result.get('alloc_blocks','-')))
+    return results
+
+COLD_START = '''
+import sys,time
+timer = getattr(time,'perf_counter',time.time)
+start = timer()
+import data_defs
+imported = timer()
+data_defs.parse_message(open(sys.argv[1],'rb').read())
+print('%r %r' % (imported-start,timer()-start))
+'''
+
+# Median import time and import-to-first-decoded-page time of a fresh interpreter
+def cold_start(runs):
+    imports = []
+    first_pages = []
+    for i in range(runs):
+        output = subprocess.check_output([sys.executable,'-c',COLD_START,RAW_FIXTURE],cwd=HERE)
+        imported,first_page = output.split()
+        imports.append(float(imported))
+        first_pages.append(float(first_page))
+    imports.sort()
+    first_pages.sort()
+    return OrderedDict([('import_seconds',imports[runs // 2]),('first_page_seconds',first_pages[runs // 2])])
+
+def compare(results,baseline_path):
+    with open(baseline_path) as f:
+        baseline = dict(((r['fixture'],r['mode']),r) for r in json.load(f)['results'])
+    print("\nchange vs %s (messages/sec)" % baseline_path)
+    for result in results:
+        old = baseline.get((result['fixture'],result['mode']))
+        if old:
+            print("%-40s %-8s %+7.1f%%" % (result['fixture'],result['mode'],
+                                         100.0 * (result['messages_per_sec'] / old['messages_per_sec'] - 1)))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark decoding of every request_codes page type.")
+    parser.add_argument('-o','--output',default='bench_results.json',help="where results are written as JSON")
+    parser.add_argument('--modes',default='eager,lazy,columnar,compact,arrays',help="comma separated decode modes")
+    parser.add_argument('--min-time',type=float,default=0.2,help="minimum seconds per timing run")
+    parser.add_argument('--repeat',type=int,default=3,help="timing runs per fixture, best is kept")
+    parser.add_argument('--compare',metavar='RESULTS',help="earlier results file to compare against")
+    parser.add_argument('--cold-start-runs',type=int,default=5,help="fresh interpreters to time import and first decode")
+    args = parser.parse_args(argv)
+
+    results = run(args.modes.split(','),args.min_time,args.repeat)
+    report = OrderedDict([
+        ('python',platform.python_version()),
+        ('implementation',platform.python_implementation()),
+        ('machine',platform.machine()),
+        ('timestamp',time.strftime('%Y-%m-%dT%H:%M:%S')),
+        ])
+    if args.cold_start_runs > 0:
+        report['cold_start'] = cold_start(args.cold_start_runs)
+        print("cold start: import %(import_seconds).4fs, first decoded page %(first_page_seconds).4fs" % report['cold_start'])
+    report['results'] = results
+    with open(args.output,'w') as f:
+        json.dump(report,f,indent=2)
+    print("wrote %s" % args.output)
+    if args.compare:
+        compare(results,args.compare)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
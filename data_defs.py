@@ -1,43 +1,313 @@
 import struct
 from utils import bit_at_index
-import sys
 import string
+import threading
+import time
+from collections import OrderedDict,namedtuple
 
 try:
-    # Try from django's slugify first
-    from django.utils.text import slugify as django_slugify
-    slugify = lambda slug: re.sub('[-]', '_', django_slugify(slug))
+    text_type = unicode
+except NameError:
+    text_type = str
+
+try:
+    from slugs import SLUGS
 except ImportError:
-    # Then use awesome-slugify
-    from slugify import Slugify
-    slugify = Slugify(to_lower=True, separator='_')
+    SLUGS = {}
 
+# Slugs for every name in this file are precomputed in slugs.py (regenerate
+# it with make_slugs.py), so slugify and numpy are only imported the first
+# time something actually needs them.
+_slugify = None
 
-def parse_message(message):
-    num_pages = ord(message[2])
-    index = 4
-    pages = []
+def slugify(text):
+    global _slugify
+    if _slugify is None:
+        try:
+            # Try from django's slugify first
+            import re
+            from django.utils.text import slugify as django_slugify
+            _slugify = lambda slug: re.sub('[-]', '_', django_slugify(slug))
+        except ImportError:
+            # Then use awesome-slugify
+            from slugify import Slugify
+            _slugify = Slugify(to_lower=True, separator='_')
+    return _slugify(text)
+
+def slug_for(name):
+    try:
+        return SLUGS[name]
+    except KeyError:
+        return slugify(text_type(name))
+
+numpy = None
+_numpy_missing = False
+
+# Only needed for columnar decoding of repeated sample blocks
+def get_numpy():
+    global numpy,_numpy_missing
+    if numpy is None and not _numpy_missing:
+        try:
+            import numpy as numpy_module
+            numpy = numpy_module
+        except ImportError:
+            _numpy_missing = True
+    return numpy
+
+timer = getattr(time,'perf_counter',time.time)
+
+
+# message can be any buffer (bytes, bytearray, memoryview, mmap); pages are
+# decoded in place from offset onwards without slicing out copies.
+def parse_message(message,offset=0,columnar=False,lazy=False,stats=None,compact=False,keep_bytes=False,schema=None,
+                  units=None,errors=None):
+    return [page for page_type,page_index,page in iter_pages(message,offset,columnar,lazy,stats,compact,keep_bytes,schema,
+                                                             units,errors)]
+
+# Yields (request code, page index, page) for each page instance as soon as
+# it has been framed, so callers can stream pages out of a long message.
+#
+# A page that can't be framed (unknown request code, size that isn't a whole
+# number of instances, running past the end of the buffer) raises, with a
+# PageError where the framing itself is wrong. Passing a list as errors turns
+# on resilient decoding: such a page is skipped and a PageError for it
+# appended to the list, and decoding picks up again at the next page header,
+# page_size_plus_bitmask bytes on. Only when that header can't be found
+# either does decoding of the message stop.
+def iter_pages(message,offset=0,columnar=False,lazy=False,stats=None,compact=False,keep_bytes=False,schema=None,
+               units=None,errors=None):
+    if stats is not None:
+        stats.messages += 1
+        start = timer()
+    try:
+        num_pages = struct.unpack_from('B',message,offset+2)[0]
+    except struct.error as e:
+        if errors is None:
+            raise
+        errors.append(PageError.wrap(e,offset))
+        return
+    index = offset+4
     for i in range(num_pages):
-        page_type = ord(message[index])
-        page_size_plus_bitmask = struct.unpack('<H',message[index+2:index+4])[0]
-        bitmask_len = ord(message[index+4])
-        bitmask_bytes = message[index+5:index+5+bitmask_len]
-        this_page = request_codes[page_type](bitmask_bytes)
-        page_size = page_size_plus_bitmask - bitmask_len - 1
+        page_type = page_size_plus_bitmask = None
         try:
-            assert(page_size % len(this_page) == 0)
-        except:
-            print("Expected some multiple of %d, got %d" % (page_size,len(this_page)))
-            sys.exit()
-        page_index = 0
-        for i in range(page_size / len(this_page)):
-            base_index = index+5+bitmask_len+page_index
-            pages.append(this_page.get_data(message[base_index:base_index+len(this_page)]))
-            page_index += len(this_page)
+            page_type,page_size_plus_bitmask,bitmask_len = struct.unpack_from('<BxHB',message,index)
+            bitmask_bytes = get_bytes(message,index+5,index+5+bitmask_len)
+            if stats is not None:
+                stats.add_time(page_type,'framing',timer()-start)
+                start = timer()
+            this_page = get_layout(page_type,bitmask_bytes,schema,units)
+            if stats is not None:
+                stats.add_time(page_type,'layout',timer()-start)
+            page_len = len(this_page)
+            page_size = page_size_plus_bitmask - bitmask_len - 1
+            if index+4+page_size_plus_bitmask > len(message):
+                raise PageError("page runs %d bytes past the end of the message"
+                                % (index+4+page_size_plus_bitmask-len(message)),index,page_type,i)
+            if page_len == 0 or page_size % page_len != 0:
+                raise PageError("page size %d is not a multiple of %d" % (page_size,page_len),index,page_type,i)
+        except Exception as e:
+            if errors is None:
+                raise
+            errors.append(PageError.wrap(e,index,page_type,i))
+            if page_size_plus_bitmask is None or index+4+page_size_plus_bitmask+5 > len(message):
+                return
+            index += 4+page_size_plus_bitmask
+            if stats is not None:
+                start = timer()
+            continue
+        base_index = index+5+bitmask_len
+        for page_index in range(page_size // page_len):
+            if stats is not None:
+                start = timer()
+            if lazy:
+                page = LazyPage(this_page,message,base_index)
+            elif compact:
+                page = this_page.get_records(message,base_index,keep_bytes)
+            else:
+                page = this_page.get_data(message,base_index,columnar,stats,page_type)
+            if stats is not None:
+                stats.add_page(page_type,page_len,timer()-start)
+            yield page_type,page_index,page
+            base_index += page_len
 
         index += 4+page_size_plus_bitmask
+        if stats is not None:
+            start = timer()
+
 
-    return pages
+# Every page of the message as numpy arrays, all instances of a page decoded
+# and scaled together by Layout.get_arrays. Yields (request code, page name,
+# arrays) per page, or only for pages of the given request codes.
+def iter_page_arrays(message,offset=0,schema=None,units=None,request_codes=None):
+    num_pages = struct.unpack_from('B',message,offset+2)[0]
+    index = offset+4
+    for i in range(num_pages):
+        page_type,page_size_plus_bitmask,bitmask_len = struct.unpack_from('<BxHB',message,index)
+        if request_codes is not None and page_type not in request_codes:
+            index += 4+page_size_plus_bitmask
+            continue
+        layout = get_layout(page_type,get_bytes(message,index+5,index+5+bitmask_len),schema,units)
+        page_size = page_size_plus_bitmask - bitmask_len - 1
+        if len(layout) == 0 or page_size % len(layout) != 0:
+            raise PageError("page size %d is not a multiple of %d" % (page_size,len(layout)),index,page_type,i)
+        yield page_type,layout.name,layout.get_arrays(message,index+5+bitmask_len,page_size // len(layout))
+        index += 4+page_size_plus_bitmask
+
+# A page resilient decoding skipped: why, where its header starts in the
+# buffer, its request code if the header could be read, and which of the
+# message's pages it was
+class PageError(Exception):
+    def __init__(self,reason,offset=None,page_type=None,page_number=None):
+        Exception.__init__(self,reason)
+        self.reason = reason
+        self.offset = offset
+        self.page_type = page_type
+        self.page_number = page_number
+
+    @classmethod
+    def wrap(cls,error,offset,page_type=None,page_number=None):
+        if isinstance(error,PageError):
+            reason = error.reason
+        else:
+            reason = "%s: %s" % (error.__class__.__name__,error)
+        return cls(reason,offset,page_type,page_number)
+
+    def as_dict(self):
+        return OrderedDict([
+            ('reason',self.reason),
+            ('offset',self.offset),
+            ('page_type',self.page_type),
+            ('page_number',self.page_number),
+            ])
+
+    def __str__(self):
+        return "page %s (request code %s) at offset %s: %s" % (self.page_number,self.page_type,self.offset,self.reason)
+
+# A framed page of request code page_type holding the given instances, each
+# either a {slug: value} dict for Layout.pack or the packed bytes of one
+def encode_page(page_type,bitmask,instances,schema=None,units=None):
+    layout = get_layout(page_type,bitmask,schema,units)
+    payload = []
+    for instance in instances:
+        if not isinstance(instance,(bytes,bytearray)):
+            instance = layout.pack(instance)
+        elif len(instance) != len(layout):
+            raise ValueError("%s instances are %d bytes, got %d" % (layout.name,len(layout),len(instance)))
+        payload.append(bytes(instance))
+    payload = b''.join(payload)
+    page_size_plus_bitmask = len(bitmask)+1+len(payload)
+    if page_size_plus_bitmask > 0xffff:
+        raise ValueError("%d bytes of %s instances don't fit in one page" % (len(payload),layout.name))
+    return struct.pack('<BxHB',page_type,page_size_plus_bitmask,len(bitmask)) + bytes(bitmask) + payload
+
+# A message framed the way the ECM sends one, from pages made by encode_page.
+# The two bytes after the last page aren't decoded, so any will do.
+def encode_message(pages,trailer=b'\0\0'):
+    if len(pages) > 0xff:
+        raise ValueError("a message holds at most 255 pages, got %d" % len(pages))
+    return struct.pack('BBBB',0x80,0,len(pages),4) + b''.join(pages) + trailer
+
+# Total length in bytes of the message at offset, including the two bytes
+# that follow its last page, so back-to-back messages can be walked
+def message_length(message,offset=0):
+    num_pages = struct.unpack_from('B',message,offset+2)[0]
+    index = offset+4
+    for i in range(num_pages):
+        index += 4+struct.unpack_from('<H',message,index+2)[0]
+    return index+2-offset
+
+
+# Collects where parse_message spends its time. Stage times (framing, layout,
+# unpack, output) and page/byte counts are kept per request code, and subpage
+# decode times per (page name, subpage slug). If a callback is given it is
+# also called as callback(stage, key, seconds) for every measurement, with
+# key being the request code, or the (page name, subpage slug) pair for the
+# 'subpage' stage.
+class ParseStats(object):
+    def __init__(self,callback=None):
+        self.callback = callback
+        self.messages = 0
+        self.times = {}
+        self.pages = {}
+        self.bytes = {}
+        self.page_times = {}
+        self.subpage_times = {}
+
+    def add_time(self,page_type,stage,seconds):
+        key = (page_type,stage)
+        self.times[key] = self.times.get(key,0) + seconds
+        if self.callback is not None:
+            self.callback(stage,page_type,seconds)
+
+    def add_page(self,page_type,num_bytes,seconds):
+        self.pages[page_type] = self.pages.get(page_type,0) + 1
+        self.bytes[page_type] = self.bytes.get(page_type,0) + num_bytes
+        self.page_times[page_type] = self.page_times.get(page_type,0) + seconds
+        if self.callback is not None:
+            self.callback('page',page_type,seconds)
+
+    def add_subpage(self,page_name,slug_name,seconds):
+        key = (page_name,slug_name)
+        self.subpage_times[key] = self.subpage_times.get(key,0) + seconds
+        if self.callback is not None:
+            self.callback('subpage',key,seconds)
+
+    def stage_times(self):
+        totals = {}
+        for (page_type,stage),seconds in self.times.items():
+            totals[stage] = totals.get(stage,0) + seconds
+        return totals
+
+    def merge(self,other):
+        self.messages += other.messages
+        for mine,theirs in ((self.times,other.times),(self.pages,other.pages),(self.bytes,other.bytes),
+                            (self.page_times,other.page_times),(self.subpage_times,other.subpage_times)):
+            for key,value in theirs.items():
+                mine[key] = mine.get(key,0) + value
+
+    def summary(self):
+        lines = ["%d messages" % self.messages]
+        for stage,seconds in sorted(self.stage_times().items()):
+            lines.append("  %-10s %10.6fs" % (stage,seconds))
+        lines.append("request code    pages      bytes    seconds")
+        for page_type in sorted(self.pages):
+            lines.append("%12d %8d %10d %10.6f" % (page_type,self.pages[page_type],self.bytes[page_type],
+                                                   self.page_times[page_type]))
+        slowest = sorted(self.subpage_times.items(),key=lambda item: -item[1])
+        for (page_name,slug_name),seconds in slowest[:10]:
+            lines.append("  %s.%s %.6fs" % (page_name,slug_name,seconds))
+        return '\n'.join(lines)
+
+
+# Compiled layouts are keyed by (schema version, page type, bitmask, unit
+# system) and kept in a bounded LRU, since a fleet only ever produces a few hundred distinct
+# combinations.
+# Once built, a Layout only fills in idempotent memos (dtypes, record
+# classes), so only the cache itself needs the lock.
+LAYOUT_CACHE_SIZE = 512
+_layout_cache = OrderedDict()
+_layout_cache_lock = threading.Lock()
+
+def get_layout(page_type,bitmask_bytes,schema=None,units=None):
+    schema = get_schema(schema)
+    key = (schema.version,page_type,bitmask_bytes,units)
+    with _layout_cache_lock:
+        layout = _layout_cache.pop(key,None)
+        if layout is not None:
+            _layout_cache[key] = layout
+            return layout
+    layout = Layout(schema.request_codes[page_type](bitmask_bytes),units)
+    with _layout_cache_lock:
+        while len(_layout_cache) >= LAYOUT_CACHE_SIZE:
+            _layout_cache.popitem(last=False)
+        _layout_cache[key] = layout
+    return layout
+
+def get_bytes(byte_list,start,end):
+    chunk = byte_list[start:end]
+    if isinstance(chunk,memoryview):
+        return chunk.tobytes()
+    return bytes(chunk)
         
 
 
@@ -50,11 +320,9 @@ class Parameter(object):
     scale = 1
     units = 'Units'
     repeat = 1
-    _data = None
-    _bytes = None
 
     def __init__(self,*args,**kwargs):
-        for k,v in kwargs.iteritems():
+        for k,v in kwargs.items():
             assert(k in self.__class__.__allowed)
             setattr(self,k,v)
 
@@ -62,52 +330,47 @@ class Parameter(object):
         try:
             return struct.calcsize(self.format)*self.repeat
         except:
-            print("format error in class %s. format is: %s" % (self.__class__.__name__,self.format))
-            sys.exit()
+            print("format error in %s. format is: %s" % (self.name,self.format))
+            raise
 
-    def get_data(self,byte_list):
-        assert(len(byte_list) == len(self))
+    def get_data(self,byte_list,offset=0):
+        assert(offset+len(self) <= len(byte_list))
         try:
-            this_data = map(lambda x: x*self.scale,struct.unpack(self.format*self.repeat,byte_list))
+            this_data = [x*self.scale for x in struct.unpack_from(self.format*self.repeat,byte_list,offset)]
         except:
             print("Format: %s, Byte_list: %s, Class: %s" % (self.format*self.repeat,repr(byte_list),self.__class__.__name__))
+            raise
         if len(this_data) == 1:
             this_data = this_data[0]
-        self._data = this_data
-        self._bytes = byte_list
         return this_data
 
-    @property
-    def data(self):
-        if self._data is None or self._bytes is None:
-            return None
+    # Parameter instances are shared by every SubPage that lists them, so the
+    # decoded value is handed back rather than stored on the instance.
+    def get_value_data(self,byte_list,offset=0):
+        this_data = self.get_data(byte_list,offset)
         value_data = {
             'name':self.name,
             'units':self.units,
-            'bytes':self._bytes,
+            'bytes':get_bytes(byte_list,offset,offset+len(self)),
             }
-        if not type(self._data) == list:
-            value_data.update({'value':repr(self._data)})
+        if not type(this_data) == list:
+            value_data.update({'value':repr(this_data)})
         else:
-            value_data.update({'values':map(repr,self._data)})
+            value_data.update({'values':[repr(x) for x in this_data]})
         return {self.slug_name : value_data}
             
 
     @property
     def slug_name(self):
-        if hasattr(self,"_slug_name"):
-            return self._slug_name
-        else:
-            self._slug_name = slugify(unicode(self.name))
-            return self._slug_name
+        return slug_for(self.name)
 
 class SubPage():
    name = "foodongs"
-   __allowed = ('param_list','repeat')
+   __allowed = ('name','param_list','repeat')
    repeat = 1
    def __init__(self,*args,**kwargs):
        self.name = self.__class__.__name__
-       for k,v in kwargs.iteritems():
+       for k,v in kwargs.items():
            assert(k in self.__class__.__allowed)
            setattr(self,k,v)
            
@@ -116,21 +379,16 @@ class SubPage():
 
    @property
    def slug_name(self):
-       if hasattr(self,"_slug_name"):
-           return self._slug_name
-       else:
-           self._slug_name = slugify(unicode(self.name))
-           return self._slug_name
+       return slug_for(self.name)
 
 
-   def get_data(self,byte_list):
-       index = 0
+   def get_data(self,byte_list,offset=0):
+       index = offset
        data_elts = []
        for i in range(self.repeat):
            params = []
            for param in self.param_list:
-               param.get_data(byte_list[index:index+len(param)])
-               params.append(param.data)
+               params.append(param.get_value_data(byte_list,index))
                index += len(param)
            if len(params) == 1:
                data_elts.append(params[0])
@@ -146,6 +404,7 @@ class SubPage():
 class DataPage(object):
     subpages = []
     def __init__(self,bitmask):
+        self.bitmask = bitmask
         bitmask_bytes = struct.unpack('B'*len(bitmask),bitmask)
         self.pages_to_render = []
         for i in range(len(bitmask_bytes)):
@@ -156,11 +415,15 @@ class DataPage(object):
     def __len__(self):
         return sum(map(len,self.pages_to_render))
 
-    def get_data(self,byte_list):
-        index = 0
+    def get_data(self,byte_list,offset=0,stats=None):
+        index = offset
         data_elts = []
         for subpage in self.pages_to_render:
-            page_data = subpage.get_data(byte_list[index:index+len(subpage)])
+            if stats is not None:
+                start = timer()
+            page_data = subpage.get_data(byte_list,index)
+            if stats is not None:
+                stats.add_subpage(self.__class__.__name__,subpage.slug_name,timer()-start)
             if type(page_data) == list and len(page_data) == 1:
                 data_elts.append(page_data[0])
             else:
@@ -172,2059 +435,921 @@ class DataPage(object):
 
 
 
-class LongParameter(Parameter):
-    format = "I"
-
-class ShortParameter(Parameter):
-    format = "H"
+NUMPY_CODES = {'B':'u1','H':'<u2','I':'<u4','L':'<u4'}
+
+MPH = 1.609344
+GALLON = 3.785411784
+
+# Unit systems other than the ECM's own, as {ECM units: (units, factor)}.
+# Only conversions that are a plain factor are listed (not degrees F), so
+# every field keeps a single multiplier: its scale times the factor.
+UNIT_SYSTEMS = {
+    'metric':{
+        'MPH':('km/h',MPH),
+        'mph':('km/h',MPH),
+        'MPH/S':('km/h/s',MPH),
+        'mph/s':('km/h/s',MPH),
+        'Miles':('km',MPH),
+        'Gallons':('L',GALLON),
+        'gallons':('L',GALLON),
+        'MPG':('km/L',MPH / GALLON),
+        'RPM/MPH':('RPM/(km/h)',1 / MPH),
+        'PSI':('kPa',6.894757293168361),
+        },
+    }
+
+# The units and multiplier a parameter is decoded with in a unit system
+def converted(param,units=None):
+    if isinstance(param,StringParameter):
+        return param.units,1
+    if units is None:
+        return param.units,param.scale
+    param_units,factor = UNIT_SYSTEMS[units].get(param.units,(param.units,1))
+    if factor == 1:
+        return param_units,param.scale
+    return param_units,param.scale*factor
+
+# A DataPage flattened into a single struct.Struct. Offsets, scales and output
+# keys for every field are worked out once, so decoding a page is one unpack
+# plus building the same output DataPage.get_data would. With a unit system,
+# each field's conversion is folded into its scale here too.
+class Layout(object):
+    def __init__(self,data_page,units=None):
+        formats = []
+        self.name = data_page.__class__.__name__
+        self.units = units
+        self.bitmask = data_page.bitmask
+        self.subpages = []
+        self.subpage_list = list(data_page.pages_to_render)
+        self.record_classes = {}
+        self.dtypes = {}
+        self.fields_by_slug = OrderedDict()
+        value_index = 0
+        byte_index = 0
+        for subpage in data_page.pages_to_render:
+            columns = self.get_columns(subpage,byte_index)
+            repeats = []
+            for i in range(subpage.repeat):
+                fields = []
+                for param in subpage.param_list:
+                    size = len(param)
+                    if isinstance(param,StringParameter):
+                        param_format = '%ds' % size
+                        count = 1
+                        is_string = True
+                    else:
+                        param_format = param.format.lstrip('<@=') * param.repeat
+                        count = len(struct.unpack('<'+param_format,b'\0'*size))
+                        is_string = False
+                    formats.append(param_format)
+                    param_units,scale = converted(param,units)
+                    field = (param.slug_name,param.name,param_units,scale,
+                             is_string,value_index,count,byte_index,size,'<'+param_format)
+                    fields.append(field)
+                    self.fields_by_slug.setdefault(param.slug_name,[]).append(field)
+                    value_index += count
+                    byte_index += size
+                repeats.append(fields)
+            self.subpages.append((subpage.slug_name,repeats,columns))
+        self.struct = struct.Struct('<'+''.join(formats))
+        assert(self.struct.size == len(data_page))
 
-class StringParameter():
-    length = 10
-    units = "string"
-    
     def __len__(self):
-        return self.length
-
-    def get_data(self,byte_list):
-        try:
-            assert(len(byte_list) == len(self))
-        except AssertionError:
-            print("StringParameter needed byte string of length %d, got length %d" % (len(self),len(byte_list)))
-        self._data = ''.join(x for x in byte_list if x in string.printable)
-        self._bytes = byte_list
-        return ''.join(x for x in byte_list if x in string.printable)
+        return self.struct.size
 
-    @property
-    def data(self):
-        if not self._data or not self._bytes:
+    # Repeated all-numeric subpages (the LastStop/HardBrake sample blocks) are
+    # fixed-stride arrays, so they can be viewed as a structured dtype. The
+    # dtype itself is only made (and numpy imported) on first columnar use.
+    def get_columns(self,subpage,byte_index):
+        if subpage.repeat == 1:
             return None
+        names = []
+        formats = []
+        offsets = []
+        fields = []
+        sample_index = 0
+        for param in subpage.param_list:
+            codes = param.format.lstrip('<@=')
+            if isinstance(param,StringParameter) or len(set(codes)) != 1 or codes[0] not in NUMPY_CODES:
+                return None
+            count = len(codes) * param.repeat
+            names.append(param.slug_name)
+            formats.append((NUMPY_CODES[codes[0]],(count,)) if count > 1 else NUMPY_CODES[codes[0]])
+            offsets.append(sample_index)
+            param_units,scale = converted(param,self.units)
+            fields.append((param.slug_name,param.name,param_units,scale))
+            sample_index += len(param)
+        dtype_spec = {'names':names,'formats':formats,'offsets':offsets,'itemsize':sample_index}
+        return (byte_index,subpage.repeat,dtype_spec,fields)
+
+    def get_data(self,byte_list,offset=0,columnar=False,stats=None,page_type=None):
+        if stats is not None:
+            start = timer()
+        values = self.struct.unpack_from(byte_list,offset)
+        if stats is not None:
+            stats.add_time(page_type,'unpack',timer()-start)
+            output_start = timer()
+        data_elts = []
+        for slug_name,repeats,columns in self.subpages:
+            if stats is not None:
+                start = timer()
+            if columnar and columns is not None and get_numpy() is not None:
+                data_elts.append({slug_name:self.column_data(byte_list,offset,columns)})
+                if stats is not None:
+                    stats.add_subpage(self.name,slug_name,timer()-start)
+                continue
+            subpage_elts = []
+            for fields in repeats:
+                params = [self.field_data(values,byte_list,offset,field) for field in fields]
+                if len(params) == 1:
+                    subpage_elts.append(params[0])
+                else:
+                    subpage_elts.append(params)
+
+                if type(subpage_elts) == list and len(subpage_elts) == 1:
+                    subpage_elts = subpage_elts[0]
+            data_elts.append({slug_name:subpage_elts})
+            if stats is not None:
+                stats.add_subpage(self.name,slug_name,timer()-start)
+        if stats is not None:
+            stats.add_time(page_type,'output',timer()-output_start)
+        return data_elts
+
+    def column_data(self,byte_list,offset,columns):
+        byte_index,repeat,dtype_spec,fields = columns
+        dtype = self.dtypes.get(byte_index)
+        if dtype is None:
+            dtype = self.dtypes[byte_index] = numpy.dtype(dtype_spec)
+        samples = numpy.frombuffer(byte_list,dtype=dtype,count=repeat,offset=offset+byte_index)
+        column_elts = {}
+        for slug_name,name,units,scale in fields:
+            # Unscaled columns would otherwise be views that pin the buffer
+            column = samples[slug_name] * scale if scale != 1 else samples[slug_name].copy()
+            column_elts[slug_name] = {
+                'name':name,
+                'units':units,
+                'values':column,
+                }
+        return column_elts
+
+    # count back-to-back instances of the page decoded in one go, as
+    # {slug: array} with a row per instance. All of a slug's fields share a
+    # multiplier, so each slug is scaled with a single multiply, and stays
+    # integer when the multiplier is 1. A slug held more than once (the
+    # per-sample channels) gets a column per occurrence; strings are left as
+    # raw byte strings. Occurrences that are evenly spaced, as those of a
+    # repeated subpage are, are read as one strided view of the buffer.
+    def get_arrays(self,byte_list,offset=0,count=1):
+        if get_numpy() is None:
+            raise ImportError("Layout.get_arrays needs numpy")
+        # Both memos go in under one key, so a thread never sees one without
+        # the other
+        memo = self.dtypes.get('page')
+        if memo is None:
+            memo = self.dtypes['page'] = (numpy.dtype(self.page_dtype_spec()),self.strided_slugs())
+        dtype,strides = memo
+        rows = numpy.frombuffer(byte_list,dtype=dtype,count=count,offset=offset)
+        arrays = OrderedDict()
+        for slug_name,fields in self.fields_by_slug.items():
+            if len(fields) == 1:
+                column = rows['f%d' % fields[0][5]]
+            elif slug_name in strides:
+                field_dtype,stride = strides[slug_name]
+                column = numpy.ndarray((count,len(fields)),field_dtype,byte_list,offset+fields[0][7],(len(self),stride))
+            else:
+                column = numpy.stack([rows['f%d' % field[5]] for field in fields],axis=1)
+            scale = fields[0][3]
+            if isinstance(scale,float):
+                column = column * scale
+            elif scale != 1:
+                # Integer scales could overflow the narrow ECM types
+                column = column.astype(numpy.int64) * scale
+            elif len(fields) == 1 or slug_name in strides:
+                column = column.copy()
+            arrays[slug_name] = column
+        return arrays
+
+    # {slug: (dtype, stride)} for the slugs held more than once as single
+    # numbers spaced evenly through the page
+    def strided_slugs(self):
+        strides = {}
+        for slug_name,fields in self.fields_by_slug.items():
+            if len(fields) < 2 or any(field[4] or field[6] != 1 for field in fields):
+                continue
+            codes = set(field[9].lstrip('<') for field in fields)
+            gaps = set(b[7] - a[7] for a,b in zip(fields,fields[1:]))
+            if len(codes) == 1 and len(gaps) == 1 and list(codes)[0] in NUMPY_CODES:
+                strides[slug_name] = (numpy.dtype(NUMPY_CODES[list(codes)[0]]),gaps.pop())
+        return strides
+
+    def page_dtype_spec(self):
+        names = []
+        formats = []
+        offsets = []
+        for fields in self.fields_by_slug.values():
+            for slug_name,name,units,scale,is_string,value_index,count,byte_index,size,param_format in fields:
+                codes = param_format.lstrip('<')
+                if is_string:
+                    formats.append('S%d' % size)
+                elif len(set(codes)) == 1 and codes[0] in NUMPY_CODES:
+                    formats.append((NUMPY_CODES[codes[0]],(count,)) if count > 1 else NUMPY_CODES[codes[0]])
+                else:
+                    raise ValueError("no numpy type for %s (%s)" % (name,param_format))
+                names.append('f%d' % value_index)
+                offsets.append(byte_index)
+        return {'names':names,'formats':formats,'offsets':offsets,'itemsize':len(self)}
+
+    def field_data(self,values,byte_list,offset,field):
+        slug_name,name,units,scale,is_string,value_index,count,byte_index,size,param_format = field
+        if is_string:
+            value = printable(values[value_index])
+            if not value or not size:
+                return None
+            this_data = repr(value)
+        elif count == 1:
+            this_data = repr(values[value_index]*scale)
+        else:
+            this_data = [repr(x*scale) for x in values[value_index:value_index+count]]
+        start = offset+byte_index
+        raw = byte_list[start:start+size]
+        if not isinstance(raw,bytes):
+            raw = get_bytes(byte_list,start,start+size)
         value_data = {
-            'name':self.name,
-            'units':self.units,
-            'bytes':self._bytes,
+            'name':name,
+            'units':units,
+            'bytes':raw,
             }
-        if not type(self._data) == list:
-            value_data.update({'value':repr(self._data)})
+        if count == 1:
+            value_data.update({'value':this_data})
         else:
-            value_data.update({'values':map(repr,self._data)})
-        return {self.slug_name : value_data}
-            
-
-    @property
-    def slug_name(self):
-        if hasattr(self,"_slug_name"):
-            return self._slug_name
+            value_data.update({'values':this_data})
+        return {slug_name : value_data}
+
+
+    # Compact output: one record per subpage (a list of them for repeated
+    # subpages) holding native values, with names and units on the class
+    def get_records(self,byte_list,offset=0,keep_bytes=False):
+        values = self.struct.unpack_from(byte_list,offset)
+        record_classes = self.record_classes.get(keep_bytes)
+        if record_classes is None:
+            record_classes = [record_class(self.name,subpage,keep_bytes,self.units) for subpage in self.subpage_list]
+            self.record_classes[keep_bytes] = record_classes
+        records = []
+        for (slug_name,repeats,columns),this_class in zip(self.subpages,record_classes):
+            subpage_records = []
+            for fields in repeats:
+                row = [native_value(values,field) for field in fields]
+                if keep_bytes:
+                    start = offset+fields[0][7]
+                    end = offset+fields[-1][7]+fields[-1][8]
+                    row.append(get_bytes(byte_list,start,end))
+                subpage_records.append(this_class._make(row))
+            if len(subpage_records) == 1:
+                records.append(subpage_records[0])
+            else:
+                records.append(subpage_records)
+        return records
+
+    # One page instance from {slug: value}, the other way round from
+    # LazyPage: values are native and scaled, a slug held more than once
+    # takes a list in page order, and slugs left out are zero (or empty)
+    def pack(self,values=()):
+        raw = [b'' if field[4] else 0 for fields in self.fields_by_slug.values() for field in fields
+               for i in range(field[6])]
+        for slug_name,value in dict(values).items():
+            fields = self.fields_by_slug[slug_name]
+            if len(fields) == 1:
+                value = [value]
+            elif len(value) != len(fields):
+                raise ValueError("%s is held %d times in %s, got %d values" % (slug_name,len(fields),self.name,len(value)))
+            for field,field_value in zip(fields,value):
+                slug_name,name,units,scale,is_string,value_index,count,byte_index,size,param_format = field
+                if is_string:
+                    if isinstance(field_value,text_type):
+                        field_value = field_value.encode('ascii')
+                    raw[value_index] = field_value
+                elif count == 1:
+                    raw[value_index] = raw_value(field_value,scale)
+                else:
+                    if len(field_value) != count:
+                        raise ValueError("%s takes %d values, got %d" % (slug_name,count,len(field_value)))
+                    raw[value_index:value_index+count] = [raw_value(x,scale) for x in field_value]
+        return self.struct.pack(*raw)
+
+    # Unpacks one field on its own, as a native value rather than a repr
+    def get_value(self,byte_list,offset,field):
+        slug_name,name,units,scale,is_string,value_index,count,byte_index,size,param_format = field
+        values = struct.unpack_from(param_format,byte_list,offset+byte_index)
+        if is_string:
+            return printable(values[0])
+        if count == 1:
+            return values[0]*scale
+        return [x*scale for x in values]
+
+
+def raw_value(value,scale):
+    if scale == 1:
+        return int(value)
+    return int(round(value / float(scale)))
+
+def native_value(values,field):
+    slug_name,name,units,scale,is_string,value_index,count,byte_index,size,param_format = field
+    if is_string:
+        return printable(values[value_index])
+    if count == 1:
+        return values[value_index]*scale
+    return tuple(x*scale for x in values[value_index:value_index+count])
+
+
+# Base for the compact per-subpage records. Each subpage gets one namedtuple
+# subclass, made once and shared, which doubles as the schema catalog: the
+# field slugs, and their names and units, live on the class, not the records.
+class Record(tuple):
+    __slots__ = ()
+    page = None
+    subpage = None
+    names = {}
+    units = {}
+
+    def describe(self):
+        return [(slug_name,self.names.get(slug_name),self.units.get(slug_name),value)
+                for slug_name,value in zip(self._fields,self)]
+
+record_catalog = {}
+_record_catalog_lock = threading.Lock()
+
+def record_class(page_name,subpage,keep_bytes=False,units=None):
+    key = (page_name,subpage,keep_bytes,units)
+    with _record_catalog_lock:
+        if key in record_catalog:
+            return record_catalog[key]
+        fields = [param.slug_name for param in subpage.param_list]
+        if keep_bytes:
+            fields.append('raw_bytes')
+        base = namedtuple(str(subpage.name),fields,rename=True)
+        record_catalog[key] = type(str(subpage.name),(base,Record),{
+            '__slots__':(),
+            'page':page_name,
+            'subpage':subpage.slug_name,
+            'names':dict((param.slug_name,param.name) for param in subpage.param_list),
+            'units':dict((param.slug_name,converted(param,units)[0]) for param in subpage.param_list),
+            })
+        return record_catalog[key]
+
+
+# A page that keeps the buffer and its compiled Layout and only unpacks a field
+# the first time it is read, by slug. A slug that occurs more than once in the
+# page (per-sample channels, repeated timestamps) reads as a list in page order.
+class LazyPage(object):
+    def __init__(self,layout,byte_list,offset=0):
+        self.layout = layout
+        self.byte_list = byte_list
+        self.offset = offset
+        self._values = {}
+
+    def __getitem__(self,slug_name):
+        try:
+            return self._values[slug_name]
+        except KeyError:
+            pass
+        fields = self.layout.fields_by_slug[slug_name]
+        if len(fields) == 1:
+            value = self.layout.get_value(self.byte_list,self.offset,fields[0])
         else:
-            self._slug_name = slugify(unicode(self.name))
-            return self._slug_name
-
-
-##############################
-# Incident data parameters   #
-##############################
-
-class EngineHours(LongParameter):
-    name = "Engine Hours"
-    scale = .05
-    units = "Hours"
-
-class Odometer(LongParameter):
-    name = "Incident Odometer"
-    scale = 0.1
-    units = "Miles"
-
-class RoadSpeed(Parameter):
-    name = "Road Speed"
-    scale = 0.5
-    units = "MPH"
-
-class EngineSpeed(ShortParameter):
-    name = "Engine Speed"
-    scale = 0.25
-    units = "RPM"
-
-class PercentLoad(Parameter):
-    name = "Engine Load"
-    scale = 0.5
-    units = "% load"
-
-class PercentThrottle(Parameter):
-    name = "Throttle"
-    scale = 0.4
-    units = "% throttle"
-
-class CruiseMode(Parameter):
-    name = "Cruise Mode"
-
-class SampleCount(Parameter):
-    name = "Valid Sample Count"
-    units = "Samples"
-
-class Timestamp(LongParameter):
-    name = "Timestamp"
-
-class IncidentTimestamp(Timestamp):
-    name = "Incident Timestamp"
-
-#############################
-# Trip parameters           #
-#############################
+            value = [self.layout.get_value(self.byte_list,self.offset,field) for field in fields]
+        self._values[slug_name] = value
+        return value
 
-class TripDistance(Odometer):
-    name = "Trip Distance"
+    def __contains__(self,slug_name):
+        return slug_name in self.layout.fields_by_slug
 
-class TripFuel(LongParameter):
-    scale = 0.125
-    name = "Trip Fuel"
-    units = "Gallons"
+    # The bytes of this one page instance, without the page framing
+    def raw_bytes(self):
+        return get_bytes(self.byte_list,self.offset,self.offset+len(self.layout))
 
-class TripTime(LongParameter):
-    name = "Trip Time"
-    units = "Seconds"
+    def __iter__(self):
+        return iter(self.layout.fields_by_slug)
 
-class DriveDistance(Odometer):
-    name = "Drive Distance"
-
-class DriveFuel(TripFuel):
-    name = "Drive Fuel"
-
-class DriveTime(TripTime):
-    name = "Drive Time"
-
-class CruiseDistance(Odometer):
-    name = "Cruise Distance"
-
-class CruiseFuel(TripFuel):
-    name = "Cruise Fuel"
-
-class CruiseTime(TripTime):
-    name = "Cruise Time"
-
-class TopGearDistance(Odometer):
-    name = "Top Gear Distance"
-
-class TopGearFuel(TripFuel):
-    name = "Top Gear Fuel"
-
-class TopGearTime(TripTime):
-    name = "Top Gear Time"
-
-class IdleFuel(TripFuel):
-    name = "Idle Fuel"
-
-class IdleTime(TripTime):
-    name = "Idle Time"
-
-class VSGPTOFuel(TripFuel):
-    name = "VSG (PTO) Fuel"
-
-class VSGPTOTime(TripTime):
-    name = "VSG (PTO) Time"
-
-class VSGPTOIdleFuel(TripFuel):
-    name = "VSG (PTO) Idle Fuel"
-    
-class VSGPTOIdleTime(TripTime):
-    name = "VSG (PTO) Idle Time"
-
-class OverSpeedATime(TripTime):
-    name = "Overspeed A Time"
-
-class OverSpeedBTime(TripTime):
-    name = "Overspeed B Time"
-
-class OverRevTime(TripTime):
-    name = "Over Rev Time"
-    
-class CoastTime(TripTime):
-    name = "Coast Time"
-
-class PeakRoadSpeed(RoadSpeed):
-    name = "Peak Road Speed"
-
-class PeakEngineSpeed(EngineSpeed):
-    name = "Peak Engine Speed"
-
-class InterruptNumber(ShortParameter):
-    name = "Number of Power Interrupts"
-    units = "Count"
-
-class InterruptHours(EngineHours):
-    name = "Engine Hours of Last Interrupt"
-
-class InterruptDuration(LongParameter):
-    name = "Duration of Last Interrupt"
-    scale = 4
-    units = "Minutes"
-
-class TimeoutCount(ShortParameter):
-    name = "Number of J1587 Timeouts"
-    units = "Count"
-
-class TimeoutHours(EngineHours):
-    name = "Engine Hours of Last Timeout"
-
-class TimeoutDuration(LongParameter):
-    name = "Duration of Last Timeout"
-    units = "Seconds"
-
-class DriveLoadAccumulation(LongParameter):
-    name = "Drive Engine Load Accumulation"
-    scale = 0.5
-    units = "Sum %load / sec"
-
-class HardBrakeCount(ShortParameter):
-    name = "Hard Brake Count"
-    units = "Count"
-
-class DriverIncidentCount(ShortParameter):
-    name = "Driver Incident Count"
-    units = "Count"
-
-class FutureHardBrakeIndex(Parameter):
-    name = "Index for Future Hard Brake in Queue"
-    units = "Index"
-
-class FutureDriverIncidentIndex(Parameter):
-    name = "Index for Future Driver Incident in Queue"
-    units = "Index"
-
-class TripArmedTime(LongParameter):
-    name = "Trip Armed Time"
-    units = "Seconds"
-
-class TripRunTime(LongParameter):
-    name = "Trip Run Time"
-    units = "Seconds"
-
-class StartOptimisedIdleFuelValue(ShortParameter):
-    name = "Start Optimized Idle Fuel Value"
-    scale = 0.25
-    units = "Gallons"
-
-class TripIdleTimeSaved(LongParameter):
-    name = "Trip Idle Time Saved"
-    units = "Minutes"
-
-class TotalIdleTimeSaved(LongParameter):
-    name = "Total Idle Time Saved"
-    units = "Minutes"
-
-class TripIdleFuelSaved(ShortParameter):
-    name = "Trip Idle Fuel Saved"
-    scale = 0.25
-    units = "Gallons"
-
-class TotalIdleFuelSaved(ShortParameter):
-    name = "Total Idle Fuel Saved"
-    scale = 0.25
-    units = "Gallons"
-
-class TotalArmedTime(LongParameter):
-    name = "Total Armed Time"
-    units = "Seconds"
-
-class TotalRunTime(LongParameter):
-    name = "Total Run Time"
-    units = "Seconds"
-
-class BatteryTime(LongParameter):
-    name = "Battery Time"
-    units = "Seconds"
-
-class TopGearRatio(Parameter):
-    name = "Top Gear Ratio"
-    units = "RPM/MPH"
-
-class TopGearTimeStamp(LongParameter):
-    name = "Top Gear Time Stamp"
-    units = "Timestamp"
-
-class TopGear1Distance(LongParameter):
-    name = "Top Gear 1 Distance"
-    scale = 0.1
-    units = "Miles"
-
-class TopGear1Fuel(LongParameter):
-    name = "Top Gear 1 Fuel"
-    scale = 0.125
-    units = "Gallons"
-
-class TopGear1Time(LongParameter):
-    name = "Top Gear 1 Time"
-    units = "Seconds"
-
-class TopGear1Ratio(Parameter):
-    name = "Top Gear 1 Ratio"
-    units = "RPM/MPH"
-
-class TopGear1TimeStamp(LongParameter):
-    name = "Top Gear 1 Time Stamp"
-    units = "Timestamp"
-
-class TopGearCruiseDistance(LongParameter):
-    name = "Top Gear Cruise Distance"
-    scale = 0.1
-    units = "Miles"
-
-class TopGearCruiseFuel(LongParameter):
-    name = "Top Gear Cruise Fuel"
-    scale = 0.125
-    units = "Gallons"
-
-class TopGearCruiseTime(LongParameter):
-    name = "Top Gear Cruise Time"
-    units = "Seconds"
-
-class RSGDistance(LongParameter):
-    name = "RSG Distance"
-    scale = 0.1
-    units = "Miles"
-
-class RSGFuel(LongParameter):
-    name = "RSG Fuel"
-    scale = 0.125
-    units = "Gallons"
-
-class RSGTime(LongParameter):
-    name = "RSG Time"
-    units = "Seconds"
-
-class StopIdleFuel(LongParameter):
-    name = "Stop Idle Fuel"
-    scale = 0.125
-    units = "Gallons"
-
-class StopIdleTime(LongParameter):
-    name = "Stop Idle Time"
-    units = "Seconds"
-
-class PumpDistance(LongParameter):
-    name = "Pump Distance"
-    scale = 0.1
-    units = "Miles"
-
-class PumpFuel(LongParameter):
-    name = "Pump Fuel"
-    scale = 0.125
-    units = "Gallons"
-
-class PumpTime(LongParameter):
-    name = "Pump Time"
-    units = "Seconds"
-
-class JakeBrakeTime(LongParameter):
-    name = "Jake Brake Time"
-    units = "Seconds"
-
-class FanTimeEngine(LongParameter):
-    name = "Fan Time (Engine)"
-    units = "Seconds"
-
-class FanTimeManual(FanTimeEngine):
-    name = "Fan Time (Manual)"
-
-class FanTimeAirConditioning(FanTimeEngine):
-    name = "Fan Time (AC)"
-
-class FanTimeDPF(FanTimeEngine):
-    name = "Fan Time (DPF)"
-
-class OptimisedIdleArmedTime(LongParameter):
-    name = "Armed Time"
-    units = "Seconds"
-
-class OptimisedIdleRunTime(LongParameter):
-    name = "Run Time"
-    units = "Seconds"
-
-class OptimisedIdleBatteryTime2(LongParameter):
-    name = "Battery Time 2"
-    units = "Seconds"
-
-class OptimisedIdleEngineTempTime(LongParameter):
-    name = "Engine Temp. Time"
-    units = "Seconds"
-
-class OptimisedIdleThermostatTime(LongParameter):
-    name = "Thermostat Time"
-    units = "Seconds"
-
-class OptimisedIdleExtendedIdleTime(LongParameter):
-    name = "Extended Idle Time"
-    units = "Seconds"
-
-class OptimisedIdleContinuousTime(LongParameter):
-    name = "Contiuous Time"
-    units = "Seconds"
-    
-class PeakRoadSpeedTimeStamp(LongParameter):
-    name = "Peak Road Speed Time Stamp"
-    units = "Timestamp"
-
-class PeakEngineRPMTimeStamp(LongParameter):
-    name = "Peak Engine RPM Time Stamp"
-    units = "Timestamp"
-
-class TripStartTimeStamp(LongParameter):
-    name = "Trip Start Time Stamp"
-    units = "Timestamp"
-
-class TripStartOdometer(LongParameter):
-    name = "Trip Start Odometer"
-    units = "Miles"
-
-class CountOverSpeedACount(ShortParameter):
-    name = "Over Speed A Count"
-    units = "Count"
-
-class CountOverSpeedBCount(ShortParameter):
-    name = "Over Speed B Count"
-    units = "Count"
-
-class CountOverRevCount(ShortParameter):
-    name = "Over Rev Count"
-    units = "Count"
-
-class CountBrakeCount(LongParameter):
-    name = "Brake Count"
-    units = "Count"
-
-class CountHardBrakeCount(ShortParameter):
-    name = "Hard Brake Count 2"
-    units = "Count"
-
-class CountFirmBrakeCount(ShortParameter):
-    name = "Firm Brake Count"
-    units = "Count"
-
-class BVEBrakingVelocityEnergy(LongParameter):
-    name = "Braking Velocity Energy"
-    units = "Sum energy"
-
-class BVECrankshaftRevolutions(LongParameter):
-    name = "Crank Shaft Revolutions"
-    units = "Revolutions"
-
-class AlertCount(ShortParameter):
-    name = "Alert Count"
-    units = "Count"
-
-class DriveAverageLoadFactor(Parameter):
-    name = "Drive Average Load Factor"
-    units = "% max load"
-
-class OICBatteryStartsNormal(ShortParameter):
-    name = "Battery starts - normal"
-    units = "Count"
-
-class OICBatteryStartsAlternative(ShortParameter):
-    name = "Battery starts - alternative"
-    units = "Count"
-
-class OICBatteryStartsContinuousRun(ShortParameter):
-    name = "Battery starts - continuous run"
-    units = "Count"
-
-class DPFRSParkedRegenAttempts(ShortParameter):
-    name = "Parked DPF regeneration attempts"
-    units = "Count"
-
-class DPFRSDrivingRegenAttempts(ShortParameter):
-    name = "Driving DPF regeneration attempts"
-    units = "Count"
-
-class DPFRSParkedRegenCompletions(ShortParameter):
-    name = "Parked DPF regeneration completions"
-    units = "Count"
-
-class DPFRSDrivingRegenCompletions(ShortParameter):
-    name = "Driving DPF regeneration completions"
-    units = "Count"
-
-class DPFRSParkedDPFFuelVolume(LongParameter):
-    name = "Parked DPF Fuel Volume"
-    scale = 0.0004882813
-    units = "Gallons"
-
-class DPFRSAutomaticDPFFuelVolume(DPFRSParkedDPFFuelVolume):
-    name = "Automatic DPF Fuel Volume"
-
-class DPFRSRegenerationTime(LongParameter):
-    name = "DPF Regeneration Time"
-    units = "Timestamp"
-
-class PCCDistance(LongParameter):
-    name = "Predictive Cruise Distance"
-    scale = 0.1
-    units = "Miles"
-
-class PCCFuel(LongParameter):
-    name = "Predictive Cruise Fuel"
-    scale = 0.00048828125
-    units = "Gallons"
-
-class PCCTime(LongParameter):
-    name = "Predictive Cruise Time"
-    units = "Seconds"
-    
-
-##############################
-# TripTable Parameters       #
-##############################
-
-class BrakeCounts(LongParameter):
-    name = "Brake Counts for Speed Bands"
-    repeat = 10
-
-class HBCHardBrakeCounts(ShortParameter):
-    name = "Hard Brake Counts for Speed Bands"
-    repeat = 10
-
-class HBCFirmBrakeCounts(ShortParameter):
-    name = "Firm Brake Counts for Speed Bands"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsRPMBand1(LongParameter):
-    name = "Time in Speed Bands when in RPM Band 1"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsRPMBand2(LongParameter):
-    name = "Time in Speed Bands when in RPM Band 2"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsRPMBand3(LongParameter):
-    name = "Time in Speed Bands when in RPM Band 3"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsRPMBand4(LongParameter):
-    name = "Time in Speed Bands when in RPM Band 4"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsRPMBand5(LongParameter):
-    name = "Time in Speed Bands when in RPM Band 5"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsRPMBand6(LongParameter):
-    name = "Time in Speed Bands when in RPM Band 6"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsRPMBand7(LongParameter):
-    name = "Time in Speed Bands when in RPM Band 7"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsRPMBand8(LongParameter):
-    name = "Time in Speed Bands when in RPM Band 8"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsRPMBand9(LongParameter):
-    name = "Time in Speed Bands when in RPM Band 9"
-    repeat = 10
-
-class TIRSERBTimeInSpeedBandsOverRev(LongParameter):
-    name = "Time in Speed Bands when in Over Rev"
-    repeat = 10
-
-class TIELRBRPMBand1(LongParameter):
-    name = "Time in Load Bands when in RPM Band 1"
-    repeat = 10
-
-class TIELRBRPMBand2(LongParameter):
-    name = "Time in Load Bands when in RPM Band 2"
-    repeat = 10
-
-class TIELRBRPMBand3(LongParameter):
-    name = "Time in Load Bands when in RPM Band 3"
-    repeat = 10
-
-class TIELRBRPMBand4(LongParameter):
-    name = "Time in Load Bands when in RPM Band 4"
-    repeat = 10
-
-class TIELRBRPMBand5(LongParameter):
-    name = "Time in Load Bands when in RPM Band 5"
-    repeat = 10
-
-class TIELRBRPMBand6(LongParameter):
-    name = "Time in Load Bands when in RPM Band 6"
-    repeat = 10
-
-class TIELRBRPMBand7(LongParameter):
-    name = "Time in Load Bands when in RPM Band 7"
-    repeat = 10
-
-class TIELRBRPMBand8(LongParameter):
-    name = "Time in Load Bands when in RPM Band 8"
-    repeat = 10
-
-class TIELRBRPMBand9(LongParameter):
-    name = "Time in Load Bands when in RPM Band 9"
-    repeat = 10
-
-class TIELRBOverRev(LongParameter):
-    name = "Time in Load Bands when in Over Rev"
-    repeat = 10
+    def __len__(self):
+        return len(self.layout.fields_by_slug)
 
-class TimeInAutomaticOverSpeedBands(LongParameter):
-    name = "Time in Automatic Over Speed Bands"
-    repeat = 10
+    def keys(self):
+        return list(self.layout.fields_by_slug)
 
-class TimeInAutomaticEngineOverRevBands(LongParameter):
-    name = "Time in Automatic Engine Over Rev Bands"
-    repeat = 10
+    def get(self,slug_name,default=None):
+        if slug_name not in self.layout.fields_by_slug:
+            return default
+        return self[slug_name]
 
-################################
-# ConfigurationData Parameters #
-################################
+    # The same output parse_message gives without lazy=True
+    def get_data(self,columnar=False):
+        return self.layout.get_data(self.byte_list,self.offset,columnar)
 
-class FleetIdleGoalPercentage(Parameter):
-    name = "Fleet Idle Goal Percentage"
-    units = "% max fleet idle goal"
 
-class FuelEconomyGoal(ShortParameter):
-    name = "Fuel Economy Goal"
-    scale = 0.01
-    units = "MPG"
-
-class OverRevLimitA(ShortParameter):
-    name = "Over Rev Limit A"
-    scale = 0.25
-    units = "RPM"
+class LongParameter(Parameter):
+    format = "I"
 
-class OverSpeedALimit(Parameter):
-    name = "Over Speed A Limit"
-    units = "MPH"
+class ShortParameter(Parameter):
+    format = "H"
 
-class OverSpeedBLimit(Parameter):
-    name = "Over Speed B Limit"
-    units = "MPH"
+_unprintable = bytes(bytearray(c for c in range(256) if chr(c) not in string.printable))
 
-class Password(StringParameter):
-    name = "Password"
-    length = 6
+def printable(byte_list):
+    value = byte_list.translate(None,_unprintable)
+    if not isinstance(value,str):
+        value = value.decode('ascii')
+    return value
 
-class DriverIdentifier(StringParameter):
-    name = "Driver Identifier"
-    length = 10
+class StringParameter():
+    __allowed = ('length','name','units')
 
-class VehicleIdentifier(StringParameter):
-    name = "Vehicle Identifier"
     length = 10
+    units = "string"
 
-class CurrentOdometer(Odometer):
-    name = "Current Odometer"
-
-class HardBrakeDecelLimit(Parameter):
-    name = "Hard Brake Deceleration Limit"
-    units = "MPH/S"
-
-class IdleTimeLimitStop(Parameter):
-    name = "Idle Time Limit (Stop)"
-    units = "Minutes"
-
-class AlarmState(Parameter):
-    name = "Alarm State"
-
-class DayIntensity(Parameter):
-    name = "Day Intensity"
-
-class NightIntensity(Parameter):
-    name = "Night Intensity"
-
-class Units(Parameter):
-    name = "Units"
-
-class Language(Parameter):
-    name = "Language"
-
-class DataHubDeviceMID(Parameter):#value is an enum
-    name = "Data Hub Device MID"
-
-class DataEntryRangeType(Parameter):#enum
-    name = "Data Entry Range Type"
-
-class AccessType(Parameter):#enum
-    name = "Acess Type"
-
-class PromptedDriverID(Parameter):#enum
-    name = "Prompted Driver ID"
-
-class MPGAdjustment(Parameter):
-    name = "MPG Adjustment"
-    scale = 0.01
-
-class SoftwareVersion(StringParameter):
-    name = "Software Version"
-    length = 5
-
-class ECMType(Parameter):#enum
-    name = "ECM Type"
-    units = "mph"
-
-class SpeedBandLimit1(Parameter):
-    name = "Speed Band 1 Limit"
-    units = "mph"
-
-class SpeedBandLimit2(Parameter):
-    name = "SpeedBand 2 Limit"
-    units = "mph"
-
-class SpeedBandLimit3(Parameter):
-    name = "SpeedBand 3 Limit"
-    units = "mph"
-
-class SpeedBandLimit4(Parameter):
-    name = "SpeedBand 4 Limit"
-    units = "mph"
-
-class SpeedBandLimit5(Parameter):
-    name = "SpeedBand 5 Limit"
-    units = "mph"
-
-class SpeedBandLimit6(Parameter):
-    name = "SpeedBand 6 Limit"
-    units = "mph"
-
-class SpeedBandLimit7(Parameter):
-    name = "SpeedBand 7 Limit"
-    units = "mph"
-
-class SpeedBandLimitA(Parameter):
-    name = "SpeedBand A Limit"
-    units = "mph"
-
-class SpeedBandLimitB(Parameter):
-    name = "SpeedBand B Limit"
-    units = "mph"
-
-class RPMBandLimit1(Parameter):
-    name = "RPM Band 1 Limit"
-    units = "RPM"
-
-class RPMBandLimit2(Parameter):
-    name = "RPM Band 2 Limit"
-    units = "RPM"
-
-class RPMBandLimit3(Parameter):
-    name = "RPM Band 3 Limit"
-    units = "RPM"
-
-class RPMBandLimit4(Parameter):
-    name = "RPM Band 4 Limit"
-    units = "RPM"
-
-class RPMBandLimit5(Parameter):
-    name = "RPM Band 5 Limit"
-    units = "RPM"
-
-class RPMBandLimit6(Parameter):
-    name = "RPM Band 6 Limit"
-    units = "RPM"
-
-class RPMBandLimit7(Parameter):
-    name = "RPM Band 7 Limit"
-    units = "RPM"
-
-class RPMBandLimit8(Parameter):
-    name = "RPM Band 8 Limit"
-    units = "RPM"
-
-class RPMBandLimitOverRev(Parameter):
-    name = "Over Rev Limit"
-    units = "RPM"
-
-class LoadBandLimit(Parameter):
-    scale = 0.5
-    units = "% load"
-
-class LoadBandLimit1(LoadBandLimit):
-    name = "Load Band 1 Limit"
-
-class LoadBandLimit2(LoadBandLimit):
-    name = "Load Band 2 Limit"
-
-class LoadBandLimit3(LoadBandLimit):
-    name = "Load Band 3 Limit"
-
-class LoadBandLimit4(LoadBandLimit):
-    name = "Load Band 4 Limit"
-
-class LoadBandLimit5(LoadBandLimit):
-    name = "Load Band 5 Limit"
-
-class LoadBandLimit6(LoadBandLimit):
-    name = "Load Band 6 Limit"
-
-class LoadBandLimit7(LoadBandLimit):
-    name = "Load Band 7 Limit"
-
-class LoadBandLimit8(LoadBandLimit):
-    name = "Load Band 8 Limit"
-
-class LoadBandLimit9(LoadBandLimit):
-    name = "Load Band 9 Limit"
-
-class TrendSampleInterval(ShortParameter):
-    name = "Trend Sample Interval"
-    scale = 0.05
-    units = "Engine Hours"
-
-class RPMIdleThreshold(ShortParameter):
-    name = "RPM Idle Threshold"
-    scale = 0.25
-    units = "RPM"
-
-class LoadIdleThreshold(Parameter):
-    name = "Load Idle Threshold"
-    scale = 0.5
-    units = "% load"
-
-class ServiceDueFlag(Parameter):#enum
-    name = "Service Due Flag"
-
-class ConfigurationPageChangeTimestamp(LongParameter):
-    name = "Configuration Page Change Timestamp"
-
-class ConfigurationChecksum(ShortParameter):
-    name = "Configuration Checksum"
-
-class IdleAlgorithm(Parameter):#enum
-    name = "Idle Algorithm"
-
-class TimeZone(Parameter):
-    name = "Timezone"
-    scale = 0.25
-    units = "Hours"
-
-class TripResetLockOut(Parameter):#enum
-    name = "Trip Reset Lock Out"
-    
-class OilPressureMinRPMLimit(Parameter):
-    name = "Oil Pressure Minimum RPM Limit"
-    scale = 50
-    units = "RPM"
-
-class OilPressureMaxRPMLimit(OilPressureMinRPMLimit):
-    name = "Oil Pressure Maximum RPM Limit"
-
-class OilPressureMinTempLimit(Parameter):
-    name = "Oil Pressure Minimum Temp Limit"
-    scale = 5
-    units = "Degrees F"
-
-class OilPressureMaxTempLimit(OilPressureMinTempLimit):
-    name = "Oil Pressure Maximum Temp Limit"
-
-class BoostPressureMinimumRPMLimit(Parameter):
-    name = "Boost Pressure Minimum RPM Limit"
-    scale = 5
-    units = "RPM"
-
-class BoostPressureMaximumRPMLimit(BoostPressureMinimumRPMLimit):
-    name = "Boost Pressure Maximum RPM Limit"
-
-class BoostPressureMinimumLoadLimit(Parameter):
-    name = "Boost Pressure Minimum Load Limit"
-    units = "% load"
-
-class BoostPressureMaximumLoadLimit(BoostPressureMinimumLoadLimit):
-    name = "Boost Pressure Maximum Load Limit"
-
-class BatteryVoltageMinimumRPMLimit(Parameter):
-    name = "Battery Voltage Minimum RPM Limit"
-    scale = 50
-    units = "RPM"
-
-class BatteryVoltageMaximumRPMLimit(BatteryVoltageMinimumRPMLimit):
-    name = "Battery Voltage Maximum RPM Limit"
-
-class ServiceAlertPercentage(Parameter):
-    name = "Service Alert Percentage"
-    units = "% limit"
-
-class LastStopIncidentEnable(Parameter):#enum
-    name = "Last Stop Incident Enable"
-
-class DriverCardEnable(Parameter):#enum
-    name = "Driver Card Enable"
-
-class ButtonFeedbackEnable(Parameter):#enum
-    name = "Button Feedback Enable"
-    
-class OverspeedAEnable(Parameter):#enum
-    name = "Overspeed A Enable"
-
-class OverspeedBEnable(Parameter):#enum
-    name = "Overspeed B Enable"
-
-class OverRevEnable(Parameter):#enum
-    name = "Over Rev Enable"
-
-class CPCSoftwareVersionID(StringParameter):
-    name = "CPC Software Version ID"
-    length = 70
-
-class PTOIdleRPMThreshold(ShortParameter):
-    name = "PTO Idle RPM Threshold"
-    scale = 0.25
-    units = "RPM"
-
-class PTOIdleLoadRPMThreshold(Parameter):
-    name = "PTO Idle Load RPM Threshold"
-    scale = 0.5
-    units = "% load"
-
-class FirmBrakeDecelerationLimit(Parameter):
-    name = "Firm Brake Deceleration Limit"
-    units =  "mph/s"
-
-
-###################################
-# DetailedAlert Parameters         #
-###################################
-
-class AlertCode(Parameter):#enum
-    name = "Alert Code"
-    
-class AlertTimeStamp(LongParameter):
-    name = "Alert Timestamp"
-
-class AlertRoadSpeed(Parameter):
-    name = "Alert Road Speed"
-    scale = 0.5
-    units = "MPH"
-
-class AlertEngineRPM(ShortParameter):
-    name = "Alert Engine RPM"
-    scale = 0.25
-    units = "RPM"
-
-class AlertTurboBoostPressure(ShortParameter):
-    name = "Alert Turbo Boost Pressure"
-    scale = 0.125
-    units = "PSI"
-
-class AlertOilPressure(ShortParameter):
-    name = "Alert Oil Pressure"
-    scale = 0.125
-    units = "PSI"
-
-class AlertFuelPressure(ShortParameter):
-    name = "Alert Fuel Pressure"
-    scale = 0.125
-    units = "PSI"
-
-class AlertAirIntakeTemp(ShortParameter):
-    name = "Alert Air Intake Temp"
-    scale = 0.25
-    units = "degrees F"
-
-class AlertCoolantTemp(AlertAirIntakeTemp):
-    name = "Alert Coolant Temp"
-
-class AlertOilTemp(AlertAirIntakeTemp):
-    name = "Alert Oil Temp"
-
-class AlertFuelTemp(AlertAirIntakeTemp):
-    name = "Alert Fuel Temp"
-
-class AlertThrottlePercent(Parameter):
-    name = "Alert Throttle Percent"
-    scale = 0.4
-    units = "% throttle"
-
-class AlertPulseWidth(ShortParameter):
-    name = "Alert Pulse Width"
-    scale = 0.01
-    units = "degrees"
-
-class AlertBrakeState(Parameter):
-    name = "Alert Brake State"
-
-class AlertEngineLoad(Parameter):
-    name = "Alert Engine Load"
-    scale = 0.5
-    units = "% load"
-
-class AlertCruiseMode(Parameter):
-    name = "Alert Cruise Mode"
-
-###############################
-# EngineUsage parameters      #
-###############################
-
-class DailyDistanceTravelled(ShortParameter):
-    name = "Daily Distance Travelled"
-    scale = 0.1
-    units = "Miles"
-
-class DailyFuelConsumption(ShortParameter):
-    name = "Daily Fuel Consumption"
-    scale = 0.25
-    units = "Gallons"
-
-class StartDayTimeStamp(LongParameter):
-    name = "Start of Day Time Stamp"
-    
-class StartDayOdometer(LongParameter):
-    name = "Start of Day Odometer"
-    scale = 0.1
-    units = "Miles"
-
-class IdleTimeBreakdown(Parameter):#ALERT
-    format = "<LLL"
-    name = "Idle Time Breakdown"
-    
-class DriveTimeBreakdown(Parameter):#ALERT
-    format = "<LLL"
-    name = "Drive Time Breakdown"
-
-
-###################################
-# PermanentData Parameters        #
-###################################
-
-class PermanentTotalDistance(LongParameter):
-    name = "Total Distance"
-    scale = 0.1
-    units = "Miles"
-
-class PermanentTotalFuel(LongParameter):
-    name = "Total Fuel"
-    scale = 0.125
-    units = "Gallons"
-
-class PermanentTotalTime(LongParameter):
-    name = "Total Time"
-    units = "Seconds"
-
-class PermanentTotalIdleFuel(LongParameter):
-    name = "Total Idle Fuel"
-    scale = 0.125
-    units = "Gallons"
-
-class PermanentTotalIdleTime(LongParameter):
-    name = "Total Idle Time"
-    units = "Seconds"
-
-class PermanentTotalVSGFuel(LongParameter):
-    name = "Total VSG Fuel"
-    scale = 0.125
-    units = "gallons"
-
-class PermanentTotalVSGTime(LongParameter):
-    name = "Total VSG Time"
-    units = "Seconds"
-
-class PermanentVSGPTOIdleFuel(LongParameter):
-    name = "VSG (PTO) Idle Fuel"
-    scale = 0.125
-    units = "Gallons"
-
-class PermanentVSGPTOIdleTime(LongParameter):
-    name = "VSG (PTO) Idle Time"
-    units = "Seconds"
-
-class PermanentTotalCruiseTime(LongParameter):
-    name = "Total Cruise Time"
-    units = "Seconds"
-
-class PermanentOptimizedIdleActiveTime(LongParameter):
-    name = "Optimized Idle Active Time"
-    units = "Seconds"
-
-class PermanentOptimizedIdleRunTime(LongParameter):
-    name = "Optimized Idle Run Time"
-    units = "Seconds"
-
-class PermanentEngineBrakeTime(LongParameter):
-    name = "Engine Brake Time"
-    units = "Seconds"
-
-class PermanentDriveAverageLoadFactor(Parameter):
-    name = "Drive Average Load Factor"
-    units = "%"
-
-class PermanentEngineRevolutions(LongParameter):
-    name = "Engine Revolutions"
-    scale = 1000
-    units = "revolutions"
-
-class PermanentFanTimeEngine(LongParameter):
-    name = "Fan Time (Engine)"
-    units = "Seconds"
-
-class PermanentFanTimeManual(LongParameter):
-    name = "Fan Time (Manual)"
-    units = "Seconds"
-
-class PermanentFanTimeAC(LongParameter):
-    name = "Fan Time (AC)"
-    units = "Seconds"
-
-class PermanentFanTimeDPF(LongParameter):
-    name = "Fan Time (DPF)"
-    units = "Seconds"
-
-class PermanentPeakRoadSpeed(Parameter):
-    name = "Peak Road Speed"
-    scale = 0.5
-    units = "MPH"
-
-class PermanentPeakEngineRPM(ShortParameter):
-    name = "Peak Engine RPM"
-    scale = 0.25
-    units = "RPM"
-
-class PermanentPeakRoadSpeedTimeStamp(LongParameter):
-    name = "Peak Road Speed Time Stamp"
-
-class PermanentPeakEngineRPMTimeStamp(LongParameter):
-    name = "Peak Engine RPM Time Stamp"
+    def __init__(self,*args,**kwargs):
+        for k,v in kwargs.items():
+            assert(k in self.__class__.__allowed)
+            setattr(self,k,v)
     
+    def __len__(self):
+        return self.length
 
-class PermanentTotalBatteryStartsNormal(ShortParameter):
-    name = "Total Battery Starts - Normal"
-
-class PermanentTotalBatteryStartsAlternative(ShortParameter):
-    name = "Total Battery Starts - Alternative"
-
-class PermanentTotalBatteryStartsContinuous(ShortParameter):
-    name = "Total Battery Starts - Continuous Run"
-
-class PermanentParkedDPFRegenAttempts(LongParameter):
-    name = "Parked DPF Regen Attempts Count"
-
-class PermanentDrivingDPFRegenAttempts(LongParameter):
-    name = "Driving DPF Regen Attempts Count"
-
-class PermanentParkedDPFRegenComplete(LongParameter):
-    name = "Parked DPF Regen Complete Count"
-
-class PermanentDrivingDPFRegenComplete(LongParameter):
-    name = "Driving DPF Regen Complete Count"
-
-class PermanentLastParkedDPFRegenTimeStamp(LongParameter):
-    name = "Last Parked DPF Regen Time Stamp"
-
-class PermanentLastDrivingDPFRegenTimeStamp(LongParameter):
-    name = "Last Driving DPF Regen Time Stamp"
-
-class PermanentParkedDPFFuelVolume(LongParameter):
-    name = "Parked DPF Fuel Volume"
-    scale = 0.00048828125
-    units = "Gallons"
-
-class PermanentDrivingDPFFuelVolume(LongParameter):
-    name = "Driving DPF Fuel Volume"
-    scale = 0.00048828125
-    units = "Gallons"
+    def get_data(self,byte_list,offset=0):
+        try:
+            assert(offset+len(self) <= len(byte_list))
+        except AssertionError:
+            print("StringParameter needed byte string of length %d, got length %d" % (len(self),len(byte_list)-offset))
+        return printable(get_bytes(byte_list,offset,offset+len(self)))
 
-class PermanentParkedTime(LongParameter):
-    name = "Parked Time"
-    units = "Seconds"
+    def get_value_data(self,byte_list,offset=0):
+        this_data = self.get_data(byte_list,offset)
+        if not this_data or not len(self):
+            return None
+        value_data = {
+            'name':self.name,
+            'units':self.units,
+            'bytes':get_bytes(byte_list,offset,offset+len(self)),
+            'value':repr(this_data),
+            }
+        return {self.slug_name : value_data}
+            
 
-class PermanentTotalPredictiveCruiseTime(LongParameter):
-    name = "Total Predictive Cruise (PCC) Time"
-    units = "Seconds"
+    @property
+    def slug_name(self):
+        return slug_for(self.name)
 
 
 ##############################
-# Header Parameters          #
+# Page tables                #
 ##############################
 
-class HeaderEngineHours(LongParameter):
-    name = "Current Engine Hours"
-    scale = 0.05
-    units = "Hours"
-
-class HeaderDriverID(StringParameter):
-    name = "Current Driver ID"
-    length = 10
-
-class HeaderVehicleID(StringParameter):
-    name = "Vehicle ID"
-    length = 10
-
-class HeaderExtractionOdometer(LongParameter):
-    name = "Extraction Time Odometer"
-    scale = 0.1
-    units = "Miles"
-
-class HeaderExtractionTimeStamp(LongParameter):
-    name = "Extraction Time Time Stamp"
-    
-class HeaderConfigurationChecksum(ShortParameter):
-    name = "Configuration Checksum"
-    
-class HeaderEngineSerialNumber(StringParameter):
-    name = "Engine Serial Number"
-    length = 10
-
-class HeaderStatusInformation(Parameter):
-    name = "Status Information"
-
-class HeaderMBESerialNumber(StringParameter):
-    name = "MBE Engine Serial Number"
-    length = 14
-
-class HeaderSoftwareMajorVersion(ShortParameter):
-    name = "Major Version"
-
-class HeaderSoftwareMinorVersion(ShortParameter):
-    name = "Minor Version"
-
-
-
-
-###########################
-# Incident Subpages       #
-###########################
-
-class IncidentSubPage(SubPage):
-    name = "Incident Subpage"
-    param_list = [RoadSpeed(),
-                  EngineSpeed(),
-                  PercentLoad(),
-                  PercentThrottle(),
-                  CruiseMode()]
-
-class LastStopPage(IncidentSubPage):
-    name = "Last Stop"
-    repeat = 120
-
-class HardBrakePage(IncidentSubPage):
-    name = "Hard Brake"
-    repeat = 75
-
-
-############################
-# Trip Subpages            #
-############################
-
-class TripSubPage(SubPage):
-    name = "Trip Data"
-    param_list = [TripDistance(),
-                  TripFuel(),
-                  TripTime()]
-
-class DriveSubPage(SubPage):
-    name = "Drive Sub Page"
-    param_list = [DriveDistance(),
-                  DriveFuel(),
-                  DriveTime()]
-
-class CruiseSubPage(SubPage):
-    name = "Cruise Sub Page"
-    param_list = [CruiseDistance(),
-                  CruiseFuel(),
-                  CruiseTime()]
-
-class TopGearSubPage(SubPage):
-    name = "Top Gear Sub Page"
-    param_list = [TopGearDistance(),
-                  TopGearFuel(),
-                  TopGearTime()]
-
-class IdleSubPage(SubPage):
-    name = "Idle Sub Page"
-    param_list = [IdleFuel(),
-                  IdleTime()]
-
-class VSGPTOSubPage(SubPage):
-    name = "VSGPTO Sub Page"
-    param_list = [VSGPTOFuel(),
-                  VSGPTOTime(),
-                  VSGPTOIdleFuel(),
-                  VSGPTOIdleTime()]
-
-class OverSpeedATimeSubPage(SubPage):
-    name = "Overspeed A Time Sub Page"
-    param_list = [OverSpeedATime()]
-
-class OverSpeedBTimeSubPage(SubPage):
-    name = "Overspeed B Time Sub Page"
-    param_list = [OverSpeedBTime()]
-
-class OverRevTimeSubPage(SubPage):
-    name = "Overrev Time Sub Page"
-    param_list = [OverRevTime()]
-
-class CoastTimeSubPage(SubPage):
-    name = "Coast Time Sub Page"
-    param_list = [CoastTime()]
-
-class PeakSubPage(SubPage):
-    name = "Peak Sub Page"
-    param_list = [PeakRoadSpeed(),
-                  PeakEngineSpeed()]
-
-class InterruptSubPage(SubPage):
-    name = "Interrupt Sub Page"
-    param_list = [InterruptNumber(),
-                  InterruptHours(),
-                  InterruptDuration()]
-
-class TimeoutSubPage(SubPage):
-    name = "Timeout Sub Page"
-    param_list = [TimeoutCount(),
-                  TimeoutHours(),
-                  TimeoutDuration()]
-
-class DriveLoadAccumulationSubPage(SubPage):
-    name = "Drive Load Accumulation Sub Page"
-    param_list = [DriveLoadAccumulation()]
-
-class HardBrakeCountSubPage(SubPage):
-    name = "Hard Brake Count Sub Page"
-    param_list = [HardBrakeCount(),
-                  DriverIncidentCount(),
-                  FutureHardBrakeIndex(),
-                  FutureDriverIncidentIndex()]
-
-class OptimisedIdleData1SubPage(SubPage):
-    name = "Optimised Idle Data 1 Sub Page"
-    param_list = [TripArmedTime(),
-                  TripRunTime(),
-                  StartOptimisedIdleFuelValue(),
-                  TripIdleTimeSaved(),
-                  TripIdleFuelSaved(),
-                  TotalIdleFuelSaved(),
-                  TotalArmedTime(),
-                  TotalRunTime(),
-                  BatteryTime()]
-
-class TopGearRatioSubPage(SubPage):
-    name = "Top Gear Ratio Sub Page"
-    param_list = [TopGearRatio()]
-
-class TopGearTimeStampSubPage(SubPage):
-    name = "Top Gear Timestamp Sub Page"
-    param_list = [TopGearTimeStamp()]
-
-class TopGear1DistanceSubPage(SubPage):
-    name = "Top Gear 1 Distance Sub Page"
-    param_list = [TopGear1Distance(),
-                  TopGear1Fuel(),
-                  TopGear1Time()]
-
-class TopGear1RatioSubPage(SubPage):
-    name = "Top Gear 1 Ratio Sub Page"
-    param_list = [TopGear1Ratio(),
-                  TopGear1TimeStamp()]
-
-class TopGearCruiseSubPage(SubPage):
-    name = "Top Gear Cruise Sub Page"
-    param_list = [TopGearCruiseDistance(),
-                  TopGearCruiseFuel(),
-                  TopGearCruiseTime()]
-
-class RSGSubPage(SubPage):
-    name = "RSG Sub Page"
-    param_list = [RSGDistance(),
-                  RSGFuel(),
-                  RSGTime()]
-
-class StopIdleSubPage(SubPage):
-    name = "Stop Idle Sub Page"
-    param_list = [StopIdleFuel(),
-                  StopIdleTime()]
-
-class PumpSubPage(SubPage):
-    name = "Pump Sub Page"
-    param_list = [PumpDistance(),
-                  PumpFuel(),
-                  PumpTime()]
-
-class JakeBrakeTimeSubPage(SubPage):
-    name = "Jake Brake TIme Sub Page"
-    param_list = [JakeBrakeTime()]
-
-class FanTimeSubPage(SubPage):
-    name = "Fan Time Sub Page"
-    param_list = [FanTimeEngine(),
-                  FanTimeManual(),
-                  FanTimeAirConditioning(),
-                  FanTimeDPF()]
-
-class OptimisedIdleData2SubPage(SubPage):
-    name = "Optimised Idle Data 2 Sub Page"
-    param_list = [OptimisedIdleArmedTime(),
-                  OptimisedIdleRunTime(),
-                  OptimisedIdleBatteryTime2(),
-                  OptimisedIdleEngineTempTime(),
-                  OptimisedIdleThermostatTime(),
-                  OptimisedIdleExtendedIdleTime(),
-                  OptimisedIdleContinuousTime()]
-
-class PeakTimeStampSubPage(SubPage):
-    name = "Peak Time Stamp Sub Page"
-    param_list = [PeakRoadSpeedTimeStamp(),
-                  PeakEngineRPMTimeStamp()]
-
-class TripStartSubPage(SubPage):
-    name = "Trip Start Sub Page"
-    param_list = [TripStartTimeStamp(),
-                  TripStartOdometer()]
-
-
-class CountsSubPage(SubPage):
-    name = "Counts Sub Page"
-    param_list = [CountOverSpeedACount(),
-                  CountOverSpeedBCount(),
-                  CountOverRevCount(),
-                  CountBrakeCount(),
-                  CountHardBrakeCount(),
-                  CountFirmBrakeCount()]
-
-class BVESubPage(SubPage):
-    name = "BVE Sub Page"
-    param_list = [BVEBrakingVelocityEnergy(),
-                  BVECrankshaftRevolutions()]
-
-class AlertCountSubPage(SubPage):
-    name = "Alert Counts Sub Page"
-    param_list = [AlertCount()]
-
-class DriveAverageLoadFactorSubPage(SubPage):
-    name = "Drive Average Load Factor Sub Page"
-    param_list = [DriveAverageLoadFactor()]
-
-class OptimizedIdleCountsSubPage(SubPage):
-    name = "Optimized Idle Counts Sub Page"
-    param_list = [OICBatteryStartsNormal(),
-                  OICBatteryStartsAlternative(),
-                  OICBatteryStartsContinuousRun()]
-
-class DPFRegenerationStatisticsSubPage(SubPage):
-    name = "DPF Regeneration Statistics Sub Page"
-    param_list = [DPFRSParkedRegenAttempts(),
-                  DPFRSDrivingRegenAttempts(),
-                  DPFRSParkedRegenCompletions(),
-                  DPFRSDrivingRegenCompletions(),
-                  DPFRSParkedDPFFuelVolume(),
-                  DPFRSAutomaticDPFFuelVolume(),
-                  DPFRSRegenerationTime()]
-
-class PredictiveCruiseSubPage(SubPage):
-    name = "Predictive Cruise Sub Page"
-    param_list = [PCCDistance(),
-                  PCCFuel(),
-                  PCCTime()]
-                  
-                  
-######################
-# TripTable subpages #
-######################
-
-class BrakeCountsSubPage(SubPage):
-    name = "Brake Counts Sub Page"
-    param_list = [BrakeCounts()]
-
-class HardBrakeCountsSubPage(SubPage):
-    name = "Hard Brake Counts Sub Page"
-    param_list = [HBCHardBrakeCounts(),
-                  HBCFirmBrakeCounts()]
-
-class TimeInRoadSpeedEngineRPMBandsSubPage(SubPage):
-    name = "Time In Road Speed Engine RPM Bands Sub Page"
-    param_list = [TIRSERBTimeInSpeedBandsRPMBand1(),
-                  TIRSERBTimeInSpeedBandsRPMBand2(),
-                  TIRSERBTimeInSpeedBandsRPMBand3(),
-                  TIRSERBTimeInSpeedBandsRPMBand4(),
-                  TIRSERBTimeInSpeedBandsRPMBand5(),
-                  TIRSERBTimeInSpeedBandsRPMBand6(),
-                  TIRSERBTimeInSpeedBandsRPMBand7(),
-                  TIRSERBTimeInSpeedBandsRPMBand8(),
-                  TIRSERBTimeInSpeedBandsRPMBand9(),
-                  TIRSERBTimeInSpeedBandsOverRev()]
-
-class TimeInEngineLoadEngineRPMBandsSubPage(SubPage):
-    name = "Time In Engine Load Engine RPM Bands Sub Page"
-    param_list = [TIELRBRPMBand1(),
-                  TIELRBRPMBand2(),
-                  TIELRBRPMBand3(),
-                  TIELRBRPMBand4(),
-                  TIELRBRPMBand5(),
-                  TIELRBRPMBand6(),
-                  TIELRBRPMBand7(),
-                  TIELRBRPMBand8(),
-                  TIELRBRPMBand9(),
-                  TIELRBOverRev()]
-
-class TimeInAutomaticOverSpeedBandsSubPage(SubPage):
-    name = "Time In Automatic Over Speed Bands Sub Page"
-    param_list = [TimeInAutomaticOverSpeedBands()]
-
-class TimeInAutomaticEngineOverRevBandsSubPage(SubPage):
-    name = "Time In Automatic Engine Over Rev Bands Sub Page"
-    param_list = [TimeInAutomaticEngineOverRevBands()]
-
-#################################
-# ConfigurationData SubPages    #
-#################################
-
-class FleetIdleGoalPercentageSubPage(SubPage):
-    name = "Fleet Idle Goal Percentage Sub Page"
-    param_list = [FleetIdleGoalPercentage()]
-
-class FuelEconomyGoalSubPage(SubPage):
-    name = "Fuel Economy Goal Sub Page"
-    param_list = [FuelEconomyGoal()]
-
-class OverRevLimitASubPage(SubPage):
-    name = "Over Rev Limit A Sub Page"
-    param_list = [OverRevLimitA()]
-
-class OverSpeedLimitSubPage(SubPage):
-    name = "Over Speed Limit Sub Page"
-    param_list = [OverSpeedALimit(),
-                  OverSpeedBLimit()]
-
-class PasswordSubPage(SubPage):
-    name = "Password Sub Page"
-    param_list = [Password()]
-
-class DriverIDSubPage(SubPage):
-    name = "Driver ID Sub Page"
-    param_list = [DriverIdentifier()]
-
-class VehicleIDSubPage(SubPage):
-    name = "Vehicle ID Sub Page"
-    param_list = [VehicleIdentifier()]
-
-class CurrentOdometerSubPage(SubPage):
-    name = "Current Odometer Sub Page"
-    param_list = [CurrentOdometer()]
-
-class HardBrakeDecelLimitSubPage(SubPage):
-    name = "Hard Brake Decel Limit Sub Page"
-    param_list = [HardBrakeDecelLimit()]
-
-class IdleTimeLimitStopSubPage(SubPage):
-    name = "Idle Time Limit Stop Sub Page"
-    param_list = [IdleTimeLimitStop()]
-
-class AlarmStateSubPage(SubPage):
-    name = "Alarm State Sub Page"
-    param_list = [AlarmState()]
-
-class IntensitySubPage(SubPage):
-    name = "Intensity Sub Page"
-    param_list = [DayIntensity(),
-                  NightIntensity()]
-
-class UnitsSubPage(SubPage):
-    name = "Units Sub Page"
-    param_list = [Units()]
-
-class LanguageSubPage(SubPage):
-    name = "Language Sub Page"
-    param_list = [Language()]
-
-#reuse TopGearRatioSubPage
-
-class DataHubDeviceMIDSubPage(SubPage):
-    name = "Data Hub Device MID Sub Page"
-    param_list = [DataHubDeviceMID()]
-
-class DataEntryRangeTypeSubPage(SubPage):
-    name = "Data Entry Range Type Sub Page"
-    param_list = [DataEntryRangeType()]
-
-class AccessTypeSubPage(SubPage):
-    name = "Access Type Sub Page"
-    param_list = [AccessType()]
-
-class PromptedDriverIDSubPage(SubPage):
-    naem = "Prompted Driver ID Sub Page"
-    param_list = [PromptedDriverID()]
-
-class MPGAdjustmentSubPage(SubPage):
-    name = "MPG Adjustment Sub Page"
-    param_list = [MPGAdjustment()]
-
-class SoftwareVersionSubPage(SubPage):
-    name = "Software Version Sub Page"
-    param_list = [SoftwareVersion()]
-
-class ECMTypeSubPage(SubPage):
-    name = "ECM Type Sub Page"
-    param_list = [ECMType()]
-
-class SpeedBandLimitsSubPage(SubPage):
-    name = "Speed Band Limit Sub Page"
-    param_list = [SpeedBandLimit1(),
-                  SpeedBandLimit2(),
-                  SpeedBandLimit3(),
-                  SpeedBandLimit4(),
-                  SpeedBandLimit5(),
-                  SpeedBandLimit6(),
-                  SpeedBandLimit7(),
-                  SpeedBandLimitA(),
-                  SpeedBandLimitB()]
-
-class RPMBandLimitsSubPage(SubPage):
-    name = "RPM Band Limits Sub Page"
-    param_list = [RPMBandLimit1(),
-                  RPMBandLimit2(),
-                  RPMBandLimit3(),
-                  RPMBandLimit4(),
-                  RPMBandLimit5(),
-                  RPMBandLimit6(),
-                  RPMBandLimit7(),
-                  RPMBandLimit8(),
-                  RPMBandLimitOverRev()]
-
-
-class LoadBandLimitsSubPage(SubPage):
-    name = "Load Band Limit Sub Page"
-    param_list = [LoadBandLimit1(),
-                  LoadBandLimit2(),
-                  LoadBandLimit3(),
-                  LoadBandLimit4(),
-                  LoadBandLimit5(),
-                  LoadBandLimit6(),
-                  LoadBandLimit7(),
-                  LoadBandLimit8(),
-                  LoadBandLimit9()]
-
-class TrendSampleIntervalSubPage(SubPage):
-    name = "Trend Sample Intervale Sub Page"
-    param_list = [TrendSampleInterval()]
-
-class RPMIdleThresholdSubPage(SubPage):
-    name = "RPM Idle Threshold Sub Page"
-    param_list = [RPMIdleThreshold()]
-
-class LoadIdleThresholdSubPage(SubPage):
-    name = "Load Idle Threshold Sub Page"
-    param_list = [LoadIdleThreshold()]
-
-class TopGear1RatioSubPage2(SubPage):
-    name = "Top Gear 1 Ratio Sub Page 2"
-    param_list = [TopGear1Ratio()]
-
-class ServiceDueFlagSubPage(SubPage):
-    name = "Service Due Flag Sub Page"
-    param_list = [ServiceDueFlag()]
-
-class ConfigurationPageChangeTimestampDataPage(SubPage):
-    name = "Configuration Page Change Timestamp Data Page"
-    param_list = [ConfigurationPageChangeTimestamp()]
-
-class ConfigurationPageChecksumSubPage(SubPage):
-    name = "Configuration Page Checksum Sub Page"
-    param_list = [ConfigurationChecksum()]
-
-class IdleAlgorithmSubPage(SubPage):
-    name = "Idle Algorithm Sub Page"
-    param_list = [IdleAlgorithm()]
-
-class TimeZoneSubPage(SubPage):
-    name = "Time Zone Sub Page"
-    param_list = [TimeZone()]
-
-class TripResetLockOutSubPage(SubPage):
-    name = "Trip Reset Lockout Sub Page"
-    param_list = [TripResetLockOut()]
-
-class TrendConfigurationSubPage(SubPage):
-    name = "Trend Configuration Sub Page"
-    param_list = [OilPressureMinRPMLimit(),
-                  OilPressureMaxRPMLimit(),
-                  OilPressureMinTempLimit(),
-                  OilPressureMaxTempLimit(),
-                  BoostPressureMinimumRPMLimit(),
-                  BoostPressureMaximumRPMLimit(),
-                  BoostPressureMinimumLoadLimit(),
-                  BoostPressureMaximumLoadLimit(),
-                  BatteryVoltageMinimumRPMLimit(),
-                  BatteryVoltageMaximumRPMLimit()]
-
-class ServiceAlertPercentageSubPage(SubPage):
-    naem = "Service Alert Percentage Sub Page"
-    param_list = [ServiceAlertPercentage()]
-
-class LastStopIncidentEnableSubPage(SubPage):
-    name = "Last Stop Incident Enable Sub Page"
-    param_list = [LastStopIncidentEnable()]
-
-class DriverCardEnableSubPage(SubPage):
-    name = "Driver Card Enable Sub Page"
-    param_list = [DriverCardEnable()]
-
-class ButtonFeedbackEnableSubPage(SubPage):
-    name = "Button Feedback Enable Sub Page"
-    param_list = [ButtonFeedbackEnable()]
-
-class OverspeedAEnableSubPage(SubPage):
-    name = "Overspeed A Enable Sub Page"
-    param_list = [OverspeedAEnable()]
-
-class OverspeedBEnableSubPage(SubPage):
-    name = "Overspeed B Enable Sub Page"
-    param_list = [OverspeedBEnable()]
-
-class OverRevEnableSubPage(SubPage):
-    name = "Over Rev Enable Sub Page"
-    param_list = [OverRevEnable()]
-
-class CPCSoftwareVersionIDSubPage(SubPage):
-    name = "CPC Software Version ID Sub Page"
-    param_list = [CPCSoftwareVersionID()]
-
-class PTOIdleRPMThresholdSubPage(SubPage):
-    name = "PTO Idle RPM Threshold Sub Page"
-    param_list = [PTOIdleRPMThreshold(),
-                  PTOIdleLoadRPMThreshold()]
-
-class FirmBrakeDecelerationLimitSubPage(SubPage):
-    name = "Firm Brake Deceleration Limit Sub Page"
-    param_list = [FirmBrakeDecelerationLimit()]
-
-###########################
-# DetailedAlert Subpages  #
-###########################
-
-class AlertCodeSubPage(SubPage):
-    name = "Alert Code Sub Page"
-    param_list = [AlertCode()]
-
-class AlertTimeStampSubPage(SubPage):
-    name = "Alert Timestamp Sub Page"
-    param_list = [AlertTimeStamp()]
-
-class AlertRoadSpeedSubPage(SubPage):
-    name = "Alert Roadspeed Sub Page"
-    repeat = 12
-    param_list = [AlertRoadSpeed(),
-                  AlertEngineRPM(),
-                  AlertTurboBoostPressure(),
-                  AlertOilPressure(),
-                  AlertFuelPressure(),
-                  AlertAirIntakeTemp(),
-                  AlertCoolantTemp(),
-                  AlertOilTemp(),
-                  AlertFuelTemp(),
-                  AlertThrottlePercent(),
-                  AlertPulseWidth(),
-                  AlertBrakeState(),
-                  AlertEngineLoad(),
-                  AlertCruiseMode()]
-
-
-#############################
-# EngineUsage Subpages      #
-#############################
-
-class DailySubPage(SubPage):
-    name = "Daily Sub Page"
-    param_list = [DailyDistanceTravelled(),
-                  DailyFuelConsumption(),
-                  StartDayTimeStamp(),
-                  StartDayOdometer()]
-
-class BreakdownSubPage(SubPage):
-    name = "Breakdown Sub Page"
-    param_list = [IdleTimeBreakdown(),
-                  DriveTimeBreakdown()]
-
-
-
-#############################
-# PermanentData Subpages    #
-#############################
-
-class PermanentDataSubPage(SubPage):
-    name = "Permanent Data Sub Page"
-    param_list = [PermanentTotalDistance(),
-                  PermanentTotalFuel(),
-                  PermanentTotalTime()]
-
-class PermanentTotalIdleSubPage(SubPage):
-    name = "Permanent Total Idle Sub Page"
-    param_list = [PermanentTotalIdleFuel(),
-                  PermanentTotalIdleTime()]
-
-class PermanentTotalVSGSubPage(SubPage):
-    name = "Permanent Total VSG Sub Page"
-    param_list = [PermanentTotalVSGFuel(),
-                  PermanentTotalVSGTime(),
-                  PermanentVSGPTOIdleFuel(),
-                  PermanentVSGPTOIdleTime()]
-
-class PermanentTotalCruiseTimeSubPage(SubPage):
-    name = "Permanent Total Cruise Time Sub Page"
-    param_list = [PermanentTotalCruiseTime()]
-
-class PermanentOptimizedIdleSubPage(SubPage):
-    name = "Permanent Optimized Idle Sub Page"
-    param_list = [PermanentOptimizedIdleActiveTime(),
-                  PermanentOptimizedIdleRunTime()]
-
-class PermanentEngineBrakeTimeSubPage(SubPage):
-    name = "Permanent Engine Brake Time Sub Page"
-    param_list = [PermanentEngineBrakeTime()]
-
-class PermanentDriveAverageLoadFactorSubPage(SubPage):
-    name = "Permanent Drive Average Load Factor Sub Page"
-    param_list = [PermanentDriveAverageLoadFactor()]
-
-class PermanentEngineRevolutionsSubPage(SubPage):
-    name = "Permanent Engine Revolutions Sub Page"
-    param_list = [PermanentEngineRevolutions()]
-
-class PermanentFanTimeSubPage(SubPage):
-    name = "Permanent Fan Time Sub Page"
-    param_list = [PermanentFanTimeEngine(),
-                  PermanentFanTimeManual(),
-                  PermanentFanTimeAC(),
-                  PermanentFanTimeDPF()]
-
-class PermanentPeakSubPage(SubPage):
-    name = "Permanent Peak Sub Page"
-    param_list = [PermanentPeakRoadSpeed(),
-                  PermanentPeakEngineRPM(),
-                  PermanentPeakRoadSpeedTimeStamp(),
-                  PermanentPeakEngineRPMTimeStamp()]
-
-class PermanentOptimizedIdleCountsSubPage(SubPage):
-    name = "Permanent Optimized Idle Counts Sub Page"
-    param_list = [PermanentTotalBatteryStartsNormal(),
-                  PermanentTotalBatteryStartsAlternative(),
-                  PermanentTotalBatteryStartsContinuous()]
-
-class PermanentDPFRegenStatisticsSubPage(SubPage):
-    name = "Permanent DPF Regen Statistics Sub Page"
-    param_list = [PermanentParkedDPFRegenAttempts(),
-                  PermanentDrivingDPFRegenAttempts(),
-                  PermanentParkedDPFRegenComplete(),
-                  PermanentDrivingDPFRegenComplete(),
-                  PermanentLastParkedDPFRegenTimeStamp(),
-                  PermanentLastDrivingDPFRegenTimeStamp(),
-                  PermanentParkedDPFFuelVolume(),
-                  PermanentDrivingDPFFuelVolume(),
-                  PermanentParkedTime()]
-
-class PermanentTotalPredictiveCruiseTimeSubPage(SubPage):
-    name = "Permanent Total Predictive Cruise Time Sub Page"
-    param_list = [PermanentTotalPredictiveCruiseTime()]
-
-
-
-############################
-# Header subpages          #
-############################
-
-class HeaderEngineHoursSubPage(SubPage):
-    name = 'Engine Hours Sub Page'
-    param_list = [HeaderEngineHours()]
-
-class HeaderDriverIDSubPage(SubPage):
-    name = "Driver ID Sub Page"
-    param_list = [HeaderDriverID()]
-
-class HeaderVehicleIDSubPage(SubPage):
-    name = "Vehicle ID Sub Page"
-    param_list = [HeaderVehicleID()]
-
-class HeaderExtractionOdometerSubPage(SubPage):
-    name = "Extraction Odometer Sub Page"
-    param_list = [HeaderExtractionOdometer()]
-
-class HeaderExtractionTimeStampSubPage(SubPage):
-    name = "Extraction Timestamp Sub Page"
-    param_list = [HeaderExtractionTimeStamp()]
-
-class HeaderConfigurationChecksumSubPage(SubPage):
-    name = "Configuration Checksum Sub Page"
-    param_list = [HeaderConfigurationChecksum()]
-
-class HeaderEngineSerialNumberSubPage(SubPage):
-    name = "Engine Serial Number Sub Page"
-    param_list = [HeaderEngineSerialNumber()]
-
-class HeaderStatusInformationSubPage(SubPage):
-    name = "Status Information Sub Page"
-    param_list = [HeaderStatusInformation()]
-
-class HeaderMBESerialNumberSubPage(SubPage):
-    name = "Engine Serial Number Sub Page"
-    param_list = [HeaderMBESerialNumber()]
-
-class HeaderSoftwareVersionSubPage(SubPage):
-    name = "Software Version Sub Page"
-    param_list = [HeaderSoftwareMajorVersion(),
-                  HeaderSoftwareMinorVersion()]
-
-
-
-
-
-######################
-# Full datapages     #
-######################
-
-class Header(DataPage):
-    subpages = [HeaderEngineHoursSubPage(),
-                HeaderDriverIDSubPage(),
-                HeaderVehicleIDSubPage(),
-                HeaderExtractionOdometerSubPage(),
-                HeaderExtractionTimeStampSubPage(),
-                HeaderConfigurationChecksumSubPage(),
-                HeaderEngineSerialNumberSubPage(),
-                HeaderStatusInformationSubPage(),
-                HeaderMBESerialNumberSubPage(),
-                HeaderSoftwareVersionSubPage()]
-
-
-class EngineUsage(DataPage):
-    subpages = [DailySubPage(),
-               BreakdownSubPage()]
-
-class DetailedAlert(DataPage):
-    subpages = [AlertCodeSubPage(),
-                AlertTimeStampSubPage(),
-                AlertRoadSpeedSubPage()]
-
-class ConfigurationData(DataPage):
-    subpages = [FleetIdleGoalPercentageSubPage(),
-                FuelEconomyGoalSubPage(),
-                OverRevLimitASubPage(),
-                OverSpeedLimitSubPage(),
-                PasswordSubPage(),
-                DriverIDSubPage(),
-                VehicleIDSubPage(),
-                CurrentOdometerSubPage(),
-                HardBrakeDecelLimitSubPage(),
-                IdleTimeLimitStopSubPage(),
-                AlarmStateSubPage(),
-                IntensitySubPage(),
-                UnitsSubPage(),
-                LanguageSubPage(),
-                TopGearRatioSubPage(),
-                DataHubDeviceMIDSubPage(),
-                DataEntryRangeTypeSubPage(),
-                AccessTypeSubPage(),
-                PromptedDriverIDSubPage(),
-                MPGAdjustmentSubPage(),
-                SoftwareVersionSubPage(),
-                ECMTypeSubPage(),
-                SpeedBandLimitsSubPage(),
-                RPMBandLimitsSubPage(),
-                LoadBandLimitsSubPage(),
-                TrendSampleIntervalSubPage(),
-                RPMIdleThresholdSubPage(),
-                LoadIdleThresholdSubPage(),
-                TopGear1RatioSubPage2(),
-                ServiceDueFlagSubPage(),
-                ConfigurationPageChangeTimestampDataPage(),
-                ConfigurationPageChecksumSubPage(),
-                IdleAlgorithmSubPage(),
-                TimeZoneSubPage(),
-                TripResetLockOutSubPage(),
-                TrendConfigurationSubPage(),
-                ServiceAlertPercentageSubPage(),
-                LastStopIncidentEnableSubPage(),
-                DriverCardEnableSubPage(),
-                ButtonFeedbackEnableSubPage(),
-                OverspeedAEnableSubPage(),
-                OverspeedBEnableSubPage(),
-                OverRevEnableSubPage(),
-                CPCSoftwareVersionIDSubPage(),
-                PTOIdleRPMThresholdSubPage(),
-                FirmBrakeDecelerationLimitSubPage()]
-
-class Incident(DataPage):
-    subpages = [SubPage(param_list=[EngineHours()]),
-                SubPage(param_list=[Odometer()]),
-                LastStopPage(),
-                SubPage(param_list=[SampleCount()]),
-                SubPage(param_list=[Timestamp()]),
-                HardBrakePage(),
-                SubPage(param_list=[Timestamp()])]
-
-class TripTable(DataPage):
-    subpages = [BrakeCountsSubPage(),
-                HardBrakeCountsSubPage(),
-                TimeInRoadSpeedEngineRPMBandsSubPage(),
-                TimeInEngineLoadEngineRPMBandsSubPage(),
-                TimeInAutomaticOverSpeedBandsSubPage(),
-                TimeInAutomaticEngineOverRevBandsSubPage()]
-                
-
-class Trip(DataPage):
-    subpages = [TripSubPage(),
-                DriveSubPage(),
-                CruiseSubPage(),
-                TopGearSubPage(),
-                IdleSubPage(),
-                VSGPTOSubPage(),
-                OverSpeedATimeSubPage(),
-                OverSpeedBTimeSubPage(),
-                OverRevTimeSubPage(),
-                CoastTimeSubPage(),
-                PeakSubPage(),
-                InterruptSubPage(),
-                TimeoutSubPage(),
-                DriveLoadAccumulationSubPage(),
-                HardBrakeCountSubPage(),
-                OptimisedIdleData1SubPage(),
-                TopGearRatioSubPage(),
-                TopGearTimeStampSubPage(),
-                TopGear1DistanceSubPage(),
-                TopGear1RatioSubPage(),
-                TopGearCruiseSubPage(),
-                RSGSubPage(),
-                StopIdleSubPage(),
-                PumpSubPage(),
-                JakeBrakeTimeSubPage(),
-                FanTimeSubPage(),
-                OptimisedIdleData2SubPage(),
-                PeakTimeStampSubPage(),
-                TripStartSubPage(),
-                CountsSubPage(),
-                BVESubPage(),
-                AlertCountSubPage(),
-                DriveAverageLoadFactorSubPage(),
-                OptimizedIdleCountsSubPage(),
-                DPFRegenerationStatisticsSubPage(),
-                PredictiveCruiseSubPage()]
-
-class Permanent(DataPage):
-    subpages = [PermanentDataSubPage(),
-                PermanentTotalIdleSubPage(),
-                PermanentTotalVSGSubPage(),
-                PermanentTotalCruiseTimeSubPage(),
-                PermanentOptimizedIdleSubPage(),
-                PermanentEngineBrakeTimeSubPage(),
-                PermanentDriveAverageLoadFactorSubPage(),
-                PermanentEngineRevolutionsSubPage(),
-                PermanentFanTimeSubPage(),
-                PermanentPeakSubPage(),
-                PermanentOptimizedIdleCountsSubPage(),
-                PermanentDPFRegenStatisticsSubPage(),
-                PermanentTotalPredictiveCruiseTimeSubPage()]
-
-
-
-request_codes = {1:Trip,#done
-                 2:Incident,#done
-                 3:Incident,#done
-                 4:Incident,#done
-                 6:ConfigurationData,#done
-                 10:Header,
-                 12:TripTable,#done
-                 14:Trip,#done
-                 15:DetailedAlert,#done
-                 16:EngineUsage,
-                 20:Permanent,#done
-                 21:Trip,#done
-                 22:TripTable,#done
-                 23:Trip,#done
-                 24:TripTable,#done
-                 25:TripTable}#done
-
-
-
+# Each page is a tuple of its subpages in bitmask order. A subpage is
+# (name, repeat, parameters) and a parameter is (name, struct code, scale,
+# units, repeat), where a struct code of 'Ns' is an N byte string. Subpage
+# names end up as output keys, so they are the names the subpages had back
+# when each one was its own class.
+
+HEADER = (
+    ('HeaderEngineHoursSubPage',1,(('Current Engine Hours','I',0.05,'Hours',1),)),
+    ('HeaderDriverIDSubPage',1,(('Current Driver ID','10s',1,'string',1),)),
+    ('HeaderVehicleIDSubPage',1,(('Vehicle ID','10s',1,'string',1),)),
+    ('HeaderExtractionOdometerSubPage',1,(('Extraction Time Odometer','I',0.1,'Miles',1),)),
+    ('HeaderExtractionTimeStampSubPage',1,(('Extraction Time Time Stamp','I',1,'Units',1),)),
+    ('HeaderConfigurationChecksumSubPage',1,(('Configuration Checksum','H',1,'Units',1),)),
+    ('HeaderEngineSerialNumberSubPage',1,(('Engine Serial Number','10s',1,'string',1),)),
+    ('HeaderStatusInformationSubPage',1,(('Status Information','B',1,'Units',1),)),
+    ('HeaderMBESerialNumberSubPage',1,(('MBE Engine Serial Number','14s',1,'string',1),)),
+    ('HeaderSoftwareVersionSubPage',1,(
+        ('Major Version','H',1,'Units',1),
+        ('Minor Version','H',1,'Units',1))))
+
+INCIDENT = (
+    ('SubPage',1,(('Engine Hours','I',0.05,'Hours',1),)),
+    ('SubPage',1,(('Incident Odometer','I',0.1,'Miles',1),)),
+    ('LastStopPage',120,(
+        ('Road Speed','B',0.5,'MPH',1),
+        ('Engine Speed','H',0.25,'RPM',1),
+        ('Engine Load','B',0.5,'% load',1),
+        ('Throttle','B',0.4,'% throttle',1),
+        ('Cruise Mode','B',1,'Units',1))),
+    ('SubPage',1,(('Valid Sample Count','B',1,'Samples',1),)),
+    ('SubPage',1,(('Timestamp','I',1,'Units',1),)),
+    ('HardBrakePage',75,(
+        ('Road Speed','B',0.5,'MPH',1),
+        ('Engine Speed','H',0.25,'RPM',1),
+        ('Engine Load','B',0.5,'% load',1),
+        ('Throttle','B',0.4,'% throttle',1),
+        ('Cruise Mode','B',1,'Units',1))),
+    ('SubPage',1,(('Timestamp','I',1,'Units',1),)))
+
+TRIP = (
+    ('TripSubPage',1,(
+        ('Trip Distance','I',0.1,'Miles',1),
+        ('Trip Fuel','I',0.125,'Gallons',1),
+        ('Trip Time','I',1,'Seconds',1))),
+    ('DriveSubPage',1,(
+        ('Drive Distance','I',0.1,'Miles',1),
+        ('Drive Fuel','I',0.125,'Gallons',1),
+        ('Drive Time','I',1,'Seconds',1))),
+    ('CruiseSubPage',1,(
+        ('Cruise Distance','I',0.1,'Miles',1),
+        ('Cruise Fuel','I',0.125,'Gallons',1),
+        ('Cruise Time','I',1,'Seconds',1))),
+    ('TopGearSubPage',1,(
+        ('Top Gear Distance','I',0.1,'Miles',1),
+        ('Top Gear Fuel','I',0.125,'Gallons',1),
+        ('Top Gear Time','I',1,'Seconds',1))),
+    ('IdleSubPage',1,(
+        ('Idle Fuel','I',0.125,'Gallons',1),
+        ('Idle Time','I',1,'Seconds',1))),
+    ('VSGPTOSubPage',1,(
+        ('VSG (PTO) Fuel','I',0.125,'Gallons',1),
+        ('VSG (PTO) Time','I',1,'Seconds',1),
+        ('VSG (PTO) Idle Fuel','I',0.125,'Gallons',1),
+        ('VSG (PTO) Idle Time','I',1,'Seconds',1))),
+    ('OverSpeedATimeSubPage',1,(('Overspeed A Time','I',1,'Seconds',1),)),
+    ('OverSpeedBTimeSubPage',1,(('Overspeed B Time','I',1,'Seconds',1),)),
+    ('OverRevTimeSubPage',1,(('Over Rev Time','I',1,'Seconds',1),)),
+    ('CoastTimeSubPage',1,(('Coast Time','I',1,'Seconds',1),)),
+    ('PeakSubPage',1,(
+        ('Peak Road Speed','B',0.5,'MPH',1),
+        ('Peak Engine Speed','H',0.25,'RPM',1))),
+    ('InterruptSubPage',1,(
+        ('Number of Power Interrupts','H',1,'Count',1),
+        ('Engine Hours of Last Interrupt','I',0.05,'Hours',1),
+        ('Duration of Last Interrupt','I',4,'Minutes',1))),
+    ('TimeoutSubPage',1,(
+        ('Number of J1587 Timeouts','H',1,'Count',1),
+        ('Engine Hours of Last Timeout','I',0.05,'Hours',1),
+        ('Duration of Last Timeout','I',1,'Seconds',1))),
+    ('DriveLoadAccumulationSubPage',1,(('Drive Engine Load Accumulation','I',0.5,'Sum %load / sec',1),)),
+    ('HardBrakeCountSubPage',1,(
+        ('Hard Brake Count','H',1,'Count',1),
+        ('Driver Incident Count','H',1,'Count',1),
+        ('Index for Future Hard Brake in Queue','B',1,'Index',1),
+        ('Index for Future Driver Incident in Queue','B',1,'Index',1))),
+    ('OptimisedIdleData1SubPage',1,(
+        ('Trip Armed Time','I',1,'Seconds',1),
+        ('Trip Run Time','I',1,'Seconds',1),
+        ('Start Optimized Idle Fuel Value','H',0.25,'Gallons',1),
+        ('Trip Idle Time Saved','I',1,'Minutes',1),
+        ('Trip Idle Fuel Saved','H',0.25,'Gallons',1),
+        ('Total Idle Fuel Saved','H',0.25,'Gallons',1),
+        ('Total Armed Time','I',1,'Seconds',1),
+        ('Total Run Time','I',1,'Seconds',1),
+        ('Battery Time','I',1,'Seconds',1))),
+    ('TopGearRatioSubPage',1,(('Top Gear Ratio','B',1,'RPM/MPH',1),)),
+    ('TopGearTimeStampSubPage',1,(('Top Gear Time Stamp','I',1,'Timestamp',1),)),
+    ('TopGear1DistanceSubPage',1,(
+        ('Top Gear 1 Distance','I',0.1,'Miles',1),
+        ('Top Gear 1 Fuel','I',0.125,'Gallons',1),
+        ('Top Gear 1 Time','I',1,'Seconds',1))),
+    ('TopGear1RatioSubPage',1,(
+        ('Top Gear 1 Ratio','B',1,'RPM/MPH',1),
+        ('Top Gear 1 Time Stamp','I',1,'Timestamp',1))),
+    ('TopGearCruiseSubPage',1,(
+        ('Top Gear Cruise Distance','I',0.1,'Miles',1),
+        ('Top Gear Cruise Fuel','I',0.125,'Gallons',1),
+        ('Top Gear Cruise Time','I',1,'Seconds',1))),
+    ('RSGSubPage',1,(
+        ('RSG Distance','I',0.1,'Miles',1),
+        ('RSG Fuel','I',0.125,'Gallons',1),
+        ('RSG Time','I',1,'Seconds',1))),
+    ('StopIdleSubPage',1,(
+        ('Stop Idle Fuel','I',0.125,'Gallons',1),
+        ('Stop Idle Time','I',1,'Seconds',1))),
+    ('PumpSubPage',1,(
+        ('Pump Distance','I',0.1,'Miles',1),
+        ('Pump Fuel','I',0.125,'Gallons',1),
+        ('Pump Time','I',1,'Seconds',1))),
+    ('JakeBrakeTimeSubPage',1,(('Jake Brake Time','I',1,'Seconds',1),)),
+    ('FanTimeSubPage',1,(
+        ('Fan Time (Engine)','I',1,'Seconds',1),
+        ('Fan Time (Manual)','I',1,'Seconds',1),
+        ('Fan Time (AC)','I',1,'Seconds',1),
+        ('Fan Time (DPF)','I',1,'Seconds',1))),
+    ('OptimisedIdleData2SubPage',1,(
+        ('Armed Time','I',1,'Seconds',1),
+        ('Run Time','I',1,'Seconds',1),
+        ('Battery Time 2','I',1,'Seconds',1),
+        ('Engine Temp. Time','I',1,'Seconds',1),
+        ('Thermostat Time','I',1,'Seconds',1),
+        ('Extended Idle Time','I',1,'Seconds',1),
+        ('Contiuous Time','I',1,'Seconds',1))),
+    ('PeakTimeStampSubPage',1,(
+        ('Peak Road Speed Time Stamp','I',1,'Timestamp',1),
+        ('Peak Engine RPM Time Stamp','I',1,'Timestamp',1))),
+    ('TripStartSubPage',1,(
+        ('Trip Start Time Stamp','I',1,'Timestamp',1),
+        ('Trip Start Odometer','I',1,'Miles',1))),
+    ('CountsSubPage',1,(
+        ('Over Speed A Count','H',1,'Count',1),
+        ('Over Speed B Count','H',1,'Count',1),
+        ('Over Rev Count','H',1,'Count',1),
+        ('Brake Count','I',1,'Count',1),
+        ('Hard Brake Count 2','H',1,'Count',1),
+        ('Firm Brake Count','H',1,'Count',1))),
+    ('BVESubPage',1,(
+        ('Braking Velocity Energy','I',1,'Sum energy',1),
+        ('Crank Shaft Revolutions','I',1,'Revolutions',1))),
+    ('AlertCountSubPage',1,(('Alert Count','H',1,'Count',1),)),
+    ('DriveAverageLoadFactorSubPage',1,(('Drive Average Load Factor','B',1,'% max load',1),)),
+    ('OptimizedIdleCountsSubPage',1,(
+        ('Battery starts - normal','H',1,'Count',1),
+        ('Battery starts - alternative','H',1,'Count',1),
+        ('Battery starts - continuous run','H',1,'Count',1))),
+    ('DPFRegenerationStatisticsSubPage',1,(
+        ('Parked DPF regeneration attempts','H',1,'Count',1),
+        ('Driving DPF regeneration attempts','H',1,'Count',1),
+        ('Parked DPF regeneration completions','H',1,'Count',1),
+        ('Driving DPF regeneration completions','H',1,'Count',1),
+        ('Parked DPF Fuel Volume','I',0.0004882813,'Gallons',1),
+        ('Automatic DPF Fuel Volume','I',0.0004882813,'Gallons',1),
+        ('DPF Regeneration Time','I',1,'Timestamp',1))),
+    ('PredictiveCruiseSubPage',1,(
+        ('Predictive Cruise Distance','I',0.1,'Miles',1),
+        ('Predictive Cruise Fuel','I',0.00048828125,'Gallons',1),
+        ('Predictive Cruise Time','I',1,'Seconds',1))))
+
+TRIP_TABLE = (
+    ('BrakeCountsSubPage',1,(('Brake Counts for Speed Bands','I',1,'Units',10),)),
+    ('HardBrakeCountsSubPage',1,(
+        ('Hard Brake Counts for Speed Bands','H',1,'Units',10),
+        ('Firm Brake Counts for Speed Bands','H',1,'Units',10))),
+    ('TimeInRoadSpeedEngineRPMBandsSubPage',1,(
+        ('Time in Speed Bands when in RPM Band 1','I',1,'Units',10),
+        ('Time in Speed Bands when in RPM Band 2','I',1,'Units',10),
+        ('Time in Speed Bands when in RPM Band 3','I',1,'Units',10),
+        ('Time in Speed Bands when in RPM Band 4','I',1,'Units',10),
+        ('Time in Speed Bands when in RPM Band 5','I',1,'Units',10),
+        ('Time in Speed Bands when in RPM Band 6','I',1,'Units',10),
+        ('Time in Speed Bands when in RPM Band 7','I',1,'Units',10),
+        ('Time in Speed Bands when in RPM Band 8','I',1,'Units',10),
+        ('Time in Speed Bands when in RPM Band 9','I',1,'Units',10),
+        ('Time in Speed Bands when in Over Rev','I',1,'Units',10))),
+    ('TimeInEngineLoadEngineRPMBandsSubPage',1,(
+        ('Time in Load Bands when in RPM Band 1','I',1,'Units',10),
+        ('Time in Load Bands when in RPM Band 2','I',1,'Units',10),
+        ('Time in Load Bands when in RPM Band 3','I',1,'Units',10),
+        ('Time in Load Bands when in RPM Band 4','I',1,'Units',10),
+        ('Time in Load Bands when in RPM Band 5','I',1,'Units',10),
+        ('Time in Load Bands when in RPM Band 6','I',1,'Units',10),
+        ('Time in Load Bands when in RPM Band 7','I',1,'Units',10),
+        ('Time in Load Bands when in RPM Band 8','I',1,'Units',10),
+        ('Time in Load Bands when in RPM Band 9','I',1,'Units',10),
+        ('Time in Load Bands when in Over Rev','I',1,'Units',10))),
+    ('TimeInAutomaticOverSpeedBandsSubPage',1,(('Time in Automatic Over Speed Bands','I',1,'Units',10),)),
+    ('TimeInAutomaticEngineOverRevBandsSubPage',1,(('Time in Automatic Engine Over Rev Bands','I',1,'Units',10),)))
+
+PERMANENT = (
+    ('PermanentDataSubPage',1,(
+        ('Total Distance','I',0.1,'Miles',1),
+        ('Total Fuel','I',0.125,'Gallons',1),
+        ('Total Time','I',1,'Seconds',1))),
+    ('PermanentTotalIdleSubPage',1,(
+        ('Total Idle Fuel','I',0.125,'Gallons',1),
+        ('Total Idle Time','I',1,'Seconds',1))),
+    ('PermanentTotalVSGSubPage',1,(
+        ('Total VSG Fuel','I',0.125,'gallons',1),
+        ('Total VSG Time','I',1,'Seconds',1),
+        ('VSG (PTO) Idle Fuel','I',0.125,'Gallons',1),
+        ('VSG (PTO) Idle Time','I',1,'Seconds',1))),
+    ('PermanentTotalCruiseTimeSubPage',1,(('Total Cruise Time','I',1,'Seconds',1),)),
+    ('PermanentOptimizedIdleSubPage',1,(
+        ('Optimized Idle Active Time','I',1,'Seconds',1),
+        ('Optimized Idle Run Time','I',1,'Seconds',1))),
+    ('PermanentEngineBrakeTimeSubPage',1,(('Engine Brake Time','I',1,'Seconds',1),)),
+    ('PermanentDriveAverageLoadFactorSubPage',1,(('Drive Average Load Factor','B',1,'%',1),)),
+    ('PermanentEngineRevolutionsSubPage',1,(('Engine Revolutions','I',1000,'revolutions',1),)),
+    ('PermanentFanTimeSubPage',1,(
+        ('Fan Time (Engine)','I',1,'Seconds',1),
+        ('Fan Time (Manual)','I',1,'Seconds',1),
+        ('Fan Time (AC)','I',1,'Seconds',1),
+        ('Fan Time (DPF)','I',1,'Seconds',1))),
+    ('PermanentPeakSubPage',1,(
+        ('Peak Road Speed','B',0.5,'MPH',1),
+        ('Peak Engine RPM','H',0.25,'RPM',1),
+        ('Peak Road Speed Time Stamp','I',1,'Units',1),
+        ('Peak Engine RPM Time Stamp','I',1,'Units',1))),
+    ('PermanentOptimizedIdleCountsSubPage',1,(
+        ('Total Battery Starts - Normal','H',1,'Units',1),
+        ('Total Battery Starts - Alternative','H',1,'Units',1),
+        ('Total Battery Starts - Continuous Run','H',1,'Units',1))),
+    ('PermanentDPFRegenStatisticsSubPage',1,(
+        ('Parked DPF Regen Attempts Count','I',1,'Units',1),
+        ('Driving DPF Regen Attempts Count','I',1,'Units',1),
+        ('Parked DPF Regen Complete Count','I',1,'Units',1),
+        ('Driving DPF Regen Complete Count','I',1,'Units',1),
+        ('Last Parked DPF Regen Time Stamp','I',1,'Units',1),
+        ('Last Driving DPF Regen Time Stamp','I',1,'Units',1),
+        ('Parked DPF Fuel Volume','I',0.00048828125,'Gallons',1),
+        ('Driving DPF Fuel Volume','I',0.00048828125,'Gallons',1),
+        ('Parked Time','I',1,'Seconds',1))),
+    ('PermanentTotalPredictiveCruiseTimeSubPage',1,(('Total Predictive Cruise (PCC) Time','I',1,'Seconds',1),)))
+
+ENGINE_USAGE = (
+    ('DailySubPage',1,(
+        ('Daily Distance Travelled','H',0.1,'Miles',1),
+        ('Daily Fuel Consumption','H',0.25,'Gallons',1),
+        ('Start of Day Time Stamp','I',1,'Units',1),
+        ('Start of Day Odometer','I',0.1,'Miles',1))),
+    ('BreakdownSubPage',1,(
+        ('Idle Time Breakdown','<LLL',1,'Units',1),
+        ('Drive Time Breakdown','<LLL',1,'Units',1))))
+
+DETAILED_ALERT = (
+    ('AlertCodeSubPage',1,(('Alert Code','B',1,'Units',1),)),
+    ('AlertTimeStampSubPage',1,(('Alert Timestamp','I',1,'Units',1),)),
+    ('AlertRoadSpeedSubPage',12,(
+        ('Alert Road Speed','B',0.5,'MPH',1),
+        ('Alert Engine RPM','H',0.25,'RPM',1),
+        ('Alert Turbo Boost Pressure','H',0.125,'PSI',1),
+        ('Alert Oil Pressure','H',0.125,'PSI',1),
+        ('Alert Fuel Pressure','H',0.125,'PSI',1),
+        ('Alert Air Intake Temp','H',0.25,'degrees F',1),
+        ('Alert Coolant Temp','H',0.25,'degrees F',1),
+        ('Alert Oil Temp','H',0.25,'degrees F',1),
+        ('Alert Fuel Temp','H',0.25,'degrees F',1),
+        ('Alert Throttle Percent','B',0.4,'% throttle',1),
+        ('Alert Pulse Width','H',0.01,'degrees',1),
+        ('Alert Brake State','B',1,'Units',1),
+        ('Alert Engine Load','B',0.5,'% load',1),
+        ('Alert Cruise Mode','B',1,'Units',1))))
+
+CONFIGURATION_DATA = (
+    ('FleetIdleGoalPercentageSubPage',1,(('Fleet Idle Goal Percentage','B',1,'% max fleet idle goal',1),)),
+    ('FuelEconomyGoalSubPage',1,(('Fuel Economy Goal','H',0.01,'MPG',1),)),
+    ('OverRevLimitASubPage',1,(('Over Rev Limit A','H',0.25,'RPM',1),)),
+    ('OverSpeedLimitSubPage',1,(
+        ('Over Speed A Limit','B',1,'MPH',1),
+        ('Over Speed B Limit','B',1,'MPH',1))),
+    ('PasswordSubPage',1,(('Password','6s',1,'string',1),)),
+    ('DriverIDSubPage',1,(('Driver Identifier','10s',1,'string',1),)),
+    ('VehicleIDSubPage',1,(('Vehicle Identifier','10s',1,'string',1),)),
+    ('CurrentOdometerSubPage',1,(('Current Odometer','I',0.1,'Miles',1),)),
+    ('HardBrakeDecelLimitSubPage',1,(('Hard Brake Deceleration Limit','B',1,'MPH/S',1),)),
+    ('IdleTimeLimitStopSubPage',1,(('Idle Time Limit (Stop)','B',1,'Minutes',1),)),
+    ('AlarmStateSubPage',1,(('Alarm State','B',1,'Units',1),)),
+    ('IntensitySubPage',1,(
+        ('Day Intensity','B',1,'Units',1),
+        ('Night Intensity','B',1,'Units',1))),
+    ('UnitsSubPage',1,(('Units','B',1,'Units',1),)),
+    ('LanguageSubPage',1,(('Language','B',1,'Units',1),)),
+    ('TopGearRatioSubPage',1,(('Top Gear Ratio','B',1,'RPM/MPH',1),)),
+    ('DataHubDeviceMIDSubPage',1,(('Data Hub Device MID','B',1,'Units',1),)),
+    ('DataEntryRangeTypeSubPage',1,(('Data Entry Range Type','B',1,'Units',1),)),
+    ('AccessTypeSubPage',1,(('Acess Type','B',1,'Units',1),)),
+    ('PromptedDriverIDSubPage',1,(('Prompted Driver ID','B',1,'Units',1),)),
+    ('MPGAdjustmentSubPage',1,(('MPG Adjustment','B',0.01,'Units',1),)),
+    ('SoftwareVersionSubPage',1,(('Software Version','5s',1,'string',1),)),
+    ('ECMTypeSubPage',1,(('ECM Type','B',1,'mph',1),)),
+    ('SpeedBandLimitsSubPage',1,(
+        ('Speed Band 1 Limit','B',1,'mph',1),
+        ('SpeedBand 2 Limit','B',1,'mph',1),
+        ('SpeedBand 3 Limit','B',1,'mph',1),
+        ('SpeedBand 4 Limit','B',1,'mph',1),
+        ('SpeedBand 5 Limit','B',1,'mph',1),
+        ('SpeedBand 6 Limit','B',1,'mph',1),
+        ('SpeedBand 7 Limit','B',1,'mph',1),
+        ('SpeedBand A Limit','B',1,'mph',1),
+        ('SpeedBand B Limit','B',1,'mph',1))),
+    ('RPMBandLimitsSubPage',1,(
+        ('RPM Band 1 Limit','B',1,'RPM',1),
+        ('RPM Band 2 Limit','B',1,'RPM',1),
+        ('RPM Band 3 Limit','B',1,'RPM',1),
+        ('RPM Band 4 Limit','B',1,'RPM',1),
+        ('RPM Band 5 Limit','B',1,'RPM',1),
+        ('RPM Band 6 Limit','B',1,'RPM',1),
+        ('RPM Band 7 Limit','B',1,'RPM',1),
+        ('RPM Band 8 Limit','B',1,'RPM',1),
+        ('Over Rev Limit','B',1,'RPM',1))),
+    ('LoadBandLimitsSubPage',1,(
+        ('Load Band 1 Limit','B',0.5,'% load',1),
+        ('Load Band 2 Limit','B',0.5,'% load',1),
+        ('Load Band 3 Limit','B',0.5,'% load',1),
+        ('Load Band 4 Limit','B',0.5,'% load',1),
+        ('Load Band 5 Limit','B',0.5,'% load',1),
+        ('Load Band 6 Limit','B',0.5,'% load',1),
+        ('Load Band 7 Limit','B',0.5,'% load',1),
+        ('Load Band 8 Limit','B',0.5,'% load',1),
+        ('Load Band 9 Limit','B',0.5,'% load',1))),
+    ('TrendSampleIntervalSubPage',1,(('Trend Sample Interval','H',0.05,'Engine Hours',1),)),
+    ('RPMIdleThresholdSubPage',1,(('RPM Idle Threshold','H',0.25,'RPM',1),)),
+    ('LoadIdleThresholdSubPage',1,(('Load Idle Threshold','B',0.5,'% load',1),)),
+    ('TopGear1RatioSubPage2',1,(('Top Gear 1 Ratio','B',1,'RPM/MPH',1),)),
+    ('ServiceDueFlagSubPage',1,(('Service Due Flag','B',1,'Units',1),)),
+    ('ConfigurationPageChangeTimestampDataPage',1,(('Configuration Page Change Timestamp','I',1,'Units',1),)),
+    ('ConfigurationPageChecksumSubPage',1,(('Configuration Checksum','H',1,'Units',1),)),
+    ('IdleAlgorithmSubPage',1,(('Idle Algorithm','B',1,'Units',1),)),
+    ('TimeZoneSubPage',1,(('Timezone','B',0.25,'Hours',1),)),
+    ('TripResetLockOutSubPage',1,(('Trip Reset Lock Out','B',1,'Units',1),)),
+    ('TrendConfigurationSubPage',1,(
+        ('Oil Pressure Minimum RPM Limit','B',50,'RPM',1),
+        ('Oil Pressure Maximum RPM Limit','B',50,'RPM',1),
+        ('Oil Pressure Minimum Temp Limit','B',5,'Degrees F',1),
+        ('Oil Pressure Maximum Temp Limit','B',5,'Degrees F',1),
+        ('Boost Pressure Minimum RPM Limit','B',5,'RPM',1),
+        ('Boost Pressure Maximum RPM Limit','B',5,'RPM',1),
+        ('Boost Pressure Minimum Load Limit','B',1,'% load',1),
+        ('Boost Pressure Maximum Load Limit','B',1,'% load',1),
+        ('Battery Voltage Minimum RPM Limit','B',50,'RPM',1),
+        ('Battery Voltage Maximum RPM Limit','B',50,'RPM',1))),
+    ('ServiceAlertPercentageSubPage',1,(('Service Alert Percentage','B',1,'% limit',1),)),
+    ('LastStopIncidentEnableSubPage',1,(('Last Stop Incident Enable','B',1,'Units',1),)),
+    ('DriverCardEnableSubPage',1,(('Driver Card Enable','B',1,'Units',1),)),
+    ('ButtonFeedbackEnableSubPage',1,(('Button Feedback Enable','B',1,'Units',1),)),
+    ('OverspeedAEnableSubPage',1,(('Overspeed A Enable','B',1,'Units',1),)),
+    ('OverspeedBEnableSubPage',1,(('Overspeed B Enable','B',1,'Units',1),)),
+    ('OverRevEnableSubPage',1,(('Over Rev Enable','B',1,'Units',1),)),
+    ('CPCSoftwareVersionIDSubPage',1,(('CPC Software Version ID','70s',1,'string',1),)),
+    ('PTOIdleRPMThresholdSubPage',1,(
+        ('PTO Idle RPM Threshold','H',0.25,'RPM',1),
+        ('PTO Idle Load RPM Threshold','B',0.5,'% load',1))),
+    ('FirmBrakeDecelerationLimitSubPage',1,(('Firm Brake Deceleration Limit','B',1,'mph/s',1),)))
+
+PAGES = {'Header':HEADER,
+         'Incident':INCIDENT,
+         'Trip':TRIP,
+         'TripTable':TRIP_TABLE,
+         'Permanent':PERMANENT,
+         'EngineUsage':ENGINE_USAGE,
+         'DetailedAlert':DETAILED_ALERT,
+         'ConfigurationData':CONFIGURATION_DATA}
+
+REQUEST_CODES = {1:'Trip',#done
+                 2:'Incident',#done
+                 3:'Incident',#done
+                 4:'Incident',#done
+                 6:'ConfigurationData',#done
+                 10:'Header',
+                 12:'TripTable',#done
+                 14:'Trip',#done
+                 15:'DetailedAlert',#done
+                 16:'EngineUsage',
+                 20:'Permanent',#done
+                 21:'Trip',#done
+                 22:'TripTable',#done
+                 23:'Trip',#done
+                 24:'TripTable',#done
+                 25:'TripTable'}#done
+
+
+def make_parameter(name,code,scale,units,repeat):
+    if code.endswith('s'):
+        return StringParameter(name=name,length=int(code[:-1]),units=units)
+    return Parameter(name=name,format=code,scale=scale,units=units,repeat=repeat)
+
+def make_subpage(name,repeat,params):
+    return SubPage(name=name,repeat=repeat,param_list=[make_parameter(*param) for param in params])
+
+# The page tables built into one DataPage class per page. ECM software
+# versions that lay pages out differently each get their own Schema,
+# registered under a version key and picked with parse_message's schema
+# argument; everything else decodes with default_schema.
+class Schema(object):
+    def __init__(self,version,pages=PAGES,codes=REQUEST_CODES):
+        self.version = version
+        self.tables = dict(pages)
+        self.codes = dict(codes)
+        self.pages = {}
+        for page_name,subpages in self.tables.items():
+            self.pages[page_name] = type(str(page_name),(DataPage,),{
+                'subpages':[make_subpage(*subpage) for subpage in subpages]})
+        self.request_codes = dict((code,self.pages[page_name]) for code,page_name in self.codes.items())
+
+    # A new version that only changes some page tables or request codes. It
+    # is registered, since compiled layouts are cached by version.
+    def derive(self,version,pages=None,codes=None):
+        tables = dict(self.tables)
+        tables.update(pages or {})
+        request_codes = dict(self.codes)
+        request_codes.update(codes or {})
+        return register_schema(Schema(version,tables,request_codes))
+
+schemas = {}
+
+# Versions key the layout cache, so one can't be taken by two schemas
+def register_schema(schema):
+    if schemas.get(schema.version,schema) is not schema:
+        raise ValueError("schema version %r is already registered" % (schema.version,))
+    schemas[schema.version] = schema
+    return schema
+
+def get_schema(schema=None):
+    if schema is None:
+        return default_schema
+    if isinstance(schema,Schema):
+        return schema
+    return schemas[schema]
+
+default_schema = register_schema(Schema('default'))
+
+request_codes = default_schema.request_codes
+Header = default_schema.pages['Header']
+Incident = default_schema.pages['Incident']
+Trip = default_schema.pages['Trip']
+TripTable = default_schema.pages['TripTable']
+Permanent = default_schema.pages['Permanent']
+EngineUsage = default_schema.pages['EngineUsage']
+DetailedAlert = default_schema.pages['DetailedAlert']
+ConfigurationData = default_schema.pages['ConfigurationData']
@@ -0,0 +1,176 @@
+import hashlib
+import os
+import sqlite3
+import struct
+import time
+import zlib
+
+import data_defs
+import slugs
+import utils
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# Share of max_bytes left after an eviction, so a full cache doesn't have to
+# evict again on every insert
+LOW_WATER = 0.9
+
+COUNTERS = ('hits','misses','evictions')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS decoded (
+    digest TEXT PRIMARY KEY,
+    output BLOB NOT NULL,
+    num_pages INTEGER NOT NULL DEFAULT 0,
+    bad_pages INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS decoded_last_used ON decoded (last_used);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+'''
+
+
+# Digest of the decoder's own source, page tables and extract's JSON output
+# included, so output a different version of it decoded and cached is never
+# served. extract imports this module, so its source is found by name next
+# to this file instead.
+def source_digest(modules=(data_defs,slugs,utils),names=('extract',)):
+    paths = [os.path.splitext(module.__file__)[0] + '.py' for module in modules]
+    paths.extend(os.path.join(os.path.dirname(os.path.abspath(__file__)),name + '.py') for name in names)
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path,'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+DECODER_VERSION = source_digest()
+
+# Identifies a message by its raw bytes, wherever it was read from. A message
+# too short to frame is taken to run to the end of the buffer.
+def message_digest(message,offset=0):
+    try:
+        length = data_defs.message_length(message,offset)
+    except struct.error:
+        length = len(message) - offset
+    return hashlib.sha1(data_defs.get_bytes(message,offset,offset+length)).hexdigest()
+
+
+# SQLite store of decoded messages keyed by the SHA-1 of their raw bytes and
+# the decoder version, so re-runs, backfills and report regenerations never
+# decode the same archived message twice. Values are the pages as JSON text,
+# zlib compressed, handed back as text so hits are never parsed, along with
+# how many pages were decoded and skipped. Once the stored size goes over
+# max_bytes the least recently used entries are dropped.
+#
+# Many processes share the file, so it is in WAL mode, where reads don't
+# block the writer, and each put commits at once rather than holding the
+# write lock while more messages decode. Hits only note when they were used;
+# those times, like the hit, miss and eviction counts that cover every
+# process, go into the database every commit_every hits and on close.
+class DecodeCache(object):
+    def __init__(self,path,max_bytes=DEFAULT_MAX_BYTES,commit_every=100):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.commit_every = commit_every
+        self.db = sqlite3.connect(path,timeout=60)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.executescript(SCHEMA)
+        columns = [row[1] for row in self.db.execute('PRAGMA table_info(decoded)')]
+        for column in ('num_pages','bad_pages'):
+            if column not in columns:
+                self.db.execute('ALTER TABLE decoded ADD COLUMN %s INTEGER NOT NULL DEFAULT 0' % column)
+        self.total_bytes = self.db.execute('SELECT COALESCE(SUM(size),0) FROM decoded').fetchone()[0]
+        self.counts = dict((name,0) for name in COUNTERS)
+        self.used = {}
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+        self.commit()
+
+    # (JSON text, decoded pages, skipped pages), or None
+    def get(self,digest):
+        row = self.db.execute('SELECT output,num_pages,bad_pages FROM decoded WHERE digest = ?',(digest,)).fetchone()
+        if row is None:
+            self.counts['misses'] += 1
+            return None
+        self.counts['hits'] += 1
+        self.used[digest] = time.time()
+        if len(self.used) >= self.commit_every:
+            self.commit()
+        return zlib.decompress(row[0]).decode('utf-8'),row[1],row[2]
+
+    def put(self,digest,text,num_pages=0,bad_pages=0):
+        output = zlib.compress(text.encode('utf-8'))
+        # Another process may have stored the same message meanwhile
+        row = self.db.execute('SELECT size FROM decoded WHERE digest = ?',(digest,)).fetchone()
+        if row is not None:
+            self.total_bytes -= row[0]
+        self.db.execute('INSERT OR REPLACE INTO decoded (digest,output,num_pages,bad_pages,size,last_used) '
+                        'VALUES (?,?,?,?,?,?)',
+                        (digest,sqlite3.Binary(output),num_pages,bad_pages,len(output),time.time()))
+        self.total_bytes += len(output)
+        if self.total_bytes > self.max_bytes:
+            self.evict()
+        self.commit()
+
+    # Cached (JSON text, decoded pages, skipped pages) of the message at
+    # offset, made and stored with encode(message,offset) on a miss. variant
+    # keeps apart results of the same message decoded in different ways.
+    def decode(self,message,offset,encode,variant=''):
+        digest = '%s-%s%s' % (message_digest(message,offset),DECODER_VERSION,variant)
+        result = self.get(digest)
+        if result is None:
+            result = encode(message,offset)
+            self.put(digest,*result)
+        return result
+
+    def evict(self):
+        self.write_used()
+        # Other processes may have added entries since this one last looked
+        self.total_bytes = self.db.execute('SELECT COALESCE(SUM(size),0) FROM decoded').fetchone()[0]
+        if self.total_bytes <= self.max_bytes:
+            return
+        excess = self.total_bytes - int(self.max_bytes * LOW_WATER)
+        victims = []
+        for digest,size in self.db.execute('SELECT digest,size FROM decoded ORDER BY last_used'):
+            if excess <= 0:
+                break
+            victims.append((digest,))
+            excess -= size
+            self.total_bytes -= size
+        self.db.executemany('DELETE FROM decoded WHERE digest = ?',victims)
+        self.counts['evictions'] += len(victims)
+
+    def write_used(self):
+        if self.used:
+            self.db.executemany('UPDATE decoded SET last_used = ? WHERE digest = ?',
+                                [(used,digest) for digest,used in self.used.items()])
+            self.used = {}
+
+    def commit(self):
+        self.write_used()
+        for name in COUNTERS:
+            if self.counts[name]:
+                self.db.execute('INSERT OR IGNORE INTO counters (name,value) VALUES (?,0)',(name,))
+                self.db.execute('UPDATE counters SET value = value + ? WHERE name = ?',(self.counts[name],name))
+                self.counts[name] = 0
+        self.db.commit()
+
+    def close(self):
+        self.commit()
+        self.db.close()
+
+    # Counters over every process using this file, plus what is stored now
+    def stats(self):
+        stats = dict((name,0) for name in COUNTERS)
+        stats.update(self.db.execute('SELECT name,value FROM counters').fetchall())
+        for name in COUNTERS:
+            stats[name] += self.counts[name]
+        stats['entries'],stats['bytes'] = self.db.execute(
+            'SELECT COUNT(*),COALESCE(SUM(size),0) FROM decoded').fetchone()
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = float(stats['hits']) / lookups if lookups else 0.0
+        return stats
@@ -0,0 +1,127 @@
+import binascii
+import json
+
+CHUNK_SIZE = 64 * 1024
+
+WHITESPACE = b' \t\r\n'
+
+# Escapes a JSON encoder may put in a base64 string: an escaped slash, and
+# the line breaks of MIME style base64, which are dropped
+BASE64_ESCAPES = {b'/':b'/',b'n':b'',b'r':b'',b't':b''}
+
+
+# Walks a base64 JSON dump ({"section name": "base64 message", ...}) a chunk
+# at a time, decoding each section into one buffer that is reused for every
+# section, so neither the dump nor its decoded sections are ever held whole.
+# The message handed out is only valid until the next section is read.
+class DumpReader(object):
+    def __init__(self,f,chunk_size=CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.data = b''
+        self.pos = 0
+        self.buffer = bytearray()
+
+    def __iter__(self):
+        self.expect(b'{')
+        if self.peek() == b'}':
+            return
+        while True:
+            key = self.read_key()
+            self.expect(b':')
+            self.expect(b'"')
+            yield key,self.read_message()
+            separator = self.peek()
+            self.pos += 1
+            if separator == b'}':
+                return
+            if separator != b',':
+                raise ValueError("expected ',' or '}' at offset %d of the dump" % self.offset())
+
+    def offset(self):
+        return self.f.tell() - len(self.data) + self.pos
+
+    def fill(self):
+        chunk = self.f.read(self.chunk_size)
+        if not chunk:
+            raise ValueError("dump ends in the middle of a section")
+        self.data = self.data[self.pos:] + chunk
+        self.pos = 0
+
+    # Next character that isn't whitespace, left unread
+    def peek(self):
+        while True:
+            while self.pos < len(self.data) and self.data[self.pos:self.pos + 1] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.data):
+                return self.data[self.pos:self.pos + 1]
+            self.fill()
+
+    def expect(self,char):
+        found = self.peek()
+        if found != char:
+            raise ValueError("expected %r at offset %d of the dump, found %r" % (char,self.offset(),found))
+        self.pos += 1
+
+    # Keys are short, so they are handed to json to unescape
+    def read_key(self):
+        if self.peek() != b'"':
+            raise ValueError("expected a section name at offset %d of the dump" % self.offset())
+        end = self.pos + 1
+        while True:
+            end = self.data.find(b'"',end)
+            if end < 0:
+                end = len(self.data) - self.pos
+                self.fill()
+                continue
+            backslashes = 0
+            while self.data[end - backslashes - 1:end - backslashes] == b'\\':
+                backslashes += 1
+            if backslashes % 2 == 0:
+                break
+            end += 1
+        key = json.loads(self.data[self.pos:end + 1].decode('utf-8'))
+        self.pos = end + 1
+        return key
+
+    # Decodes the base64 string up to its closing quote into the buffer. Only
+    # whole 4 character groups are decoded at a time, the rest is carried
+    # over to the next chunk.
+    def read_message(self):
+        length = 0
+        carry = b''
+        while True:
+            if self.pos >= len(self.data):
+                self.fill()
+            quote = self.data.find(b'"',self.pos)
+            backslash = self.data.find(b'\\',self.pos,quote if quote >= 0 else len(self.data))
+            end = backslash if backslash >= 0 else quote if quote >= 0 else len(self.data)
+            text = carry + self.data[self.pos:end]
+            self.pos = end
+            if backslash >= 0:
+                if self.pos + 1 >= len(self.data):
+                    self.fill()
+                escaped = self.data[self.pos + 1:self.pos + 2]
+                if escaped not in BASE64_ESCAPES:
+                    raise ValueError("unexpected escape in section at offset %d of the dump" % self.offset())
+                text += BASE64_ESCAPES[escaped]
+                self.pos += 2
+            whole = len(text) - len(text) % 4
+            if whole:
+                decoded = binascii.a2b_base64(text[:whole])
+                self.buffer[length:length + len(decoded)] = decoded
+                length += len(decoded)
+            carry = text[whole:]
+            if backslash < 0 and quote >= 0:
+                break
+        self.pos += 1
+        if carry:
+            raise ValueError("section ending at offset %d of the dump is not valid base64" % self.offset())
+        del self.buffer[length:]
+        return self.buffer
+
+# (section name, message) for each section of the dump at path
+def iter_dump(path,chunk_size=CHUNK_SIZE):
+    with open(path,'rb') as f:
+        for key,message in DumpReader(f,chunk_size):
+            yield key,message
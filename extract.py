@@ -0,0 +1,379 @@
+#!/usr/bin/env python
+import argparse
+import binascii
+import functools
+import glob
+import hashlib
+import json
+import mmap
+import multiprocessing
+import os
+import re
+import struct
+import sys
+import time
+from collections import OrderedDict,namedtuple
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+import data_defs
+import decode_cache
+import dump_reader
+
+
+RAW_EXTENSIONS = ('.bin',)
+
+def find_dumps(paths,patterns=('*.json','*.bin')):
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            matches = sorted(m for pattern in patterns for m in glob.glob(os.path.join(path,pattern)))
+        else:
+            matches = sorted(glob.glob(path))
+        for match in matches:
+            if os.path.isfile(match) and match not in found:
+                found.append(match)
+    return found
+
+# Raw bytes can't go into JSON, so they are written out as hex
+def jsonable(data):
+    if isinstance(data,dict):
+        return OrderedDict((k,binascii.hexlify(v).decode('ascii') if k == 'bytes' else jsonable(v))
+                           for k,v in data.items())
+    if isinstance(data,list):
+        return [jsonable(x) for x in data]
+    return data
+
+def output_path(path,output_dir,extension='.decoded.json'):
+    name = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(output_dir,name + extension)
+
+# Decoded pages of one message, ready to go into JSON. When resilient, pages
+# that couldn't be decoded are left out and a {"page_error": ...} entry for
+# each is added after the pages that could.
+def decode_message(message,offset=0,history=None,cache=None,resilient=False):
+    if cache is not None:
+        text,good,bad = message_json(message,offset,history,cache,resilient)
+        return json.loads(text,object_pairs_hook=OrderedDict)
+    errors = [] if resilient else None
+    if history is not None:
+        pages = history.decode(message,offset,errors)
+    else:
+        pages = jsonable(data_defs.parse_message(message,offset,errors=errors))
+    return pages + [OrderedDict([('page_error',error.as_dict())]) for error in errors or ()]
+
+# Decoded pages and skipped pages in a decode_message result
+def count_pages(pages):
+    bad_pages = sum(1 for page in pages if isinstance(page,dict) and 'page_error' in page)
+    return len(pages) - bad_pages,bad_pages
+
+# decode_message's pages as JSON text, with the number of decoded and
+# skipped pages. Cache hits come back as the stored text, never parsed.
+def message_json(message,offset=0,history=None,cache=None,resilient=False):
+    if cache is not None:
+        encode = functools.partial(message_json,history=history,resilient=resilient)
+        return cache.decode(message,offset,encode,'resilient' if resilient else '')
+    pages = decode_message(message,offset,history,resilient=resilient)
+    good,bad = count_pages(pages)
+    return json.dumps(pages),good,bad
+
+# Dumps are read and written a section at a time, so archives bundling
+# hundreds of extractions take no more memory than a single one. The output
+# is the same as json.dumps of all the sections, and only appears under its
+# final name once every section has been decoded.
+def extract_dump(path,output_dir,history=None,cache=None,resilient=False):
+    destination = output_path(path,output_dir)
+    num_pages = 0
+    bad_pages = 0
+    temp_path = destination + '.tmp'
+    try:
+        with open(temp_path,'w') as f:
+            separator = '{'
+            for key,message in dump_reader.iter_dump(path):
+                text,good,bad = message_json(message,0,history,cache,resilient)
+                num_pages += good
+                bad_pages += bad
+                # json.dumps encodes in one go in C, json.dump to a file does not
+                f.write('%s%s: %s' % (separator,json.dumps(key),text))
+                separator = ', '
+            f.write('{}' if separator == '{' else '}')
+        os.rename(temp_path,destination)
+    except:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return destination,num_pages,bad_pages
+
+# Offsets of the back-to-back messages in a raw extraction buffer. A message
+# cut short by the end of the buffer, even inside its page headers, is an
+# error, unless partial is set, in which case its offset is the last one
+# yielded.
+def iter_raw_messages(buffer,partial=False):
+    offset = 0
+    while offset < len(buffer):
+        try:
+            length = data_defs.message_length(buffer,offset)
+        except struct.error:
+            length = None
+        if length is None or offset + length > len(buffer):
+            if not partial:
+                raise ValueError("truncated message at offset %d" % offset)
+            yield offset
+            return
+        yield offset
+        offset += length
+
+# (source, buffer, offset) of every message in the given dump files, with
+# source naming the dump section or raw file offset it came from. Buffers
+# may be reused for the next message, so each has to be dealt with before
+# moving on. partial is as for iter_raw_messages.
+def iter_messages(paths,partial=False):
+    for path in paths:
+        if path.endswith(RAW_EXTENSIONS):
+            with open(path,'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    continue
+                buffer = mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ)
+                try:
+                    for offset in iter_raw_messages(buffer,partial):
+                        yield '%s@%d' % (path,offset),buffer,offset
+                finally:
+                    buffer.close()
+        else:
+            for key,message in dump_reader.iter_dump(path):
+                yield '%s:%s' % (path,key),message,0
+
+# Raw files (single pulls or concatenated archives) are memory-mapped and
+# decoded in place, one JSON line per message, so they are never read into
+# memory as a whole. As with dumps, the output only appears once complete.
+def extract_raw(path,output_dir,history=None,cache=None,resilient=False):
+    destination = output_path(path,output_dir,'.decoded.jsonl')
+    num_pages = 0
+    bad_pages = 0
+    temp_path = destination + '.tmp'
+    try:
+        with open(path,'rb') as f, open(temp_path,'w') as out:
+            if os.fstat(f.fileno()).st_size != 0:
+                buffer = mmap.mmap(f.fileno(),0,access=mmap.ACCESS_READ)
+                try:
+                    for offset in iter_raw_messages(buffer,resilient):
+                        text,good,bad = message_json(buffer,offset,history,cache,resilient)
+                        num_pages += good
+                        bad_pages += bad
+                        out.write('{"offset": %d, "pages": %s}\n' % (offset,text))
+                finally:
+                    buffer.close()
+        os.rename(temp_path,destination)
+    except:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return destination,num_pages,bad_pages
+
+def engine_serial(header):
+    serial = header.get('engine_serial_number') or header.get('mbe_engine_serial_number')
+    return serial.strip() if serial else None
+
+# The Header page a message starts with, and the engine serial and
+# extraction time read from it
+EngineHeader = namedtuple('EngineHeader',('serial','extraction_time','page'))
+
+NO_HEADER = EngineHeader(None,None,None)
+
+# Lazily decoded pages of a message as (EngineHeader, request code, page
+# index, page), the header being NO_HEADER until the message's first Header
+# page has been read. schema, units and errors are as for data_defs.iter_pages.
+def iter_engine_pages(message,offset=0,schema=None,units=None,errors=None):
+    schema = data_defs.get_schema(schema)
+    header_class = schema.pages['Header']
+    header = NO_HEADER
+    for page_type,page_index,page in data_defs.iter_pages(message,offset,lazy=True,schema=schema,units=units,
+                                                         errors=errors):
+        if header is NO_HEADER and schema.request_codes[page_type] is header_class:
+            header = EngineHeader(engine_serial(page),page.get('extraction_time_time_stamp'),page)
+        yield header,page_type,page_index,page
+
+# Puts (extraction_time, value) in latest[serial] unless what is there came
+# from a later extraction. An extraction without a timestamp counts as the
+# oldest.
+def keep_latest(latest,serial,extraction_time,value):
+    seen = latest.get(serial)
+    if seen is None or (seen[0] or 0) <= (extraction_time or 0):
+        latest[serial] = (extraction_time,value)
+
+# Identifies a page instance by its request code, bitmask and raw bytes
+def page_digest(page_type,page):
+    digest = hashlib.sha1(struct.pack('B',page_type) + page.layout.bitmask)
+    digest.update(page.raw_bytes())
+    return digest.hexdigest()
+
+# A saved PageHistory state's pages, {request code: {page digest: decoded
+# page}}. The pages were decoded by whatever code wrote them, so state saved
+# under another decoder version (or in an older format) is ignored.
+def read_history_state(path):
+    if not os.path.exists(path):
+        return OrderedDict()
+    with open(path,'r') as f:
+        state = json.load(f,object_pairs_hook=OrderedDict)
+    if state.get('version') != decode_cache.DECODER_VERSION:
+        return OrderedDict()
+    return state['pages']
+
+# Decoded pages from the previous extraction of each engine, kept in
+# state_dir/<serial>.json by request code and page digest. Most pages
+# (configuration, life to date, monthly activity) come back byte for byte
+# identical on the next pull, so only pages with a digest the last
+# extraction didn't have get decoded. The serial comes from the Header page
+# each message starts with.
+class PageHistory(object):
+    def __init__(self,state_dir):
+        self.state_dir = state_dir
+        self.previous = {}
+        self.current = OrderedDict()
+        self.reused = 0
+
+    def state_path(self,serial):
+        return os.path.join(self.state_dir,re.sub(r'[^A-Za-z0-9_.-]','_',serial) + '.json')
+
+    def load(self,serial):
+        if serial not in self.previous:
+            pages = {}
+            for digests in read_history_state(self.state_path(serial)).values():
+                pages.update(digests)
+            self.previous[serial] = pages
+            self.current[serial] = OrderedDict()
+        return self.previous[serial]
+
+    def decode(self,message,offset=0,errors=None):
+        pages = []
+        for header,page_type,page_index,page in iter_engine_pages(message,offset,errors=errors):
+            serial = header.serial
+            previous = self.load(serial) if serial else {}
+            digest = page_digest(page_type,page)
+            if digest in previous:
+                decoded = previous[digest]
+                self.reused += 1
+            else:
+                decoded = jsonable(page.get_data())
+            if serial:
+                self.current[serial].setdefault(str(page_type),OrderedDict())[digest] = decoded
+            pages.append(decoded)
+        return pages
+
+    # Replaces the pages of each request code this run decoded in the
+    # engine's state, keeping those of codes it didn't see, so dumps holding
+    # different sections of the same engine don't wipe each other out. The
+    # state is read again and written under a lock on <serial>.json.lock,
+    # since other workers may be saving the same engine.
+    def save(self):
+        for serial,pages in self.current.items():
+            path = self.state_path(serial)
+            with open(path + '.lock','a') as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(),fcntl.LOCK_EX)
+                saved = read_history_state(path)
+                state = OrderedDict((code,digests) for code,digests in saved.items() if code not in pages)
+                state.update(pages)
+                if (dict((code,set(digests)) for code,digests in state.items()) ==
+                        dict((code,set(digests)) for code,digests in saved.items())):
+                    continue
+                temp_path = '%s.%d.tmp' % (path,os.getpid())
+                with open(temp_path,'w') as f:
+                    f.write(json.dumps(OrderedDict((('version',decode_cache.DECODER_VERSION),('pages',state)))))
+                os.rename(temp_path,path)
+
+# Runs in a worker process; never raises, so one bad dump can't stall the pool
+def extract_file(path,output_dir,state_dir=None,cache_path=None,cache_size=decode_cache.DEFAULT_MAX_BYTES,
+                 resilient=False):
+    start = time.time()
+    history = PageHistory(state_dir) if state_dir else None
+    cache = None
+    try:
+        if cache_path:
+            cache = decode_cache.DecodeCache(cache_path,cache_size)
+        if path.endswith(RAW_EXTENSIONS):
+            destination,num_pages,bad_pages = extract_raw(path,output_dir,history,cache,resilient)
+        else:
+            destination,num_pages,bad_pages = extract_dump(path,output_dir,history,cache,resilient)
+        reused = 0
+        if history is not None:
+            history.save()
+            reused = history.reused
+        return path,destination,num_pages,bad_pages,reused,time.time() - start,None
+    except Exception as e:
+        return path,None,0,0,0,time.time() - start,"%s: %s" % (e.__class__.__name__,e)
+    finally:
+        if cache is not None:
+            cache.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Decode DDEC extraction dumps (base64 JSON or raw .bin) in parallel.")
+    parser.add_argument('paths',nargs='+',help="dump files, directories or glob patterns")
+    parser.add_argument('-o','--output-dir',default='decoded',help="where decoded JSON is written")
+    parser.add_argument('-j','--workers',type=int,default=multiprocessing.cpu_count(),
+                        help="number of worker processes")
+    parser.add_argument('--pattern',action='append',dest='patterns',
+                        help="file pattern used inside directories (default: *.json and *.bin)")
+    parser.add_argument('--state-dir',
+                        help="keep decoded pages per engine serial here and only decode pages that changed")
+    parser.add_argument('--cache',metavar='PATH',help="SQLite file of decoded messages to reuse and add to")
+    parser.add_argument('--cache-size',type=int,default=decode_cache.DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="megabytes the cache may hold before least recently used messages are dropped")
+    parser.add_argument('--resilient',action='store_true',
+                        help="skip pages that can't be decoded, noting them in the output, rather than failing the file")
+    args = parser.parse_args(argv)
+
+    paths = find_dumps(args.paths,args.patterns or ('*.json','*.bin'))
+    if not paths:
+        parser.error("no dump files found")
+    for directory in (args.output_dir,args.state_dir):
+        if directory and not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    cache_before = None
+    if args.cache:
+        cache = decode_cache.DecodeCache(args.cache,args.cache_size * 1024 * 1024)
+        cache_before = cache.stats()
+        cache.close()
+
+    start = time.time()
+    failures = 0
+    total_pages = 0
+    total_reused = 0
+    total_bad = 0
+    pool = multiprocessing.Pool(args.workers)
+    try:
+        work = functools.partial(extract_file,output_dir=args.output_dir,state_dir=args.state_dir,
+                                 cache_path=args.cache,cache_size=args.cache_size * 1024 * 1024,
+                                 resilient=args.resilient)
+        for path,destination,num_pages,bad_pages,reused,elapsed,error in pool.imap_unordered(work,paths):
+            if error is None:
+                total_pages += num_pages
+                total_bad += bad_pages
+                total_reused += reused
+                print("%s: %d pages (%d reused, %d skipped) in %.3fs -> %s" % (
+                    path,num_pages,reused,bad_pages,elapsed,destination))
+            else:
+                failures += 1
+                print("%s: FAILED after %.3fs (%s)" % (path,elapsed,error))
+    finally:
+        pool.close()
+        pool.join()
+    elapsed = time.time() - start
+    print("%d files, %d pages (%d reused, %d skipped), %d failed in %.3fs (%d workers)" % (
+        len(paths),total_pages,total_reused,total_bad,failures,elapsed,args.workers))
+    if args.cache:
+        cache = decode_cache.DecodeCache(args.cache,args.cache_size * 1024 * 1024)
+        stats = cache.stats()
+        cache.close()
+        print("cache: %d hits, %d misses, %d evicted, %d messages in %.1f MB" % (
+            stats['hits'] - cache_before['hits'],stats['misses'] - cache_before['misses'],
+            stats['evictions'] - cache_before['evictions'],stats['entries'],stats['bytes'] / (1024.0 * 1024)))
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,370 @@
+#!/usr/bin/env python
+import argparse
+import csv
+import functools
+import json
+import multiprocessing
+import os
+import sys
+import time
+from collections import OrderedDict
+
+import data_defs
+import extract
+import fleet_store
+
+PERMANENT = 20
+
+# Life to date counters summed over the engines of a group
+PERMANENT_TOTALS = ('total_distance','total_fuel','total_time','total_idle_fuel','total_idle_time',
+                    'total_cruise_time','parked_dpf_regen_attempts_count','driving_dpf_regen_attempts_count',
+                    'parked_dpf_regen_complete_count','driving_dpf_regen_complete_count')
+
+# Trip page counters summed over the trips of a group
+TRIP_TOTALS = ('trip_distance','trip_fuel','trip_time','idle_fuel','idle_time','cruise_distance','cruise_fuel',
+               'cruise_time','parked_dpf_regeneration_attempts','driving_dpf_regeneration_attempts',
+               'parked_dpf_regeneration_completions','driving_dpf_regeneration_completions')
+
+GROUPS = ('fleet','depot','model')
+
+UNKNOWN = 'unknown'
+
+STATE_VERSION = 1
+
+
+def in_window(timestamp,since=None,until=None):
+    if timestamp is None:
+        return since is None and until is None
+    return (since is None or timestamp >= since) and (until is None or timestamp < until)
+
+def page_totals(page,slugs):
+    return OrderedDict((slug_name,page[slug_name]) for slug_name in slugs if slug_name in page)
+
+def trip_order(item):
+    return str(item[0])
+
+def add_totals(totals,values,sign=1):
+    for slug_name,value in values.items():
+        totals[slug_name] = totals.get(slug_name,0) + sign * value
+
+
+# Permanent and Trip counters of many extractions, reduced to what a fleet
+# report needs and nothing more, so one can be built per worker, per shard or
+# per run and merged with any other in any order:
+#   engines: serial -> first and last Permanent snapshot, (extraction time,
+#            counters), and the depot its latest dump was filed under
+#   trips:   (serial, request code, trip start) -> (extraction time, counters)
+#            of the latest pull of that trip, since ECMs hand back the same
+#            trips, still running or not, on every pull. Trips whose page
+#            leaves out the start time are keyed by page digest instead.
+#   sources: path -> (size, mtime) of each dump file added, so incremental
+#            runs can leave out files they have already seen
+# Only extractions (and trips) from since up to until are taken. Counters
+# are in units, as for data_defs.Layout.
+class FleetAggregate(object):
+    def __init__(self,units=None,since=None,until=None):
+        self.units = units
+        self.since = since
+        self.until = until
+        self.engines = {}
+        self.trips = {}
+        self.sources = {}
+
+    def add_permanent(self,serial,extraction_time,counters):
+        engine = self.engines.setdefault(serial,{'first':None,'last':None,'depot':None})
+        snapshot = (extraction_time,counters)
+        if engine['first'] is None or extraction_time < engine['first'][0]:
+            engine['first'] = snapshot
+        if engine['last'] is None or extraction_time >= engine['last'][0]:
+            engine['last'] = snapshot
+
+    def add_depot(self,serial,extraction_time,depot):
+        engine = self.engines.setdefault(serial,{'first':None,'last':None,'depot':None})
+        if engine['depot'] is None or extraction_time >= engine['depot'][0]:
+            engine['depot'] = (extraction_time,depot)
+
+    def add_trip(self,serial,request_code,trip_start,extraction_time,counters):
+        key = (serial,request_code,trip_start)
+        seen = self.trips.get(key)
+        if seen is None or extraction_time >= seen[0]:
+            self.trips[key] = (extraction_time,counters)
+
+    # Returns the number of Permanent and Trip page instances taken. errors
+    # is as for data_defs.iter_pages.
+    def add_message(self,message,offset=0,depot=None,errors=None):
+        added = 0
+        for header,page_type,page_index,page in extract.iter_engine_pages(message,offset,units=self.units,
+                                                                          errors=errors):
+            serial,extraction_time = header.serial,header.extraction_time
+            if page is header.page:
+                if not in_window(extraction_time,self.since,self.until):
+                    return 0
+                if depot is not None:
+                    self.add_depot(serial,extraction_time or 0,depot)
+            elif page_type == PERMANENT:
+                self.add_permanent(serial,extraction_time or 0,page_totals(page,PERMANENT_TOTALS))
+                added += 1
+            elif page_type in fleet_store.TRIP_CODES:
+                trip_start = page.get('trip_start_time_stamp')
+                if not in_window(trip_start,self.since,self.until):
+                    continue
+                if trip_start is None:
+                    trip_start = extract.page_digest(page_type,page)
+                self.add_trip(serial,page_type,trip_start,extraction_time or 0,page_totals(page,TRIP_TOTALS))
+                added += 1
+        return added
+
+    # Dumps are taken to be filed by depot, one directory each, so the
+    # directory name is the depot unless an engines file says otherwise.
+    # With an errors list, pages and a truncated last message that can't be
+    # decoded are skipped, as for data_defs.iter_pages.
+    def add_path(self,path,errors=None):
+        stat = os.stat(path)
+        depot = os.path.basename(os.path.dirname(os.path.abspath(path)))
+        added = 0
+        for source,message,offset in extract.iter_messages([path],errors is not None):
+            added += self.add_message(message,offset,depot,errors)
+        self.sources[path] = (stat.st_size,stat.st_mtime)
+        return added
+
+    def is_current(self,path):
+        stat = os.stat(path)
+        return tuple(self.sources.get(path,())) == (stat.st_size,stat.st_mtime)
+
+    def merge(self,other):
+        if (other.units,other.since,other.until) != (self.units,self.since,self.until):
+            raise ValueError("can't merge aggregates of different units or time windows")
+        for serial,engine in other.engines.items():
+            if engine['first'] is not None:
+                self.add_permanent(serial,*engine['first'])
+                self.add_permanent(serial,*engine['last'])
+            if engine['depot'] is not None:
+                self.add_depot(serial,*engine['depot'])
+        for (serial,request_code,trip_start),(extraction_time,counters) in other.trips.items():
+            self.add_trip(serial,request_code,trip_start,extraction_time,counters)
+        self.sources.update(other.sources)
+        return self
+
+    def as_dict(self):
+        return OrderedDict([
+            ('version',STATE_VERSION),
+            ('units',self.units),
+            ('since',self.since),
+            ('until',self.until),
+            ('engines',OrderedDict((serial,self.engines[serial]) for serial in sorted(self.engines,key=str))),
+            ('trips',[list(key) + list(value) for key,value in sorted(self.trips.items(),key=trip_order)]),
+            ('sources',OrderedDict(sorted(self.sources.items()))),
+            ])
+
+    @classmethod
+    def from_dict(cls,state):
+        if state.get('version') != STATE_VERSION:
+            raise ValueError("unsupported aggregate state version %r" % state.get('version'))
+        aggregate = cls(state['units'],state['since'],state['until'])
+        for serial,engine in state['engines'].items():
+            aggregate.engines[serial] = dict((name,tuple(value) if value is not None else None)
+                                             for name,value in engine.items())
+        for serial,request_code,trip_start,extraction_time,counters in state['trips']:
+            aggregate.trips[(serial,request_code,trip_start)] = (extraction_time,counters)
+        aggregate.sources = dict((path,tuple(stat)) for path,stat in state['sources'].items())
+        return aggregate
+
+    def save(self,path):
+        temporary = path + '.tmp'
+        with open(temporary,'w') as f:
+            json.dump(self.as_dict(),f)
+        os.rename(temporary,path)
+
+    @classmethod
+    def load(cls,path):
+        with open(path) as f:
+            return cls.from_dict(json.load(f,object_pairs_hook=OrderedDict))
+
+    # group kind -> group name -> totals:
+    #   engines:   engines in the group
+    #   lifetime:  the latest Permanent counters, summed
+    #   period:    how far those went from the first to the latest extraction
+    #              in the window, summed; an engine whose counters went
+    #              backwards (a replaced ECM) counts its latest ones
+    #   trips:     request code -> number of trips and their summed counters
+    # labels maps a serial to its fleet, depot and model (see read_engines);
+    # the depot falls back to the dump directory, everything else to unknown.
+    def summary(self,labels=None):
+        labels = labels or {}
+        engine_groups = {}
+        serials = set(self.engines) | set(serial for serial,request_code,trip_start in self.trips)
+        for serial in serials:
+            engine = self.engines.get(serial,{})
+            known = labels.get(serial,{})
+            depot = engine.get('depot')
+            engine_groups[serial] = [(kind,known.get(kind) or (depot[1] if kind == 'depot' and depot else UNKNOWN))
+                                     for kind in GROUPS]
+        summary = OrderedDict((kind,OrderedDict()) for kind in GROUPS)
+
+        def totals_for(serial):
+            for kind,name in engine_groups[serial]:
+                totals = summary[kind].get(name)
+                if totals is None:
+                    totals = summary[kind][name] = OrderedDict([('engines',0),('lifetime',OrderedDict()),
+                                                                 ('period',OrderedDict()),('trips',OrderedDict())])
+                yield totals
+
+        for serial in sorted(serials,key=str):
+            engine = self.engines.get(serial,{})
+            first,last = engine.get('first'),engine.get('last')
+            for totals in totals_for(serial):
+                totals['engines'] += 1
+                if last is None:
+                    continue
+                add_totals(totals['lifetime'],last[1])
+                for slug_name,value in last[1].items():
+                    start = first[1].get(slug_name,value)
+                    totals['period'][slug_name] = totals['period'].get(slug_name,0) + (
+                        value - start if value >= start else value)
+        # In key order, so float sums come out the same however the
+        # aggregate was merged together
+        for (serial,request_code,trip_start),(extraction_time,counters) in sorted(self.trips.items(),key=trip_order):
+            for totals in totals_for(serial):
+                trips = totals['trips'].setdefault(request_code,OrderedDict([('count',0)]))
+                trips['count'] += 1
+                add_totals(trips,counters)
+        for kind in GROUPS:
+            summary[kind] = OrderedDict(sorted(summary[kind].items()))
+            for totals in summary[kind].values():
+                totals['trips'] = OrderedDict(sorted(totals['trips'].items()))
+        return summary
+
+
+# serial -> {fleet, depot, model} from a CSV file with a header row naming a
+# serial column and any of those
+def read_engines(path):
+    labels = {}
+    with open(path) as f:
+        for row in csv.DictReader(f):
+            serial = (row.get('serial') or '').strip()
+            if serial:
+                labels[serial] = dict((kind,row[kind].strip()) for kind in GROUPS if row.get(kind))
+    return labels
+
+# Worker side of the pool: the aggregate of one dump file, or the error.
+# A worker that exits never hands back a result and the pool would wait on
+# it for good, so SystemExit is caught as well.
+def aggregate_file(path,units=None,since=None,until=None,resilient=False):
+    start = time.time()
+    aggregate = FleetAggregate(units,since,until)
+    errors = [] if resilient else None
+    try:
+        added = aggregate.add_path(path,errors)
+        error = None
+    except (Exception,SystemExit) as e:
+        added = 0
+        error = '%s: %s' % (e.__class__.__name__,e)
+    return path,aggregate,added,len(errors or ()),time.time() - start,error
+
+# Runs aggregate_file over paths in a pool of workers, merging each file's
+# aggregate into aggregate as it comes back. Returns (pages, skipped pages,
+# failures).
+def aggregate_paths(aggregate,paths,workers=None,verbose=False,resilient=False):
+    pages = 0
+    skipped = 0
+    failures = 0
+    work = functools.partial(aggregate_file,units=aggregate.units,since=aggregate.since,until=aggregate.until,
+                             resilient=resilient)
+    pool = multiprocessing.Pool(workers or multiprocessing.cpu_count())
+    try:
+        for path,partial,added,bad_pages,elapsed,error in pool.imap_unordered(work,paths):
+            if error is None:
+                aggregate.merge(partial)
+                pages += added
+                skipped += bad_pages
+                if verbose:
+                    print("%s: %d pages (%d skipped) in %.3fs" % (path,added,bad_pages,elapsed))
+            else:
+                failures += 1
+                print("%s: FAILED after %.3fs (%s)" % (path,elapsed,error))
+    finally:
+        pool.close()
+        pool.join()
+    return pages,skipped,failures
+
+
+def format_summary(summary):
+    lines = []
+    for kind,groups in summary.items():
+        for name,totals in groups.items():
+            lines.append("%s %s: %d engines" % (kind,name,totals['engines']))
+            for section in ('lifetime','period'):
+                if totals[section]:
+                    lines.append("  %s: %s" % (section,', '.join('%s %.10g' % item for item in totals[section].items())))
+            for request_code,trips in totals['trips'].items():
+                lines.append("  trips (request code %d): %s" % (
+                    request_code,', '.join('%s %.10g' % item for item in trips.items())))
+    return '\n'.join(lines)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Fleet, depot and model totals of the Permanent and Trip counters in DDEC extraction dumps.")
+    parser.add_argument('paths',nargs='*',help="dump files, directories or glob patterns")
+    parser.add_argument('-j','--workers',type=int,default=multiprocessing.cpu_count(),
+                        help="number of worker processes")
+    parser.add_argument('--engines',metavar='CSV',
+                        help="serial,fleet,depot,model per engine (depot defaults to the dump's directory)")
+    parser.add_argument('--state',metavar='PATH',
+                        help="aggregate to start from if it exists, and to save to; files it already has are skipped")
+    parser.add_argument('--merge',metavar='PATH',action='append',default=[],
+                        help="also merge in an aggregate saved by another run or shard")
+    parser.add_argument('--shard',metavar='K/N',help="only take every Nth file, starting from the Kth (0 based)")
+    parser.add_argument('--since',type=int,help="only extractions and trips from this ECM timestamp on")
+    parser.add_argument('--until',type=int,help="only extractions and trips before this ECM timestamp")
+    parser.add_argument('--units',choices=sorted(data_defs.UNIT_SYSTEMS),help="convert counters")
+    parser.add_argument('-o','--output',help="JSON file to write the summary to")
+    parser.add_argument('--resilient',action='store_true',
+                        help="skip pages that can't be decoded rather than failing the file")
+    parser.add_argument('-v','--verbose',action='store_true',help="print a line per file")
+    args = parser.parse_args(argv)
+
+    paths = extract.find_dumps(args.paths) if args.paths else []
+    if args.paths and not paths:
+        parser.error("no dump files found")
+    if args.shard:
+        try:
+            shard,num_shards = [int(part) for part in args.shard.split('/')]
+        except ValueError:
+            parser.error("--shard takes K/N, e.g. 0/4")
+        if not 0 <= shard < num_shards:
+            parser.error("--shard K must be from 0 to N-1")
+        paths = paths[shard::num_shards]
+
+    if args.state and os.path.exists(args.state):
+        aggregate = FleetAggregate.load(args.state)
+        if (aggregate.units,aggregate.since,aggregate.until) != (args.units,args.since,args.until):
+            parser.error("%s was built with other --units, --since or --until" % args.state)
+    else:
+        aggregate = FleetAggregate(args.units,args.since,args.until)
+    try:
+        for path in args.merge:
+            aggregate.merge(FleetAggregate.load(path))
+    except ValueError as e:
+        parser.error(str(e))
+
+    new_paths = [path for path in paths if not aggregate.is_current(path)]
+    start = time.time()
+    pages,skipped,failures = (aggregate_paths(aggregate,new_paths,args.workers,args.verbose,args.resilient)
+                              if new_paths else (0,0,0))
+    elapsed = time.time() - start
+    print("%d files (%d already aggregated), %d pages (%d skipped), %d failed in %.3fs (%d workers)" % (
+        len(paths),len(paths) - len(new_paths),pages,skipped,failures,elapsed,args.workers))
+    if args.state:
+        aggregate.save(args.state)
+
+    summary = aggregate.summary(read_engines(args.engines) if args.engines else None)
+    print("%d engines, %d trips" % (len(aggregate.engines),len(aggregate.trips)))
+    print(format_summary(summary))
+    if args.output:
+        with open(args.output,'w') as f:
+            json.dump(summary,f,indent=2)
+        print("wrote %s" % args.output)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,169 @@
+#!/usr/bin/env python
+import argparse
+import json
+import sqlite3
+import sys
+from collections import OrderedDict
+
+import data_defs
+import extract
+
+HARD_BRAKE = 2
+INCIDENT_CODES = tuple(sorted(code for code,page_class in data_defs.request_codes.items()
+                              if page_class is data_defs.Incident))
+TRIP_CODES = tuple(sorted(code for code,page_class in data_defs.request_codes.items()
+                          if page_class is data_defs.Trip))
+
+COLUMNS = ('serial','extraction_time','request_code','page_name','page_index',
+           'incident_timestamp','trip_start_timestamp','source')
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS pages (
+    id INTEGER PRIMARY KEY,
+    serial TEXT,
+    extraction_time INTEGER,
+    request_code INTEGER NOT NULL,
+    page_name TEXT NOT NULL,
+    page_index INTEGER NOT NULL,
+    incident_timestamp INTEGER,
+    trip_start_timestamp INTEGER,
+    source TEXT,
+    digest TEXT NOT NULL,
+    data TEXT NOT NULL,
+    UNIQUE (serial,digest)
+);
+-- UNIQUE lets rows without a serial repeat, since NULLs are all distinct,
+-- so those are deduplicated by this index instead (after dropping any
+-- repeats an older store may have let in)
+DELETE FROM pages WHERE serial IS NULL AND id NOT IN (
+    SELECT MIN(id) FROM pages WHERE serial IS NULL GROUP BY digest);
+CREATE UNIQUE INDEX IF NOT EXISTS pages_serial_digest ON pages (COALESCE(serial,''),digest);
+CREATE INDEX IF NOT EXISTS pages_request_code ON pages (request_code);
+CREATE INDEX IF NOT EXISTS pages_extraction ON pages (serial,extraction_time);
+CREATE INDEX IF NOT EXISTS pages_incident ON pages (serial,request_code,incident_timestamp);
+CREATE INDEX IF NOT EXISTS pages_incident_time ON pages (incident_timestamp);
+CREATE INDEX IF NOT EXISTS pages_trip_start ON pages (serial,trip_start_timestamp);
+CREATE INDEX IF NOT EXISTS pages_trip_start_time ON pages (trip_start_timestamp);
+'''
+
+
+# Incident pages carry two timestamps, one on each side of the sample block.
+# The later one is 60s into a 75 sample hard brake record, i.e. the moment of
+# the incident, so that's the one indexed.
+def incident_timestamp(page):
+    timestamps = page.get('timestamp')
+    if isinstance(timestamps,list):
+        return timestamps[-1]
+    return timestamps
+
+def page_values(page):
+    return OrderedDict((slug_name,page[slug_name]) for slug_name in page)
+
+
+# Decoded pages of many extractions in SQLite, one row per page instance with
+# its values as JSON, indexed by engine serial, extraction time, request code
+# and the Incident and Trip timestamps. Timestamps are the ECM's own, seconds
+# since 1970. ECMs hand back the same incidents and trips on every pull until
+# they are overwritten, so a page is only stored once per serial, under the
+# first extraction it was seen in.
+class FleetStore(object):
+    def __init__(self,path):
+        self.path = path
+        self.db = sqlite3.connect(path)
+        self.db.executescript(SCHEMA)
+
+    # Adds the pages of one message; returns how many were new
+    def add_message(self,message,offset=0,source=None):
+        header = extract.NO_HEADER
+        rows = []
+        for header,page_type,page_index,page in extract.iter_engine_pages(message,offset):
+            page_class = data_defs.request_codes[page_type]
+            rows.append([page_type,page.layout.name,page_index,
+                         incident_timestamp(page) if page_class is data_defs.Incident else None,
+                         page.get('trip_start_time_stamp'),source,extract.page_digest(page_type,page),
+                         json.dumps(page_values(page))])
+        serial,extraction_time = header.serial,header.extraction_time
+        before = self.db.total_changes
+        self.db.executemany('INSERT OR IGNORE INTO pages (serial,extraction_time,request_code,page_name,page_index,'
+                            'incident_timestamp,trip_start_timestamp,source,digest,data) '
+                            'VALUES (?,?,?,?,?,?,?,?,?,?)',
+                            [[serial,extraction_time] + row for row in rows])
+        return self.db.total_changes - before
+
+    def add_paths(self,paths):
+        added = 0
+        try:
+            for source,message,offset in extract.iter_messages(paths):
+                added += self.add_message(message,offset,source)
+        except:
+            self.db.rollback()
+            raise
+        self.db.commit()
+        return added
+
+    # Rows as dicts, with the page values decoded under 'data'. since and
+    # until bound the given timestamp column (inclusive, exclusive).
+    def query(self,request_codes=None,serial=None,column='extraction_time',since=None,until=None):
+        assert(column in COLUMNS)
+        where = []
+        params = []
+        if serial is not None:
+            where.append('serial = ?')
+            params.append(serial)
+        if request_codes is not None:
+            where.append('request_code IN (%s)' % ','.join('?' * len(request_codes)))
+            params.extend(request_codes)
+        if since is not None:
+            where.append('%s >= ?' % column)
+            params.append(since)
+        if until is not None:
+            where.append('%s < ?' % column)
+            params.append(until)
+        sql = 'SELECT %s,data FROM pages' % ','.join(COLUMNS)
+        if where:
+            sql += ' WHERE ' + ' AND '.join(where)
+        sql += ' ORDER BY %s,id' % column
+        rows = []
+        for row in self.db.execute(sql,params):
+            result = OrderedDict(zip(COLUMNS,row))
+            result['data'] = json.loads(row[-1],object_pairs_hook=OrderedDict)
+            rows.append(result)
+        return rows
+
+    def incidents(self,serial=None,since=None,until=None,request_codes=INCIDENT_CODES):
+        return self.query(request_codes,serial,'incident_timestamp',since,until)
+
+    def hard_brakes(self,serial=None,since=None,until=None):
+        return self.incidents(serial,since,until,(HARD_BRAKE,))
+
+    def trips(self,serial=None,since=None,until=None):
+        return self.query(TRIP_CODES,serial,'trip_start_timestamp',since,until)
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load decoded pages of DDEC extraction dumps into an SQLite fleet store.")
+    parser.add_argument('database',help="SQLite file, created if missing")
+    parser.add_argument('paths',nargs='+',help="dump files, directories or glob patterns")
+    args = parser.parse_args(argv)
+
+    paths = extract.find_dumps(args.paths)
+    if not paths:
+        parser.error("no dump files found")
+    store = FleetStore(args.database)
+    try:
+        for path in paths:
+            try:
+                print("%s: %d new pages" % (path,store.add_paths([path])))
+            except Exception as e:
+                print("%s: FAILED (%s: %s)" % (path,e.__class__.__name__,e))
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
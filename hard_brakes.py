@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+import argparse
+import csv
+import sys
+from collections import OrderedDict
+
+import numpy
+
+import data_defs
+import extract
+import fleet_store
+
+CHANNELS = ('road_speed','engine_speed','engine_load','throttle','cruise_mode')
+
+# Samples are a second apart, and the later of an incident's two timestamps
+# is when it was triggered, so the gap between them gives the trigger sample
+SAMPLE_SECONDS = 1
+
+# Samples of road speed before the trigger kept as the pre-event profile
+PRE_EVENT_SAMPLES = 60
+
+# Road speed at or below which the vehicle counts as stopped
+STOP_SPEED = 1.0
+
+SUMMARY_COLUMNS = ('serial','timestamp','peak_deceleration','peak_sample','trigger_sample','onset_sample',
+                   'onset_speed','onset_throttle','onset_engine_load','onset_engine_speed','time_to_stop',
+                   'pre_event_mean_speed','pre_event_max_speed','deceleration_limit','exceeds_limit')
+
+
+# Hard brake incidents of many extractions gathered into arrays with a row
+# per incident, decoded a page at a time by Layout.get_arrays. Each incident
+# is matched with the hard brake deceleration limit from the latest
+# ConfigurationData page seen for its engine, in whichever message that came.
+# units are as for data_defs.Layout, and apply to the limits too.
+class HardBrakes(object):
+    def __init__(self,units=None,request_code=fleet_store.HARD_BRAKE):
+        self.units = units
+        self.request_code = request_code
+        self.parts = OrderedDict((name,[]) for name in ('serial','timestamp','valid_sample_count') + CHANNELS)
+        self.limits = {}
+
+    def add_message(self,message,offset=0):
+        header = extract.NO_HEADER
+        for header,page_type,page_index,page in extract.iter_engine_pages(message,offset,units=self.units):
+            if (data_defs.request_codes[page_type] is data_defs.ConfigurationData and
+                    'hard_brake_deceleration_limit' in page):
+                extract.keep_latest(self.limits,header.serial,header.extraction_time,
+                                    page['hard_brake_deceleration_limit'])
+        serial = header.serial
+        added = 0
+        for page_type,page_name,arrays in data_defs.iter_page_arrays(message,offset,units=self.units,
+                                                                     request_codes=(self.request_code,)):
+            if 'road_speed' not in arrays or 'timestamp' not in arrays:
+                continue
+            count,num_samples = arrays['road_speed'].shape
+            self.parts['serial'].append(numpy.array([serial] * count,dtype=object))
+            self.parts['timestamp'].append(arrays['timestamp'])
+            self.parts['valid_sample_count'].append(arrays.get('valid_sample_count',numpy.full(count,num_samples)))
+            for channel in CHANNELS:
+                self.parts[channel].append(arrays.get(channel,numpy.full((count,num_samples),numpy.nan)))
+            added += count
+        return added
+
+    def add_paths(self,paths):
+        added = 0
+        for source,message,offset in extract.iter_messages(paths):
+            added += self.add_message(message,offset)
+        return added
+
+    # {name: array} over every incident added so far. ECMs hand back the same
+    # incidents on every pull until they are overwritten, so unless all is
+    # set an incident is only kept the first time its engine and trigger
+    # time are seen.
+    def arrays(self,all=False):
+        arrays = OrderedDict()
+        for name,parts in self.parts.items():
+            if parts:
+                arrays[name] = numpy.concatenate(parts)
+            elif name == 'serial':
+                arrays[name] = numpy.zeros(0,dtype=object)
+            else:
+                arrays[name] = numpy.zeros((0,2) if name == 'timestamp' else 0)
+        if not all:
+            first = OrderedDict()
+            for index,key in enumerate(zip(arrays['serial'],arrays['timestamp'][:,-1].tolist())):
+                first.setdefault(key,index)
+            keep = numpy.array(list(first.values()),dtype=int)
+            for name in arrays:
+                arrays[name] = arrays[name][keep]
+        limits = dict((serial,limit) for serial,(extraction_time,limit) in self.limits.items())
+        arrays['deceleration_limit'] = numpy.array([limits.get(serial,numpy.nan) for serial in arrays['serial']],
+                                                   dtype=float)
+        return arrays
+
+
+# Per incident measures, computed for all incidents at once. Deceleration is
+# the drop in road speed per second, so it is in the speed's units per
+# second, as the ECM's limit is. Brake onset is the last sample at or before
+# the trigger where speed wasn't falling, and throttle, load and engine speed
+# are taken there. Samples past valid_sample_count are ignored, and measures
+# that can't be had (no stop within the record, no limit for the engine) are
+# NaN.
+def analyze(arrays):
+    count = len(arrays['serial'])
+    if not count:
+        return OrderedDict((name,numpy.zeros((0,PRE_EVENT_SAMPLES) if name == 'pre_event_speed' else 0))
+                           for name in SUMMARY_COLUMNS + ('pre_event_speed',))
+    speed = numpy.asarray(arrays['road_speed'],dtype=float)
+    num_samples = speed.shape[1]
+    rows = numpy.arange(count)
+    samples = numpy.arange(num_samples)
+    valid = samples[None,:] < numpy.asarray(arrays['valid_sample_count'])[:,None]
+    timestamps = numpy.asarray(arrays['timestamp'])
+    trigger = numpy.clip((timestamps[:,-1] - timestamps[:,0]) // SAMPLE_SECONDS,0,num_samples - 1).astype(int)
+
+    deceleration = numpy.zeros((count,num_samples))
+    deceleration[:,1:] = (speed[:,:-1] - speed[:,1:]) / float(SAMPLE_SECONDS)
+    measured = valid.copy()
+    measured[:,0] = False
+    masked = numpy.where(measured,deceleration,-numpy.inf)
+    peak_sample = masked.argmax(axis=1)
+    peak = masked[rows,peak_sample]
+    peak[~numpy.isfinite(peak)] = numpy.nan
+
+    steady = ~(deceleration > 0) & (samples[None,:] <= trigger[:,None])
+    onset = num_samples - 1 - steady[:,::-1].argmax(axis=1)
+
+    stopped = (speed <= STOP_SPEED) & valid & (samples[None,:] >= onset[:,None])
+    time_to_stop = numpy.where(stopped.any(axis=1),(stopped.argmax(axis=1) - onset) * SAMPLE_SECONDS,numpy.nan)
+
+    columns = trigger[:,None] - PRE_EVENT_SAMPLES + numpy.arange(PRE_EVENT_SAMPLES)[None,:]
+    inside = columns >= 0
+    columns = numpy.clip(columns,0,None)
+    inside &= valid[rows[:,None],columns]
+    profile = numpy.where(inside,speed[rows[:,None],columns],numpy.nan)
+    num_inside = inside.sum(axis=1)
+    pre_event_mean = numpy.where(inside,profile,0).sum(axis=1) / numpy.maximum(num_inside,1)
+    pre_event_max = numpy.where(inside,profile,-numpy.inf).max(axis=1)
+    pre_event_mean[num_inside == 0] = numpy.nan
+    pre_event_max[num_inside == 0] = numpy.nan
+
+    def at_onset(channel):
+        return numpy.asarray(arrays[channel],dtype=float)[rows,onset]
+
+    limit = numpy.asarray(arrays['deceleration_limit'],dtype=float)
+    return OrderedDict([
+        ('serial',arrays['serial']),
+        ('timestamp',timestamps[:,-1]),
+        ('peak_deceleration',peak),
+        ('peak_sample',peak_sample),
+        ('trigger_sample',trigger),
+        ('onset_sample',onset),
+        ('onset_speed',at_onset('road_speed')),
+        ('onset_throttle',at_onset('throttle')),
+        ('onset_engine_load',at_onset('engine_load')),
+        ('onset_engine_speed',at_onset('engine_speed')),
+        ('time_to_stop',time_to_stop),
+        ('pre_event_mean_speed',pre_event_mean),
+        ('pre_event_max_speed',pre_event_max),
+        ('deceleration_limit',limit),
+        ('exceeds_limit',peak >= limit),
+        ('pre_event_speed',profile),
+        ])
+
+def write_csv(path,results):
+    with open(path,'w') as f:
+        writer = csv.writer(f)
+        writer.writerow(SUMMARY_COLUMNS)
+        for row in zip(*[results[name] for name in SUMMARY_COLUMNS]):
+            writer.writerow([value.item() if hasattr(value,'item') else value for value in row])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hard brake deceleration measures from the Incident pages of DDEC extraction dumps.")
+    parser.add_argument('paths',nargs='+',help="dump files, directories or glob patterns")
+    parser.add_argument('-o','--output',help="CSV file to write a row per incident to")
+    parser.add_argument('--units',choices=sorted(data_defs.UNIT_SYSTEMS),help="convert speeds before measuring")
+    args = parser.parse_args(argv)
+
+    paths = extract.find_dumps(args.paths)
+    if not paths:
+        parser.error("no dump files found")
+    hard_brakes = HardBrakes(args.units)
+    hard_brakes.add_paths(paths)
+    results = analyze(hard_brakes.arrays())
+    count = len(results['serial'])
+    print("%d hard brakes from %d engines, %d over their ECM's deceleration limit" % (
+        count,len(set(results['serial'])),results['exceeds_limit'].sum()))
+    if count:
+        print("peak deceleration: median %.1f, max %.1f per second; median time to stop %.0fs" % (
+            numpy.nanmedian(results['peak_deceleration']),numpy.nanmax(results['peak_deceleration']),
+            numpy.nanmedian(results['time_to_stop']) if numpy.isfinite(results['time_to_stop']).any() else numpy.nan))
+    if args.output:
+        write_csv(args.output,results)
+        print("wrote %s" % args.output)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,34 @@
+#!/usr/bin/env python
+# Regenerates slugs.py, the precomputed slug for every parameter and subpage
+# name in data_defs, so that decoding never has to import slugify.
+import os
+import sys
+
+import data_defs
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def collect_names():
+    names = set()
+    for page_class in set(data_defs.request_codes.values()):
+        for subpage in page_class.subpages:
+            names.add(subpage.name)
+            for param in subpage.param_list:
+                names.add(param.name)
+    return sorted(names)
+
+def main():
+    destination = os.path.join(HERE,'slugs.py')
+    with open(destination,'w') as f:
+        f.write("# Generated by make_slugs.py from the names in data_defs.py; do not edit.\n")
+        f.write("SLUGS = {\n")
+        for name in collect_names():
+            f.write("    %r: %r,\n" % (str(name),str(data_defs.slugify(data_defs.text_type(name)))))
+        f.write("}\n")
+    print("wrote %s" % destination)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
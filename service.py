@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# Long running decode service, so depots' uploads don't each pay for a fresh
+# interpreter. Needs Python 3 (asyncio).
+#
+#   POST /decode   body is a base64 JSON dump or a raw extraction; the reply
+#                  is NDJSON, one line per dump section or raw message, in the
+#                  order they appear, written as soon as each is decoded
+#   GET /stats     counters as JSON
+#
+# Backpressure is explicit at every stage: past --max-uploads concurrent
+# uploads new ones get 503 with Retry-After, at most --max-pending messages
+# are queued to the executor across all uploads, each upload has at most
+# --window messages decoded ahead of what its client has read, and writes
+# wait for the client to drain.
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import io
+import json
+import multiprocessing
+import os
+import signal
+import struct
+import sys
+from collections import OrderedDict
+
+import data_defs
+import dump_reader
+import extract
+
+MAX_BODY = 64 * 1024 * 1024
+
+REASONS = {
+    200:'OK',
+    400:'Bad Request',
+    404:'Not Found',
+    405:'Method Not Allowed',
+    411:'Length Required',
+    413:'Payload Too Large',
+    503:'Service Unavailable',
+    }
+
+
+# Runs in the executor
+def decode_message(message,resilient=False):
+    return extract.decode_message(message,0,resilient=resilient)
+
+# (key, message) for each section of a dump or message of a raw extraction.
+# Anything that isn't a dump or raw messages raises ValueError (or
+# struct.error), as DumpReader does for JSON of any other shape.
+def iter_upload(body,content_type,resilient=False):
+    if 'json' in content_type or body[:1] == b'{':
+        # The reader reuses its buffer, and messages are decoded later on
+        for key,message in dump_reader.DumpReader(io.BytesIO(body)):
+            yield ('section',key),bytes(message)
+    else:
+        for offset in extract.iter_raw_messages(body,resilient):
+            try:
+                length = data_defs.message_length(body,offset)
+            except struct.error:
+                length = len(body) - offset
+            yield ('offset',offset),body[offset:offset + length]
+
+
+class DecodeService(object):
+    def __init__(self,executor,max_uploads=16,max_pending=64,window=8,max_body=MAX_BODY,resilient=False):
+        self.executor = executor
+        self.resilient = resilient
+        self.max_uploads = max_uploads
+        self.window = window
+        self.max_body = max_body
+        self.pending = asyncio.Semaphore(max_pending)
+        self.stats = OrderedDict((name,0) for name in (
+            'active_uploads','uploads','rejected','messages','errors'))
+
+    async def handle(self,reader,writer):
+        try:
+            await self.handle_request(reader,writer)
+        except (ConnectionError,asyncio.IncompleteReadError,asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    async def handle_request(self,reader,writer):
+        request_line = await reader.readline()
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n',b'\n',b''):
+                break
+            name,_,value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        try:
+            method,path,version = request_line.decode('latin-1').split()
+        except ValueError:
+            return await self.respond(writer,400,{'error':'malformed request line'})
+
+        if path == '/stats':
+            return await self.respond(writer,200,self.stats)
+        if path != '/decode':
+            return await self.respond(writer,404,{'error':'no such path'})
+        if method != 'POST':
+            return await self.respond(writer,405,{'error':'use POST'})
+        if 'content-length' not in headers:
+            return await self.respond(writer,411,{'error':'Content-Length is required'})
+        try:
+            length = int(headers['content-length'])
+        except ValueError:
+            length = -1
+        if length < 0:
+            return await self.respond(writer,400,{'error':'Content-Length must be a number of bytes'})
+        if length > self.max_body:
+            return await self.respond(writer,413,{'error':'upload is over %d bytes' % self.max_body})
+        if self.stats['active_uploads'] >= self.max_uploads:
+            self.stats['rejected'] += 1
+            return await self.respond(writer,503,{'error':'too many uploads in progress'},[('Retry-After','1')])
+
+        self.stats['active_uploads'] += 1
+        self.stats['uploads'] += 1
+        try:
+            body = await reader.readexactly(length)
+            await self.stream_decoded(writer,body,headers.get('content-type',''))
+        finally:
+            self.stats['active_uploads'] -= 1
+
+    async def stream_decoded(self,writer,body,content_type):
+        loop = asyncio.get_running_loop()
+        self.start_response(writer,200,'application/x-ndjson',[('Transfer-Encoding','chunked')])
+        in_flight = collections.deque()
+        try:
+            for (label,key),message in iter_upload(body,content_type,self.resilient):
+                await self.pending.acquire()
+                future = loop.run_in_executor(self.executor,decode_message,message,self.resilient)
+                future.add_done_callback(lambda future: self.pending.release())
+                in_flight.append((label,key,future))
+                if len(in_flight) >= self.window:
+                    await self.write_result(writer,*in_flight.popleft())
+        except (ValueError,struct.error) as e:
+            in_flight.append(('upload',None,self.failed(e)))
+        while in_flight:
+            await self.write_result(writer,*in_flight.popleft())
+        writer.write(b'0\r\n\r\n')
+        await writer.drain()
+
+    def failed(self,error):
+        future = asyncio.get_running_loop().create_future()
+        future.set_exception(error)
+        return future
+
+    async def write_result(self,writer,label,key,future):
+        line = OrderedDict([(label,key)])
+        try:
+            line['pages'] = await future
+            self.stats['messages'] += 1
+        except Exception as e:
+            line['error'] = "%s: %s" % (e.__class__.__name__,e)
+            self.stats['errors'] += 1
+        chunk = (json.dumps(line) + '\n').encode('utf-8')
+        writer.write(b'%x\r\n' % len(chunk) + chunk + b'\r\n')
+        await writer.drain()
+
+    def start_response(self,writer,status,content_type,extra_headers=()):
+        headers = [('Content-Type',content_type),('Connection','close')] + list(extra_headers)
+        lines = ['HTTP/1.1 %d %s' % (status,REASONS[status])] + ['%s: %s' % header for header in headers]
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1'))
+
+    async def respond(self,writer,status,body,extra_headers=()):
+        content = json.dumps(body).encode('utf-8')
+        self.start_response(writer,status,'application/json',
+                            [('Content-Length',str(len(content)))] + list(extra_headers))
+        writer.write(content)
+        await writer.drain()
+
+
+def make_executor(workers,threads=False):
+    if threads:
+        return concurrent.futures.ThreadPoolExecutor(workers)
+    return concurrent.futures.ProcessPoolExecutor(workers)
+
+async def serve(args):
+    executor = make_executor(args.workers,args.threads)
+    service = DecodeService(executor,args.max_uploads,args.max_pending,args.window,args.max_body,args.resilient)
+    if args.unix:
+        server = await asyncio.start_unix_server(service.handle,args.unix)
+        where = args.unix
+    else:
+        server = await asyncio.start_server(service.handle,args.host,args.port)
+        where = '%s:%d' % (args.host,args.port)
+    print("decoding on %s with %d %s" % (where,args.workers,'threads' if args.threads else 'processes'))
+    # Left to the default, SIGTERM would kill this process without shutting
+    # down the decoding processes, which hold on to the listening socket
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM,asyncio.current_task().cancel)
+    except NotImplementedError:
+        pass
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        executor.shutdown()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve DDEC extraction decoding over HTTP or a Unix socket.")
+    parser.add_argument('--host',default='127.0.0.1')
+    parser.add_argument('--port',type=int,default=8587)
+    parser.add_argument('--unix',metavar='PATH',help="listen on this Unix socket instead of TCP")
+    parser.add_argument('-j','--workers',type=int,default=multiprocessing.cpu_count(),help="decoding processes (or threads)")
+    parser.add_argument('--threads',action='store_true',help="decode in threads rather than processes")
+    parser.add_argument('--max-uploads',type=int,default=16,help="concurrent uploads before new ones get 503")
+    parser.add_argument('--max-pending',type=int,default=64,help="messages queued to the executor across all uploads")
+    parser.add_argument('--window',type=int,default=8,help="messages one upload may have decoded ahead of its client")
+    parser.add_argument('--max-body',type=int,default=MAX_BODY,help="largest upload accepted, in bytes")
+    parser.add_argument('--resilient',action='store_true',
+                        help="skip pages that can't be decoded, noting them in the reply, rather than failing the message")
+    args = parser.parse_args(argv)
+    if args.unix and os.path.exists(args.unix):
+        os.unlink(args.unix)
+    try:
+        asyncio.run(serve(args))
+    except (KeyboardInterrupt,asyncio.CancelledError):
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
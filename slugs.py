@@ -0,0 +1,393 @@
+# Generated by make_slugs.py from the names in data_defs.py; do not edit.
+SLUGS = {
+    'AccessTypeSubPage': 'accesstypesubpage',
+    'Acess Type': 'acess_type',
+    'Alarm State': 'alarm_state',
+    'AlarmStateSubPage': 'alarmstatesubpage',
+    'Alert Air Intake Temp': 'alert_air_intake_temp',
+    'Alert Brake State': 'alert_brake_state',
+    'Alert Code': 'alert_code',
+    'Alert Coolant Temp': 'alert_coolant_temp',
+    'Alert Count': 'alert_count',
+    'Alert Cruise Mode': 'alert_cruise_mode',
+    'Alert Engine Load': 'alert_engine_load',
+    'Alert Engine RPM': 'alert_engine_rpm',
+    'Alert Fuel Pressure': 'alert_fuel_pressure',
+    'Alert Fuel Temp': 'alert_fuel_temp',
+    'Alert Oil Pressure': 'alert_oil_pressure',
+    'Alert Oil Temp': 'alert_oil_temp',
+    'Alert Pulse Width': 'alert_pulse_width',
+    'Alert Road Speed': 'alert_road_speed',
+    'Alert Throttle Percent': 'alert_throttle_percent',
+    'Alert Timestamp': 'alert_timestamp',
+    'Alert Turbo Boost Pressure': 'alert_turbo_boost_pressure',
+    'AlertCodeSubPage': 'alertcodesubpage',
+    'AlertCountSubPage': 'alertcountsubpage',
+    'AlertRoadSpeedSubPage': 'alertroadspeedsubpage',
+    'AlertTimeStampSubPage': 'alerttimestampsubpage',
+    'Armed Time': 'armed_time',
+    'Automatic DPF Fuel Volume': 'automatic_dpf_fuel_volume',
+    'BVESubPage': 'bvesubpage',
+    'Battery Time': 'battery_time',
+    'Battery Time 2': 'battery_time_2',
+    'Battery Voltage Maximum RPM Limit': 'battery_voltage_maximum_rpm_limit',
+    'Battery Voltage Minimum RPM Limit': 'battery_voltage_minimum_rpm_limit',
+    'Battery starts - alternative': 'battery_starts_alternative',
+    'Battery starts - continuous run': 'battery_starts_continuous_run',
+    'Battery starts - normal': 'battery_starts_normal',
+    'Boost Pressure Maximum Load Limit': 'boost_pressure_maximum_load_limit',
+    'Boost Pressure Maximum RPM Limit': 'boost_pressure_maximum_rpm_limit',
+    'Boost Pressure Minimum Load Limit': 'boost_pressure_minimum_load_limit',
+    'Boost Pressure Minimum RPM Limit': 'boost_pressure_minimum_rpm_limit',
+    'Brake Count': 'brake_count',
+    'Brake Counts for Speed Bands': 'brake_counts_for_speed_bands',
+    'BrakeCountsSubPage': 'brakecountssubpage',
+    'Braking Velocity Energy': 'braking_velocity_energy',
+    'BreakdownSubPage': 'breakdownsubpage',
+    'Button Feedback Enable': 'button_feedback_enable',
+    'ButtonFeedbackEnableSubPage': 'buttonfeedbackenablesubpage',
+    'CPC Software Version ID': 'cpc_software_version_id',
+    'CPCSoftwareVersionIDSubPage': 'cpcsoftwareversionidsubpage',
+    'Coast Time': 'coast_time',
+    'CoastTimeSubPage': 'coasttimesubpage',
+    'Configuration Checksum': 'configuration_checksum',
+    'Configuration Page Change Timestamp': 'configuration_page_change_timestamp',
+    'ConfigurationPageChangeTimestampDataPage': 'configurationpagechangetimestampdatapage',
+    'ConfigurationPageChecksumSubPage': 'configurationpagechecksumsubpage',
+    'Contiuous Time': 'contiuous_time',
+    'CountsSubPage': 'countssubpage',
+    'Crank Shaft Revolutions': 'crank_shaft_revolutions',
+    'Cruise Distance': 'cruise_distance',
+    'Cruise Fuel': 'cruise_fuel',
+    'Cruise Mode': 'cruise_mode',
+    'Cruise Time': 'cruise_time',
+    'CruiseSubPage': 'cruisesubpage',
+    'Current Driver ID': 'current_driver_id',
+    'Current Engine Hours': 'current_engine_hours',
+    'Current Odometer': 'current_odometer',
+    'CurrentOdometerSubPage': 'currentodometersubpage',
+    'DPF Regeneration Time': 'dpf_regeneration_time',
+    'DPFRegenerationStatisticsSubPage': 'dpfregenerationstatisticssubpage',
+    'Daily Distance Travelled': 'daily_distance_travelled',
+    'Daily Fuel Consumption': 'daily_fuel_consumption',
+    'DailySubPage': 'dailysubpage',
+    'Data Entry Range Type': 'data_entry_range_type',
+    'Data Hub Device MID': 'data_hub_device_mid',
+    'DataEntryRangeTypeSubPage': 'dataentryrangetypesubpage',
+    'DataHubDeviceMIDSubPage': 'datahubdevicemidsubpage',
+    'Day Intensity': 'day_intensity',
+    'Drive Average Load Factor': 'drive_average_load_factor',
+    'Drive Distance': 'drive_distance',
+    'Drive Engine Load Accumulation': 'drive_engine_load_accumulation',
+    'Drive Fuel': 'drive_fuel',
+    'Drive Time': 'drive_time',
+    'Drive Time Breakdown': 'drive_time_breakdown',
+    'DriveAverageLoadFactorSubPage': 'driveaverageloadfactorsubpage',
+    'DriveLoadAccumulationSubPage': 'driveloadaccumulationsubpage',
+    'DriveSubPage': 'drivesubpage',
+    'Driver Card Enable': 'driver_card_enable',
+    'Driver Identifier': 'driver_identifier',
+    'Driver Incident Count': 'driver_incident_count',
+    'DriverCardEnableSubPage': 'drivercardenablesubpage',
+    'DriverIDSubPage': 'driveridsubpage',
+    'Driving DPF Fuel Volume': 'driving_dpf_fuel_volume',
+    'Driving DPF Regen Attempts Count': 'driving_dpf_regen_attempts_count',
+    'Driving DPF Regen Complete Count': 'driving_dpf_regen_complete_count',
+    'Driving DPF regeneration attempts': 'driving_dpf_regeneration_attempts',
+    'Driving DPF regeneration completions': 'driving_dpf_regeneration_completions',
+    'Duration of Last Interrupt': 'duration_of_last_interrupt',
+    'Duration of Last Timeout': 'duration_of_last_timeout',
+    'ECM Type': 'ecm_type',
+    'ECMTypeSubPage': 'ecmtypesubpage',
+    'Engine Brake Time': 'engine_brake_time',
+    'Engine Hours': 'engine_hours',
+    'Engine Hours of Last Interrupt': 'engine_hours_of_last_interrupt',
+    'Engine Hours of Last Timeout': 'engine_hours_of_last_timeout',
+    'Engine Load': 'engine_load',
+    'Engine Revolutions': 'engine_revolutions',
+    'Engine Serial Number': 'engine_serial_number',
+    'Engine Speed': 'engine_speed',
+    'Engine Temp. Time': 'engine_temp_time',
+    'Extended Idle Time': 'extended_idle_time',
+    'Extraction Time Odometer': 'extraction_time_odometer',
+    'Extraction Time Time Stamp': 'extraction_time_time_stamp',
+    'Fan Time (AC)': 'fan_time_ac',
+    'Fan Time (DPF)': 'fan_time_dpf',
+    'Fan Time (Engine)': 'fan_time_engine',
+    'Fan Time (Manual)': 'fan_time_manual',
+    'FanTimeSubPage': 'fantimesubpage',
+    'Firm Brake Count': 'firm_brake_count',
+    'Firm Brake Counts for Speed Bands': 'firm_brake_counts_for_speed_bands',
+    'Firm Brake Deceleration Limit': 'firm_brake_deceleration_limit',
+    'FirmBrakeDecelerationLimitSubPage': 'firmbrakedecelerationlimitsubpage',
+    'Fleet Idle Goal Percentage': 'fleet_idle_goal_percentage',
+    'FleetIdleGoalPercentageSubPage': 'fleetidlegoalpercentagesubpage',
+    'Fuel Economy Goal': 'fuel_economy_goal',
+    'FuelEconomyGoalSubPage': 'fueleconomygoalsubpage',
+    'Hard Brake Count': 'hard_brake_count',
+    'Hard Brake Count 2': 'hard_brake_count_2',
+    'Hard Brake Counts for Speed Bands': 'hard_brake_counts_for_speed_bands',
+    'Hard Brake Deceleration Limit': 'hard_brake_deceleration_limit',
+    'HardBrakeCountSubPage': 'hardbrakecountsubpage',
+    'HardBrakeCountsSubPage': 'hardbrakecountssubpage',
+    'HardBrakeDecelLimitSubPage': 'hardbrakedecellimitsubpage',
+    'HardBrakePage': 'hardbrakepage',
+    'HeaderConfigurationChecksumSubPage': 'headerconfigurationchecksumsubpage',
+    'HeaderDriverIDSubPage': 'headerdriveridsubpage',
+    'HeaderEngineHoursSubPage': 'headerenginehourssubpage',
+    'HeaderEngineSerialNumberSubPage': 'headerengineserialnumbersubpage',
+    'HeaderExtractionOdometerSubPage': 'headerextractionodometersubpage',
+    'HeaderExtractionTimeStampSubPage': 'headerextractiontimestampsubpage',
+    'HeaderMBESerialNumberSubPage': 'headermbeserialnumbersubpage',
+    'HeaderSoftwareVersionSubPage': 'headersoftwareversionsubpage',
+    'HeaderStatusInformationSubPage': 'headerstatusinformationsubpage',
+    'HeaderVehicleIDSubPage': 'headervehicleidsubpage',
+    'Idle Algorithm': 'idle_algorithm',
+    'Idle Fuel': 'idle_fuel',
+    'Idle Time': 'idle_time',
+    'Idle Time Breakdown': 'idle_time_breakdown',
+    'Idle Time Limit (Stop)': 'idle_time_limit_stop',
+    'IdleAlgorithmSubPage': 'idlealgorithmsubpage',
+    'IdleSubPage': 'idlesubpage',
+    'IdleTimeLimitStopSubPage': 'idletimelimitstopsubpage',
+    'Incident Odometer': 'incident_odometer',
+    'Index for Future Driver Incident in Queue': 'index_for_future_driver_incident_in_queue',
+    'Index for Future Hard Brake in Queue': 'index_for_future_hard_brake_in_queue',
+    'IntensitySubPage': 'intensitysubpage',
+    'InterruptSubPage': 'interruptsubpage',
+    'Jake Brake Time': 'jake_brake_time',
+    'JakeBrakeTimeSubPage': 'jakebraketimesubpage',
+    'Language': 'language',
+    'LanguageSubPage': 'languagesubpage',
+    'Last Driving DPF Regen Time Stamp': 'last_driving_dpf_regen_time_stamp',
+    'Last Parked DPF Regen Time Stamp': 'last_parked_dpf_regen_time_stamp',
+    'Last Stop Incident Enable': 'last_stop_incident_enable',
+    'LastStopIncidentEnableSubPage': 'laststopincidentenablesubpage',
+    'LastStopPage': 'laststoppage',
+    'Load Band 1 Limit': 'load_band_1_limit',
+    'Load Band 2 Limit': 'load_band_2_limit',
+    'Load Band 3 Limit': 'load_band_3_limit',
+    'Load Band 4 Limit': 'load_band_4_limit',
+    'Load Band 5 Limit': 'load_band_5_limit',
+    'Load Band 6 Limit': 'load_band_6_limit',
+    'Load Band 7 Limit': 'load_band_7_limit',
+    'Load Band 8 Limit': 'load_band_8_limit',
+    'Load Band 9 Limit': 'load_band_9_limit',
+    'Load Idle Threshold': 'load_idle_threshold',
+    'LoadBandLimitsSubPage': 'loadbandlimitssubpage',
+    'LoadIdleThresholdSubPage': 'loadidlethresholdsubpage',
+    'MBE Engine Serial Number': 'mbe_engine_serial_number',
+    'MPG Adjustment': 'mpg_adjustment',
+    'MPGAdjustmentSubPage': 'mpgadjustmentsubpage',
+    'Major Version': 'major_version',
+    'Minor Version': 'minor_version',
+    'Night Intensity': 'night_intensity',
+    'Number of J1587 Timeouts': 'number_of_j1587_timeouts',
+    'Number of Power Interrupts': 'number_of_power_interrupts',
+    'Oil Pressure Maximum RPM Limit': 'oil_pressure_maximum_rpm_limit',
+    'Oil Pressure Maximum Temp Limit': 'oil_pressure_maximum_temp_limit',
+    'Oil Pressure Minimum RPM Limit': 'oil_pressure_minimum_rpm_limit',
+    'Oil Pressure Minimum Temp Limit': 'oil_pressure_minimum_temp_limit',
+    'OptimisedIdleData1SubPage': 'optimisedidledata1subpage',
+    'OptimisedIdleData2SubPage': 'optimisedidledata2subpage',
+    'Optimized Idle Active Time': 'optimized_idle_active_time',
+    'Optimized Idle Run Time': 'optimized_idle_run_time',
+    'OptimizedIdleCountsSubPage': 'optimizedidlecountssubpage',
+    'Over Rev Count': 'over_rev_count',
+    'Over Rev Enable': 'over_rev_enable',
+    'Over Rev Limit': 'over_rev_limit',
+    'Over Rev Limit A': 'over_rev_limit_a',
+    'Over Rev Time': 'over_rev_time',
+    'Over Speed A Count': 'over_speed_a_count',
+    'Over Speed A Limit': 'over_speed_a_limit',
+    'Over Speed B Count': 'over_speed_b_count',
+    'Over Speed B Limit': 'over_speed_b_limit',
+    'OverRevEnableSubPage': 'overrevenablesubpage',
+    'OverRevLimitASubPage': 'overrevlimitasubpage',
+    'OverRevTimeSubPage': 'overrevtimesubpage',
+    'OverSpeedATimeSubPage': 'overspeedatimesubpage',
+    'OverSpeedBTimeSubPage': 'overspeedbtimesubpage',
+    'OverSpeedLimitSubPage': 'overspeedlimitsubpage',
+    'Overspeed A Enable': 'overspeed_a_enable',
+    'Overspeed A Time': 'overspeed_a_time',
+    'Overspeed B Enable': 'overspeed_b_enable',
+    'Overspeed B Time': 'overspeed_b_time',
+    'OverspeedAEnableSubPage': 'overspeedaenablesubpage',
+    'OverspeedBEnableSubPage': 'overspeedbenablesubpage',
+    'PTO Idle Load RPM Threshold': 'pto_idle_load_rpm_threshold',
+    'PTO Idle RPM Threshold': 'pto_idle_rpm_threshold',
+    'PTOIdleRPMThresholdSubPage': 'ptoidlerpmthresholdsubpage',
+    'Parked DPF Fuel Volume': 'parked_dpf_fuel_volume',
+    'Parked DPF Regen Attempts Count': 'parked_dpf_regen_attempts_count',
+    'Parked DPF Regen Complete Count': 'parked_dpf_regen_complete_count',
+    'Parked DPF regeneration attempts': 'parked_dpf_regeneration_attempts',
+    'Parked DPF regeneration completions': 'parked_dpf_regeneration_completions',
+    'Parked Time': 'parked_time',
+    'Password': 'password',
+    'PasswordSubPage': 'passwordsubpage',
+    'Peak Engine RPM': 'peak_engine_rpm',
+    'Peak Engine RPM Time Stamp': 'peak_engine_rpm_time_stamp',
+    'Peak Engine Speed': 'peak_engine_speed',
+    'Peak Road Speed': 'peak_road_speed',
+    'Peak Road Speed Time Stamp': 'peak_road_speed_time_stamp',
+    'PeakSubPage': 'peaksubpage',
+    'PeakTimeStampSubPage': 'peaktimestampsubpage',
+    'PermanentDPFRegenStatisticsSubPage': 'permanentdpfregenstatisticssubpage',
+    'PermanentDataSubPage': 'permanentdatasubpage',
+    'PermanentDriveAverageLoadFactorSubPage': 'permanentdriveaverageloadfactorsubpage',
+    'PermanentEngineBrakeTimeSubPage': 'permanentenginebraketimesubpage',
+    'PermanentEngineRevolutionsSubPage': 'permanentenginerevolutionssubpage',
+    'PermanentFanTimeSubPage': 'permanentfantimesubpage',
+    'PermanentOptimizedIdleCountsSubPage': 'permanentoptimizedidlecountssubpage',
+    'PermanentOptimizedIdleSubPage': 'permanentoptimizedidlesubpage',
+    'PermanentPeakSubPage': 'permanentpeaksubpage',
+    'PermanentTotalCruiseTimeSubPage': 'permanenttotalcruisetimesubpage',
+    'PermanentTotalIdleSubPage': 'permanenttotalidlesubpage',
+    'PermanentTotalPredictiveCruiseTimeSubPage': 'permanenttotalpredictivecruisetimesubpage',
+    'PermanentTotalVSGSubPage': 'permanenttotalvsgsubpage',
+    'Predictive Cruise Distance': 'predictive_cruise_distance',
+    'Predictive Cruise Fuel': 'predictive_cruise_fuel',
+    'Predictive Cruise Time': 'predictive_cruise_time',
+    'PredictiveCruiseSubPage': 'predictivecruisesubpage',
+    'Prompted Driver ID': 'prompted_driver_id',
+    'PromptedDriverIDSubPage': 'prompteddriveridsubpage',
+    'Pump Distance': 'pump_distance',
+    'Pump Fuel': 'pump_fuel',
+    'Pump Time': 'pump_time',
+    'PumpSubPage': 'pumpsubpage',
+    'RPM Band 1 Limit': 'rpm_band_1_limit',
+    'RPM Band 2 Limit': 'rpm_band_2_limit',
+    'RPM Band 3 Limit': 'rpm_band_3_limit',
+    'RPM Band 4 Limit': 'rpm_band_4_limit',
+    'RPM Band 5 Limit': 'rpm_band_5_limit',
+    'RPM Band 6 Limit': 'rpm_band_6_limit',
+    'RPM Band 7 Limit': 'rpm_band_7_limit',
+    'RPM Band 8 Limit': 'rpm_band_8_limit',
+    'RPM Idle Threshold': 'rpm_idle_threshold',
+    'RPMBandLimitsSubPage': 'rpmbandlimitssubpage',
+    'RPMIdleThresholdSubPage': 'rpmidlethresholdsubpage',
+    'RSG Distance': 'rsg_distance',
+    'RSG Fuel': 'rsg_fuel',
+    'RSG Time': 'rsg_time',
+    'RSGSubPage': 'rsgsubpage',
+    'Road Speed': 'road_speed',
+    'Run Time': 'run_time',
+    'Service Alert Percentage': 'service_alert_percentage',
+    'Service Due Flag': 'service_due_flag',
+    'ServiceAlertPercentageSubPage': 'servicealertpercentagesubpage',
+    'ServiceDueFlagSubPage': 'servicedueflagsubpage',
+    'Software Version': 'software_version',
+    'SoftwareVersionSubPage': 'softwareversionsubpage',
+    'Speed Band 1 Limit': 'speed_band_1_limit',
+    'SpeedBand 2 Limit': 'speedband_2_limit',
+    'SpeedBand 3 Limit': 'speedband_3_limit',
+    'SpeedBand 4 Limit': 'speedband_4_limit',
+    'SpeedBand 5 Limit': 'speedband_5_limit',
+    'SpeedBand 6 Limit': 'speedband_6_limit',
+    'SpeedBand 7 Limit': 'speedband_7_limit',
+    'SpeedBand A Limit': 'speedband_a_limit',
+    'SpeedBand B Limit': 'speedband_b_limit',
+    'SpeedBandLimitsSubPage': 'speedbandlimitssubpage',
+    'Start Optimized Idle Fuel Value': 'start_optimized_idle_fuel_value',
+    'Start of Day Odometer': 'start_of_day_odometer',
+    'Start of Day Time Stamp': 'start_of_day_time_stamp',
+    'Status Information': 'status_information',
+    'Stop Idle Fuel': 'stop_idle_fuel',
+    'Stop Idle Time': 'stop_idle_time',
+    'StopIdleSubPage': 'stopidlesubpage',
+    'SubPage': 'subpage',
+    'Thermostat Time': 'thermostat_time',
+    'Throttle': 'throttle',
+    'Time in Automatic Engine Over Rev Bands': 'time_in_automatic_engine_over_rev_bands',
+    'Time in Automatic Over Speed Bands': 'time_in_automatic_over_speed_bands',
+    'Time in Load Bands when in Over Rev': 'time_in_load_bands_when_in_over_rev',
+    'Time in Load Bands when in RPM Band 1': 'time_in_load_bands_when_in_rpm_band_1',
+    'Time in Load Bands when in RPM Band 2': 'time_in_load_bands_when_in_rpm_band_2',
+    'Time in Load Bands when in RPM Band 3': 'time_in_load_bands_when_in_rpm_band_3',
+    'Time in Load Bands when in RPM Band 4': 'time_in_load_bands_when_in_rpm_band_4',
+    'Time in Load Bands when in RPM Band 5': 'time_in_load_bands_when_in_rpm_band_5',
+    'Time in Load Bands when in RPM Band 6': 'time_in_load_bands_when_in_rpm_band_6',
+    'Time in Load Bands when in RPM Band 7': 'time_in_load_bands_when_in_rpm_band_7',
+    'Time in Load Bands when in RPM Band 8': 'time_in_load_bands_when_in_rpm_band_8',
+    'Time in Load Bands when in RPM Band 9': 'time_in_load_bands_when_in_rpm_band_9',
+    'Time in Speed Bands when in Over Rev': 'time_in_speed_bands_when_in_over_rev',
+    'Time in Speed Bands when in RPM Band 1': 'time_in_speed_bands_when_in_rpm_band_1',
+    'Time in Speed Bands when in RPM Band 2': 'time_in_speed_bands_when_in_rpm_band_2',
+    'Time in Speed Bands when in RPM Band 3': 'time_in_speed_bands_when_in_rpm_band_3',
+    'Time in Speed Bands when in RPM Band 4': 'time_in_speed_bands_when_in_rpm_band_4',
+    'Time in Speed Bands when in RPM Band 5': 'time_in_speed_bands_when_in_rpm_band_5',
+    'Time in Speed Bands when in RPM Band 6': 'time_in_speed_bands_when_in_rpm_band_6',
+    'Time in Speed Bands when in RPM Band 7': 'time_in_speed_bands_when_in_rpm_band_7',
+    'Time in Speed Bands when in RPM Band 8': 'time_in_speed_bands_when_in_rpm_band_8',
+    'Time in Speed Bands when in RPM Band 9': 'time_in_speed_bands_when_in_rpm_band_9',
+    'TimeInAutomaticEngineOverRevBandsSubPage': 'timeinautomaticengineoverrevbandssubpage',
+    'TimeInAutomaticOverSpeedBandsSubPage': 'timeinautomaticoverspeedbandssubpage',
+    'TimeInEngineLoadEngineRPMBandsSubPage': 'timeinengineloadenginerpmbandssubpage',
+    'TimeInRoadSpeedEngineRPMBandsSubPage': 'timeinroadspeedenginerpmbandssubpage',
+    'TimeZoneSubPage': 'timezonesubpage',
+    'TimeoutSubPage': 'timeoutsubpage',
+    'Timestamp': 'timestamp',
+    'Timezone': 'timezone',
+    'Top Gear 1 Distance': 'top_gear_1_distance',
+    'Top Gear 1 Fuel': 'top_gear_1_fuel',
+    'Top Gear 1 Ratio': 'top_gear_1_ratio',
+    'Top Gear 1 Time': 'top_gear_1_time',
+    'Top Gear 1 Time Stamp': 'top_gear_1_time_stamp',
+    'Top Gear Cruise Distance': 'top_gear_cruise_distance',
+    'Top Gear Cruise Fuel': 'top_gear_cruise_fuel',
+    'Top Gear Cruise Time': 'top_gear_cruise_time',
+    'Top Gear Distance': 'top_gear_distance',
+    'Top Gear Fuel': 'top_gear_fuel',
+    'Top Gear Ratio': 'top_gear_ratio',
+    'Top Gear Time': 'top_gear_time',
+    'Top Gear Time Stamp': 'top_gear_time_stamp',
+    'TopGear1DistanceSubPage': 'topgear1distancesubpage',
+    'TopGear1RatioSubPage': 'topgear1ratiosubpage',
+    'TopGear1RatioSubPage2': 'topgear1ratiosubpage2',
+    'TopGearCruiseSubPage': 'topgearcruisesubpage',
+    'TopGearRatioSubPage': 'topgearratiosubpage',
+    'TopGearSubPage': 'topgearsubpage',
+    'TopGearTimeStampSubPage': 'topgeartimestampsubpage',
+    'Total Armed Time': 'total_armed_time',
+    'Total Battery Starts - Alternative': 'total_battery_starts_alternative',
+    'Total Battery Starts - Continuous Run': 'total_battery_starts_continuous_run',
+    'Total Battery Starts - Normal': 'total_battery_starts_normal',
+    'Total Cruise Time': 'total_cruise_time',
+    'Total Distance': 'total_distance',
+    'Total Fuel': 'total_fuel',
+    'Total Idle Fuel': 'total_idle_fuel',
+    'Total Idle Fuel Saved': 'total_idle_fuel_saved',
+    'Total Idle Time': 'total_idle_time',
+    'Total Predictive Cruise (PCC) Time': 'total_predictive_cruise_pcc_time',
+    'Total Run Time': 'total_run_time',
+    'Total Time': 'total_time',
+    'Total VSG Fuel': 'total_vsg_fuel',
+    'Total VSG Time': 'total_vsg_time',
+    'Trend Sample Interval': 'trend_sample_interval',
+    'TrendConfigurationSubPage': 'trendconfigurationsubpage',
+    'TrendSampleIntervalSubPage': 'trendsampleintervalsubpage',
+    'Trip Armed Time': 'trip_armed_time',
+    'Trip Distance': 'trip_distance',
+    'Trip Fuel': 'trip_fuel',
+    'Trip Idle Fuel Saved': 'trip_idle_fuel_saved',
+    'Trip Idle Time Saved': 'trip_idle_time_saved',
+    'Trip Reset Lock Out': 'trip_reset_lock_out',
+    'Trip Run Time': 'trip_run_time',
+    'Trip Start Odometer': 'trip_start_odometer',
+    'Trip Start Time Stamp': 'trip_start_time_stamp',
+    'Trip Time': 'trip_time',
+    'TripResetLockOutSubPage': 'tripresetlockoutsubpage',
+    'TripStartSubPage': 'tripstartsubpage',
+    'TripSubPage': 'tripsubpage',
+    'Units': 'units',
+    'UnitsSubPage': 'unitssubpage',
+    'VSG (PTO) Fuel': 'vsg_pto_fuel',
+    'VSG (PTO) Idle Fuel': 'vsg_pto_idle_fuel',
+    'VSG (PTO) Idle Time': 'vsg_pto_idle_time',
+    'VSG (PTO) Time': 'vsg_pto_time',
+    'VSGPTOSubPage': 'vsgptosubpage',
+    'Valid Sample Count': 'valid_sample_count',
+    'Vehicle ID': 'vehicle_id',
+    'Vehicle Identifier': 'vehicle_identifier',
+    'VehicleIDSubPage': 'vehicleidsubpage',
+}
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+import argparse
+import base64
+import json
+import os
+import random
+import string
+import sys
+import time
+from collections import OrderedDict
+
+import data_defs
+
+HEADER = 10
+HEADER_BITMASK = b'\x1f\x03'
+
+# The sections of one extraction as a depot pull has them, each a message of
+# a Header page followed by one data page: (section name, request code,
+# bitmask, instances)
+EXTRACTION = (
+    ('Daily Engine Usage',16,b'\x03',30),
+    ('Configuration Data',6,b'\xec\xc3\xe0\x6d\x17\x38',1),
+    ('Diagnostic Records',15,b'\x07',3),
+    ('Life to Date',20,b'\xff\x1f',1),
+    ('Trip Tables',12,b'\x3f',1),
+    ('Last Stop Data',4,b'\x5f',1),
+    ('Monthly Activity',14,b'\xff\x07\x7d\xff\x0f',3),
+    ('Hard Brake Data',2,b'\x7b',2),
+    ('Trip Data',1,b'\xff\x07\x7d\xff\x0f',1),
+    )
+
+ID_CHARACTERS = string.ascii_uppercase + string.digits
+
+# Seconds between the timestamps of a slug held more than once, i.e. the
+# start and the moment of an incident
+TIMESTAMP_STEP = 60
+
+DAY = 24 * 60 * 60
+
+
+# Bitmask selecting every subpage of page_class, or every other one
+def bitmask_for(page_class,sparse=False):
+    num_subpages = len(page_class.subpages)
+    mask = bytearray((num_subpages + 7) // 8)
+    for i in range(num_subpages):
+        if not sparse or i % 2 == 0:
+            mask[i // 8] |= 1 << (i % 8)
+    return bytes(mask)
+
+# random.Random's randint and choice differ between Python 2 and 3, while
+# getrandbits doesn't, so this is what draws everything that isn't plain bits
+def below(rng,n):
+    bits = n.bit_length()
+    while True:
+        value = rng.getrandbits(bits)
+        if value < n:
+            return value
+
+def random_id(rng,length):
+    return ''.join(ID_CHARACTERS[below(rng,len(ID_CHARACTERS))] for i in range(length))
+
+def is_timestamp(slug_name):
+    return slug_name.endswith('time_stamp') or slug_name.endswith('timestamp')
+
+
+# Randomized but well formed extractions from a made up fleet, for load and
+# soak testing without customer data. Numbers are random over their field's
+# full range; timestamps fall in the days before each extraction, which
+# steps forward in time per engine; strings are printable. Everything comes
+# from one seeded random.Random, so a seed always gives the same corpus, on
+# either Python.
+class Generator(object):
+    def __init__(self,seed=0,num_engines=100,start_time=1500000000,days_between=7,sections=EXTRACTION):
+        self.rng = random.Random(seed)
+        self.days_between = days_between
+        self.sections = sections
+        self.serials = ['%07d' % below(self.rng,10000000) for i in range(num_engines)]
+        self.times = dict((serial,start_time + below(self.rng,days_between * DAY)) for serial in self.serials)
+        self.makers = {}
+
+    # (kind, argument) per raw value of the layout, in struct order: string
+    # length, number of bits, or whether a timestamp is one of a series
+    def value_makers(self,layout):
+        makers = self.makers.get(layout)
+        if makers is None:
+            makers = []
+            for slug_name,fields in layout.fields_by_slug.items():
+                for field in fields:
+                    slug_name,name,units,scale,is_string,value_index,count,byte_index,size,param_format = field
+                    if is_string:
+                        kind = ('string',size)
+                    elif is_timestamp(slug_name):
+                        kind = ('timestamp',len(fields) > 1)
+                    else:
+                        kind = ('number',size * 8 // count)
+                    makers.extend((value_index + i,kind) for i in range(count))
+            makers.sort()
+            self.makers[layout] = makers = [kind for value_index,kind in makers]
+        return makers
+
+    def instance(self,layout,extraction_time):
+        rng = self.rng
+        raw = []
+        when = extraction_time - below(rng,self.days_between * DAY)
+        for kind,arg in self.value_makers(layout):
+            if kind == 'number':
+                raw.append(rng.getrandbits(arg))
+            elif kind == 'string':
+                raw.append(random_id(rng,arg).encode('ascii'))
+            elif arg:
+                raw.append(when)
+                when += TIMESTAMP_STEP
+            else:
+                raw.append(extraction_time - below(rng,self.days_between * DAY))
+        return layout.struct.pack(*raw)
+
+    def header(self,serial,extraction_time):
+        rng = self.rng
+        layout = data_defs.get_layout(HEADER,HEADER_BITMASK)
+        values = {
+            'current_engine_hours':below(rng,50000),
+            'current_driver_id':random_id(rng,8),
+            'vehicle_id':random_id(rng,6),
+            'extraction_time_odometer':below(rng,2000000),
+            'extraction_time_time_stamp':extraction_time,
+            'mbe_engine_serial_number':serial,
+            'major_version':1 + below(rng,9),
+            'minor_version':below(rng,100),
+            }
+        return layout.pack((slug_name,value) for slug_name,value in values.items() if slug_name in layout.fields_by_slug)
+
+    # One extraction of the next engine, or of serial: [(section name, message)]
+    def extraction(self,serial=None):
+        if serial is None:
+            serial = self.serials[below(self.rng,len(self.serials))]
+        extraction_time = self.times[serial]
+        self.times[serial] += 1 + below(self.rng,self.days_between * DAY)
+        header = data_defs.encode_page(HEADER,HEADER_BITMASK,[self.header(serial,extraction_time)])
+        messages = []
+        for name,page_type,bitmask,instances in self.sections:
+            layout = data_defs.get_layout(page_type,bitmask)
+            page = data_defs.encode_page(page_type,bitmask,
+                                         [self.instance(layout,extraction_time) for i in range(instances)])
+            messages.append((name,data_defs.encode_message([header,page])))
+        return messages
+
+    def iter_messages(self,count):
+        while count > 0:
+            for name,message in self.extraction()[:count]:
+                yield message
+                count -= 1
+
+
+# count extractions back to back in one raw archive
+def write_raw(path,generator,count):
+    with open(path,'wb') as f:
+        for i in range(count):
+            for name,message in generator.extraction():
+                f.write(message)
+
+# count extractions as base64 JSON dumps in directory, one file each
+def write_dumps(directory,generator,count):
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+    for i in range(count):
+        serial = generator.serials[below(generator.rng,len(generator.serials))]
+        path = os.path.join(directory,'ddec%s-%d.json' % (serial,generator.times[serial]))
+        dump = OrderedDict((name,base64.b64encode(message).decode('ascii'))
+                           for name,message in generator.extraction(serial))
+        with open(path,'w') as f:
+            f.write(json.dumps(dump))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write synthetic DDEC extractions for load and soak testing.")
+    parser.add_argument('output',help="a .bin archive, or a directory to fill with JSON dumps")
+    parser.add_argument('-n','--extractions',type=int,default=1000,help="extractions to write")
+    parser.add_argument('--engines',type=int,default=100,help="engines in the made up fleet")
+    parser.add_argument('--seed',type=int,default=0)
+    args = parser.parse_args(argv)
+
+    generator = Generator(args.seed,args.engines)
+    start = time.time()
+    if args.output.endswith('.bin'):
+        write_raw(args.output,generator,args.extractions)
+    else:
+        write_dumps(args.output,generator,args.extractions)
+    elapsed = time.time() - start
+    num_messages = args.extractions * len(generator.sections)
+    print("%d extractions (%d messages) in %.3fs -> %s" % (args.extractions,num_messages,elapsed,args.output))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())